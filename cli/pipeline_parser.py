@@ -2,7 +2,25 @@
 
 import argparse
 
-from hw6_classifier.config import DEFAULT_RANDOM_SEED, DEFAULT_TEST_SIZE, DEFAULT_CV_FOLDS
+from hw6_classifier.config import (
+    DEFAULT_RANDOM_SEED,
+    DEFAULT_TEST_SIZE,
+    DEFAULT_CV_FOLDS,
+    EXPERIENCE_PREFIX_CHARS,
+    NEAR_DUPLICATE_THRESHOLD,
+    TARGET_CLASSES,
+    TEXT_HASH_BITS,
+)
+
+
+def class_cap(value: str) -> tuple[str, int]:
+    """Разбирает ограничение класса вида 'senior=5000'."""
+    class_name, _, cap = value.partition("=")
+    if class_name not in TARGET_CLASSES or not cap.isdigit():
+        raise argparse.ArgumentTypeError(
+            f"Ожидается КЛАСС=ЧИСЛО, КЛАСС из {', '.join(TARGET_CLASSES)}: {value}"
+        )
+    return class_name, int(cap)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -12,12 +30,107 @@ def create_parser() -> argparse.ArgumentParser:
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
 
-    parser.add_argument("--csv", type=str, required=True, help="Путь к CSV-файлу с резюме")
+    parser.add_argument(
+        "--csv", type=str, required=True,
+        help="Путь к CSV-файлу с резюме, директории с шардами или glob-шаблону (в кавычках)",
+    )
     parser.add_argument("--models", type=str, nargs="+", default=["logistic", "random_forest"], help="Список моделей")
     parser.add_argument("--test-size", type=float, default=DEFAULT_TEST_SIZE, help="Доля тестовой выборки")
     parser.add_argument("--random-seed", type=int, default=DEFAULT_RANDOM_SEED, help="Зерно случайных чисел")
     parser.add_argument("--tune", action="store_true", help="Включить подбор гиперпараметров")
     parser.add_argument("--cv-folds", type=int, default=DEFAULT_CV_FOLDS, help="Количество фолдов CV")
+    parser.add_argument(
+        "--search", choices=["grid", "halving", "bayes"], default="grid",
+        help="Стратегия подбора: полный перебор сеток, последовательное деление пополам "
+        "или модельный подбор (TPE) в непрерывных пространствах PARAM_SPACES",
+    )
+    parser.add_argument(
+        "--halving-factor", type=int, default=3,
+        help="Во сколько раз сокращается число кандидатов и растёт число строк в каждом раунде",
+    )
+    parser.add_argument(
+        "--n-trials", type=int, default=30,
+        help="Количество попыток модельного подбора (--search bayes) для каждой модели",
+    )
+    parser.add_argument(
+        "--train-workers", type=int, default=1,
+        help="Количество процессов для параллельного обучения независимых моделей",
+    )
+    parser.add_argument(
+        "--n-jobs", type=int, default=-1,
+        help="Общий бюджет ядер (-1 — все): делится между процессами подбора/обучения "
+        "и потоками внутри них",
+    )
+    parser.add_argument(
+        "--blas-threads", type=int, default=None,
+        help="Потолок потоков BLAS/OpenMP в одном процессе (по умолчанию — доля бюджета процесса)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None,
+        help="Размер чанка CSV для потоковой обработки (по умолчанию файл читается целиком)",
+    )
+    parser.add_argument(
+        "--prefilter", action="store_true",
+        help="Предварительно отбирать IT-разработчиков по колонке должности до загрузки текстов",
+    )
+    parser.add_argument(
+        "--feature-workers", type=int, default=1,
+        help="Количество процессов для извлечения признаков (при нескольких шардах — по шарду на процесс)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Не использовать кэш обработанных признаков")
+    parser.add_argument(
+        "--rebuild-cache", action="store_true", help="Пересчитать признаки и перезаписать кэш",
+    )
+    parser.add_argument(
+        "--parse-memo", action="store_true",
+        help="Сохранять результаты парсинга уникальных значений между запусками",
+    )
+    parser.add_argument(
+        "--feature-store", type=str, default=None,
+        help="Директория инкрементального хранилища признаков: обрабатываются только новые строки",
+    )
+    parser.add_argument(
+        "--rebuild-feature-store", action="store_true",
+        help="Удалить накопленные сегменты хранилища признаков и начать его заново",
+    )
+
+    parser.add_argument(
+        "--experience-prefix", type=int, nargs="?", const=EXPERIENCE_PREFIX_CHARS, default=None,
+        help="Разбирать только префикс колонки опыта заданной длины (в символах)",
+    )
+    parser.add_argument(
+        "--experience-prefix-on-read", action="store_true",
+        help="Оставлять только префикс колонки опыта уже при чтении CSV",
+    )
+    parser.add_argument(
+        "--validate-experience-prefix", action="store_true",
+        help="Сравнить разбор префикса опыта с полным текстом и сохранить отчёт в metrics/",
+    )
+
+    parser.add_argument(
+        "--dedup", action="store_true",
+        help="Удалять близкие дубликаты резюме (MinHash LSH по должности и опыту) перед извлечением признаков",
+    )
+    parser.add_argument(
+        "--dedup-threshold", type=float, default=NEAR_DUPLICATE_THRESHOLD,
+        help="Порог сходства для удаления близких дубликатов",
+    )
+
+    parser.add_argument(
+        "--max-train-rows", type=int, default=None,
+        help="Оставить стратифицированную выборку из не более чем N образцов (один проход, "
+        "ограниченная память)",
+    )
+    parser.add_argument(
+        "--class-caps", type=class_cap, nargs="+", default=None, metavar="КЛАСС=N",
+        help="Ограничения числа образцов выборки по классам, например senior=5000",
+    )
+
+    parser.add_argument(
+        "--text-features", type=int, nargs="?", const=TEXT_HASH_BITS, default=None, metavar="BITS",
+        help="Добавить хэшированные n-граммы текста должности и опыта (2^BITS колонок) "
+        "для моделей с разреженным входом",
+    )
 
     return parser
 
@@ -1,9 +1,16 @@
-﻿from .visualizer import plot_class_distribution, analyze_class_balance
+﻿from .visualizer import (
+    plot_class_distribution,
+    plot_class_counts,
+    analyze_class_balance,
+    analyze_class_counts,
+)
 from .evaluator import evaluate_classifier, generate_conclusion, ClassificationMetrics
 
 __all__ = [
     "plot_class_distribution",
+    "plot_class_counts",
     "analyze_class_balance",
+    "analyze_class_counts",
     "evaluate_classifier",
     "generate_conclusion",
     "ClassificationMetrics",
@@ -6,7 +6,7 @@
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 import numpy as np
 import matplotlib.pyplot as plt
 from collections import Counter
@@ -29,6 +29,25 @@ def plot_class_distribution(
     """
     class_counts = Counter(y)
     counts = [class_counts[i] for i in range(len(class_names))]
+    plot_class_counts(counts, class_names, save_path=save_path, title=title)
+
+
+def plot_class_counts(
+    counts: Sequence[int],
+    class_names: list[str],
+    save_path: Optional[Path] = None,
+    title: str = "Распределение классов уровня специалиста",
+) -> None:
+    """
+    Создает столбчатую диаграмму распределения классов по готовым счётчикам.
+
+    Аргументы:
+        counts: Количество образцов каждого класса.
+        class_names: Список названий классов.
+        save_path: Путь для сохранения графика. Если None, график не сохраняется.
+        title: Заголовок графика.
+    """
+    counts = [int(count) for count in counts]
     percentages = [count / sum(counts) * 100 for count in counts]
 
     plt.style.use("seaborn-v0_8-darkgrid")
@@ -90,6 +109,21 @@ def analyze_class_balance(y: np.ndarray, class_names: list[str]) -> dict[str, an
     """
     class_counts = Counter(y)
     counts = [class_counts[i] for i in range(len(class_names))]
+    return analyze_class_counts(counts, class_names)
+
+
+def analyze_class_counts(counts: Sequence[int], class_names: list[str]) -> dict[str, any]:
+    """
+    Анализирует баланс классов по готовым счётчикам.
+
+    Аргументы:
+        counts: Количество образцов каждого класса.
+        class_names: Список названий классов.
+
+    Вернет:
+        Словарь с результатами анализа, как analyze_class_balance.
+    """
+    counts = [int(count) for count in counts]
     total = sum(counts)
     percentages = [count / total * 100 for count in counts]
 
@@ -16,8 +16,13 @@ from .constants import (
     SENIORITY_KEYWORDS,
     JUNIOR_MAX_EXPERIENCE_MONTHS,
     MIDDLE_MAX_EXPERIENCE_MONTHS,
+    EXPERIENCE_PREFIX_CHARS,
+    NEAR_DUPLICATE_THRESHOLD,
+    TEXT_HASH_BITS,
     TECH_STACK,
     MAJOR_CITIES,
+    MOSCOW_CITY_NAMES,
+    SPB_CITY_NAMES,
     EDUCATION_LEVELS,
     TARGET_CLASSES,
     FEATURE_NAMES,
@@ -42,8 +47,13 @@ __all__ = [
     "SENIORITY_KEYWORDS",
     "JUNIOR_MAX_EXPERIENCE_MONTHS",
     "MIDDLE_MAX_EXPERIENCE_MONTHS",
+    "EXPERIENCE_PREFIX_CHARS",
+    "NEAR_DUPLICATE_THRESHOLD",
+    "TEXT_HASH_BITS",
     "TECH_STACK",
     "MAJOR_CITIES",
+    "MOSCOW_CITY_NAMES",
+    "SPB_CITY_NAMES",
     "EDUCATION_LEVELS",
     "TARGET_CLASSES",
     "FEATURE_NAMES",
@@ -83,6 +83,16 @@ SENIORITY_KEYWORDS: Final[dict[str, frozenset[str]]] = {
 JUNIOR_MAX_EXPERIENCE_MONTHS: Final[int] = 24  # До 2 лет
 MIDDLE_MAX_EXPERIENCE_MONTHS: Final[int] = 60  # До 5 лет
 
+# Длина префикса колонки опыта в ограниченном режиме разбора
+# (итоговый стаж указывается в начале: "Опыт работы 5 лет 3 месяца ...")
+EXPERIENCE_PREFIX_CHARS: Final[int] = 100
+
+# Порог оценки сходства (Жаккара по MinHash) для удаления близких дубликатов резюме
+NEAR_DUPLICATE_THRESHOLD: Final[float] = 0.9
+
+# Ширина блока хэшированных текстовых признаков: 2 ** TEXT_HASH_BITS колонок
+TEXT_HASH_BITS: Final[int] = 18
+
 # Технологии для извлечения признаков
 TECH_STACK: Final[frozenset[str]] = frozenset(
     [
@@ -148,6 +158,10 @@ MAJOR_CITIES: Final[frozenset[str]] = frozenset(
     ]
 )
 
+# Названия городов для признаков city_moscow и city_spb
+MOSCOW_CITY_NAMES: Final[tuple[str, ...]] = ("москва", "moscow")
+SPB_CITY_NAMES: Final[tuple[str, ...]] = ("санкт-петербург", "петербург", "saint petersburg")
+
 # Уровни образования (порядковая шкала)
 EDUCATION_LEVELS: Final[dict[str, int]] = {
     "среднее": 0,
@@ -20,14 +20,22 @@ class AbstractClassifier(ABC):
     конкретного sklearn-эстиматора.
 
     Атрибуты:
+        supports_sparse: Принимает ли эстиматор разреженные матрицы scipy.
         random_seed: Зерно для генератора случайных чисел.
         class_weight: Стратегия балансировки классов.
+        n_jobs: Число потоков эстиматора (-1 — все ядра); используется
+            эстиматорами с внутренним параллелизмом.
         _estimator: Внутренний sklearn-эстиматор.
         _is_fitted: Флаг, указывающий, обучена ли модель.
     """
 
+    supports_sparse: bool = False
+
     def __init__(
-        self, random_seed: int = 42, class_weight: Optional[str] = "balanced"
+        self,
+        random_seed: int = 42,
+        class_weight: Optional[str] = "balanced",
+        n_jobs: int = -1,
     ) -> None:
         """
         Инициализирует классификатор с заданными параметрами.
@@ -35,9 +43,11 @@ class AbstractClassifier(ABC):
         Аргументы:
             random_seed: Зерно для генератора случайных чисел.
             class_weight: Стратегия балансировки классов.
+            n_jobs: Число потоков эстиматора (-1 — все ядра).
         """
         self.random_seed = random_seed
         self.class_weight = class_weight
+        self.n_jobs = n_jobs
         self._estimator: Optional[BaseEstimator] = None
         self._is_fitted: bool = False
 
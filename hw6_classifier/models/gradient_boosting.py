@@ -26,9 +26,10 @@ class GradientBoostingClassifierWrapper(AbstractClassifier):
         n_estimators: int = 100,
         learning_rate: float = 0.1,
         max_depth: int = 3,
+        n_jobs: int = -1,
     ) -> None:
         """Инициализирует классификатор градиентного бустинга."""
-        super().__init__(random_seed=random_seed)
+        super().__init__(random_seed=random_seed, n_jobs=n_jobs)
         self.n_estimators = n_estimators
         self.learning_rate = learning_rate
         self.max_depth = max_depth
@@ -19,15 +19,18 @@ class LogisticClassifier(AbstractClassifier):
         max_iter: Максимальное число итераций.
     """
 
+    supports_sparse = True
+
     def __init__(
         self,
         random_seed: int = 42,
         class_weight: str = "balanced",
         c_param: float = 1.0,
         max_iter: int = 1000,
+        n_jobs: int = -1,
     ) -> None:
         """Инициализирует логистический классификатор."""
-        super().__init__(random_seed=random_seed, class_weight=class_weight)
+        super().__init__(random_seed=random_seed, class_weight=class_weight, n_jobs=n_jobs)
         self.c_param = c_param
         self.max_iter = max_iter
 
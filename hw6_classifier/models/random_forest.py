@@ -29,9 +29,10 @@ class RandomForestClassifierWrapper(AbstractClassifier):
         max_depth: int | None = None,
         min_samples_split: int = 2,
         max_features: str = "sqrt",
+        n_jobs: int = -1,
     ) -> None:
         """Инициализирует классификатор случайного леса."""
-        super().__init__(random_seed=random_seed, class_weight=class_weight)
+        super().__init__(random_seed=random_seed, class_weight=class_weight, n_jobs=n_jobs)
         self.n_estimators = n_estimators
         self.max_depth = max_depth
         self.min_samples_split = min_samples_split
@@ -51,5 +52,5 @@ class RandomForestClassifierWrapper(AbstractClassifier):
             max_features=self.max_features,
             random_state=self.random_seed,
             class_weight=self.class_weight,
-            n_jobs=-1,
+            n_jobs=self.n_jobs,
         )
@@ -2,7 +2,18 @@
 
 from .processed_data import ProcessedData
 from .data_processor import ResumeDataProcessor
-from .feature_extractor import extract_features, create_target
+from .feature_cache import FeatureCache
+from .feature_store import FeatureStore
+from .near_duplicates import NearDuplicateFilter
+from .ingest_stats import IngestStatistics, QuantileSketch
+from .reservoir import StratifiedReservoir, proportional_sample
+from .text_hashing import TextHasher
+from .experience_prefix import validate_experience_prefix
+from .csv_reader import resolve_csv_paths
+from .dictionary_encoding import ParseMemo, parse_unique
+from .storage import save_processed_data, load_processed_data
+from .feature_extractor import extract_features, create_target, label_seniority_codes
+from .record_featurizer import ResumeRecord, featurize_record, featurize_records
 from .parsers import (
     parse_experience,
     parse_salary,
@@ -10,17 +21,47 @@ from .parsers import (
     parse_education,
     parse_city,
     extract_tech_skills,
+    parse_experience_column,
+    parse_salary_column,
+    parse_demographics_column,
+    parse_education_column,
+    parse_city_column,
+    extract_tech_skills_column,
 )
 
 __all__ = [
     "ProcessedData",
     "ResumeDataProcessor",
+    "FeatureCache",
+    "FeatureStore",
+    "NearDuplicateFilter",
+    "IngestStatistics",
+    "QuantileSketch",
+    "StratifiedReservoir",
+    "proportional_sample",
+    "TextHasher",
+    "validate_experience_prefix",
+    "resolve_csv_paths",
+    "ParseMemo",
+    "parse_unique",
+    "save_processed_data",
+    "load_processed_data",
     "extract_features",
     "create_target",
+    "label_seniority_codes",
+    "ResumeRecord",
+    "featurize_record",
+    "featurize_records",
     "parse_experience",
     "parse_salary",
     "parse_demographics",
     "parse_education",
     "parse_city",
     "extract_tech_skills",
+    "parse_experience_column",
+    "parse_salary_column",
+    "parse_demographics_column",
+    "parse_education_column",
+    "parse_city_column",
+    "extract_tech_skills_column",
 ]
@@ -0,0 +1,154 @@
+"""
+Потоковое чтение сжатых выгрузок (.gz, .bz2, .xz, .zst).
+
+Распаковка выполняется в отдельном потоке, который складывает блоки
+в ограниченную очередь; read_csv читает их через файловый объект.
+Модули gzip/bz2/lzma и zstandard освобождают GIL во время распаковки,
+поэтому распаковка идёт параллельно с разбором CSV и извлечением признаков,
+а распакованный файл на диск не записывается.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+from contextlib import contextmanager
+from importlib.util import find_spec
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Optional, Union
+
+BLOCK_SIZE = 1 << 20
+QUEUE_BLOCKS = 8
+
+
+def has_zstandard() -> bool:
+    """Проверяет, установлен ли zstandard."""
+    return find_spec("zstandard") is not None
+
+
+def _open_zstd(path: str) -> BinaryIO:
+    """Открывает .zst-файл на чтение распакованных данных."""
+    if not has_zstandard():
+        raise ImportError("Для чтения .zst-файлов установите пакет zstandard")
+
+    import zstandard
+
+    return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+
+
+DECOMPRESSORS: dict[str, Callable[[str], BinaryIO]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".zst": _open_zstd,
+}
+
+
+def is_compressed(path: Union[str, Path]) -> bool:
+    """Проверяет, является ли файл сжатым (по расширению)."""
+    return Path(path).suffix.lower() in DECOMPRESSORS
+
+
+class ThreadedReader(io.RawIOBase):
+    """
+    Файловый объект, данные которого читает фоновый поток.
+
+    Поток читает блоки из source и кладёт их в очередь ограниченного
+    размера, поэтому опережение чтения не превышает
+    max_blocks * block_size байт. Ошибка чтения в потоке пробрасывается
+    из read() читающей стороны.
+    """
+
+    def __init__(
+        self, source: BinaryIO, block_size: int = BLOCK_SIZE, max_blocks: int = QUEUE_BLOCKS,
+    ) -> None:
+        """
+        Запускает поток чтения.
+
+        Аргументы:
+            source: Источник данных (например, распаковывающий поток).
+            block_size: Размер блока чтения в байтах.
+            max_blocks: Максимум блоков в очереди.
+        """
+        super().__init__()
+        self._source = source
+        self._block_size = block_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_blocks)
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._block = memoryview(b"")
+        self._eof = False
+
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def readable(self) -> bool:
+        """Поток поддерживает чтение."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Копирует в buffer следующую порцию данных (0 — конец потока)."""
+        while not self._block and not self._eof:
+            block = self._queue.get()
+            if not block:
+                self._eof = True
+                if self._error is not None:
+                    raise self._error
+            self._block = memoryview(block)
+
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+    def close(self) -> None:
+        """Останавливает поток чтения и закрывает источник."""
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+        super().close()
+
+    def _produce(self) -> None:
+        """Читает блоки источника в очередь до конца данных или остановки."""
+        try:
+            while True:
+                block = self._source.read(self._block_size)
+                if not self._put(block) or not block:
+                    return
+        except Exception as error:
+            self._error = error
+            self._put(b"")
+        finally:
+            self._source.close()
+
+    def _put(self, block: bytes) -> bool:
+        """Кладёт блок в очередь; возвращает False, если чтение остановлено."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(block, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+@contextmanager
+def open_csv_source(csv_path: str) -> Iterator[Union[str, BinaryIO]]:
+    """
+    Открывает источник CSV для read_csv.
+
+    Для несжатых файлов возвращает сам путь, для сжатых — буферизованный
+    файловый объект, распаковку для которого выполняет фоновый поток.
+    """
+    if not is_compressed(csv_path):
+        yield csv_path
+        return
+
+    decompressor = DECOMPRESSORS[Path(csv_path).suffix.lower()]
+    stream = io.BufferedReader(ThreadedReader(decompressor(csv_path)), BLOCK_SIZE)
+    try:
+        yield stream
+    finally:
+        stream.close()
@@ -0,0 +1,175 @@
+"""Чтение CSV с резюме: проекция колонок, компактные типы, сжатые файлы и префильтр по должности."""
+
+import glob
+from functools import partial
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from hw6_classifier.config import CSV_COLUMNS
+from .compressed_input import DECOMPRESSORS, open_csv_source
+
+# Движок pyarrow не поддерживает переводы строк внутри значений (а они есть
+# в колонке опыта), chunksize и skiprows, поэтому используется C-движок
+CSV_ENGINE: str = "c"
+
+PositionFilter = Callable[[pd.Series], np.ndarray]
+
+GLOB_CHARS = "*?["
+
+# Расширения файлов, которые считаются CSV при чтении директории
+CSV_SUFFIXES: tuple[str, ...] = (".csv", *(f".csv{suffix}" for suffix in DECOMPRESSORS))
+
+
+def has_pyarrow() -> bool:
+    """Проверяет, установлен ли pyarrow."""
+    return find_spec("pyarrow") is not None
+
+
+def resolve_csv_paths(source: str) -> list[str]:
+    """
+    Раскрывает источник данных в список CSV-файлов.
+
+    Аргументы:
+        source: Путь к файлу, директории (берутся все *.csv, в том числе
+            сжатые *.csv.gz и т.п.) или glob-шаблон.
+
+    Вернет:
+        Отсортированный список путей (для файла — он сам).
+
+    Исключения:
+        FileNotFoundError: Если директория или шаблон не содержат файлов.
+    """
+    path = Path(source)
+    if path.is_dir():
+        paths = sorted(
+            str(child) for child in path.iterdir()
+            if child.is_file() and child.name.lower().endswith(CSV_SUFFIXES)
+        )
+    elif any(char in source for char in GLOB_CHARS):
+        paths = sorted(match for match in glob.glob(source) if Path(match).is_file())
+    else:
+        return [source]
+
+    if not paths:
+        raise FileNotFoundError(f"CSV-файлы не найдены: {source}")
+    return paths
+
+
+def read_csv_header(csv_path: str) -> list[str]:
+    """Возвращает список колонок CSV без чтения данных."""
+    with open_csv_source(csv_path) as source:
+        return list(pd.read_csv(source, nrows=0).columns)
+
+
+def _column_dtypes(columns: list[str]) -> dict[str, str]:
+    """
+    Подбирает компактные типы для читаемых колонок.
+
+    Все читаемые колонки текстовые: при наличии pyarrow они хранятся
+    в Arrow-представлении, иначе используется тип по умолчанию.
+    """
+    if has_pyarrow():
+        return {column: "string[pyarrow]" for column in columns}
+    return {}
+
+
+def _scan_positions(
+    csv_path: str, position_filter: PositionFilter, chunksize: Optional[int]
+) -> np.ndarray:
+    """
+    Первый проход: читает только колонку должности и вычисляет маску строк.
+
+    Вернет:
+        Булев массив длины n_rows: True для строк, прошедших фильтр.
+    """
+    position_col = CSV_COLUMNS["position"]
+    with open_csv_source(csv_path) as source:
+        frames = pd.read_csv(
+            source,
+            usecols=[position_col],
+            dtype=_column_dtypes([position_col]),
+            engine=CSV_ENGINE,
+            chunksize=chunksize,
+        )
+        if chunksize is None:
+            return np.asarray(position_filter(frames[position_col]), dtype=bool)
+
+        with frames as reader:
+            masks = [np.asarray(position_filter(df[position_col]), dtype=bool) for df in reader]
+    return np.concatenate(masks) if masks else np.zeros(0, dtype=bool)
+
+
+def _truncate_text(text: str, max_chars: int) -> Union[str, float]:
+    """Конвертер read_csv: оставляет префикс значения, пустое значение — NaN."""
+    return text[:max_chars] if text else np.nan
+
+
+def iter_resume_frames(
+    csv_path: str,
+    chunksize: Optional[int] = None,
+    position_filter: Optional[PositionFilter] = None,
+    text_prefixes: Optional[dict[str, int]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Читает из CSV только колонки CSV_COLUMNS с компактными типами.
+
+    Если задан position_filter, выполняется двухпроходное чтение: сначала
+    читается только колонка должности и определяются нужные строки, затем
+    тяжёлые текстовые колонки загружаются лишь для этих строк.
+
+    Сжатые файлы (.gz, .bz2, .xz, .zst) распаковываются потоково
+    в фоновом потоке, параллельно с разбором.
+
+    Аргументы:
+        csv_path: Путь к CSV-файлу (в том числе сжатому).
+        chunksize: Количество строк в чанке. Если None, возвращается один DataFrame.
+        position_filter: Функция, возвращающая булеву маску по колонке должности.
+        text_prefixes: Колонки, от значений которых при чтении сохраняется
+            только префикс заданной длины (колонка -> число символов).
+
+    Вернет:
+        Итератор по DataFrame (один элемент, если chunksize не задан).
+    """
+    header = read_csv_header(csv_path)
+    usecols = [column for column in CSV_COLUMNS.values() if column in header]
+
+    skiprows = None
+    if position_filter is not None and CSV_COLUMNS["position"] in usecols:
+        keep = _scan_positions(csv_path, position_filter, chunksize)
+
+        def skip_row(row: int) -> bool:
+            # Строка 0 — заголовок, строка i соответствует записи i - 1
+            return row > 0 and not keep[row - 1]
+
+        skiprows = skip_row
+
+    converters = {
+        column: partial(_truncate_text, max_chars=max_chars)
+        for column, max_chars in (text_prefixes or {}).items()
+        if column in usecols
+    }
+    dtypes = {
+        column: dtype for column, dtype in _column_dtypes(usecols).items()
+        if column not in converters
+    }
+
+    with open_csv_source(csv_path) as source:
+        result = pd.read_csv(
+            source,
+            usecols=usecols,
+            dtype=dtypes,
+            converters=converters or None,
+            engine=CSV_ENGINE,
+            chunksize=chunksize,
+            skiprows=skiprows,
+        )
+
+        if chunksize is None:
+            yield result
+        else:
+            with result as reader:
+                yield from reader
@@ -1,16 +1,32 @@
 """Процессор данных резюме для классификации уровня специалиста."""
 
+import copy
+import time
+import zlib
+from functools import partial
+from typing import Iterable, Iterator, Optional, Sequence
+
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 
 from hw6_classifier.config import (
     CSV_COLUMNS,
-    IT_DEVELOPER_KEYWORDS,
     FEATURE_NAMES,
-    TARGET_COLUMN_NAME,
+    TARGET_CLASSES,
 )
 from .processed_data import ProcessedData
-from .feature_extractor import extract_features, create_target
+from .csv_reader import iter_resume_frames
+from .parallel import ordered_parallel_map, split_frames
+from .feature_extractor import fill_dense_features, extract_skill_masks, label_seniority_codes
+from .dictionary_encoding import ParseMemo
+from .near_duplicates import NearDuplicateFilter
+from .ingest_stats import IngestStatistics
+from .text_hashing import TextHasher
+from .reservoir import StratifiedReservoir, class_capacities, merge_samples, proportional_sample
+from .parsers.keyword_matcher import IT_DEVELOPER_MATCHER
+
+_worker_processor: Optional["ResumeDataProcessor"] = None
 
 
 class ResumeDataProcessor:
@@ -20,43 +36,528 @@ class ResumeDataProcessor:
     Выполняет полный цикл обработки данных: загрузку из CSV,
     фильтрацию IT-разработчиков, извлечение признаков и создание
     целевой переменной (junior/middle/senior).
+
+    Атрибуты:
+        shard_reports: Статистика по файлам последней обработки.
+        ingest_stats: Статистика данных последней обработки (пропуски,
+            доли прошедших фильтры строк, квантили признаков, частоты
+            навыков, распределение классов), собранная за тот же проход.
     """
 
-    def __init__(self) -> None:
-        """Инициализирует процессор данных."""
+    def __init__(
+        self,
+        parse_memo: Optional[ParseMemo] = None,
+        experience_prefix: Optional[int] = None,
+        prefix_on_read: bool = False,
+        near_duplicates: Optional[NearDuplicateFilter] = None,
+        max_rows: Optional[int] = None,
+        class_caps: Optional[dict[str, int]] = None,
+        sample_seed: int = 0,
+        text_hash_bits: Optional[int] = None,
+    ) -> None:
+        """
+        Инициализирует процессор данных.
+
+        Аргументы:
+            parse_memo: Персистентная память результатов парсинга уникальных
+                значений. При параллельной обработке новые записи процессов
+                добавляются в неё в порядке результатов.
+            experience_prefix: Разбирать только первые experience_prefix
+                символов колонки опыта (None — весь текст).
+            prefix_on_read: Оставлять от колонки опыта только префикс
+                уже при чтении CSV.
+            near_duplicates: Фильтр близких дубликатов, применяемый
+                к резюме IT-разработчиков до извлечения признаков.
+            max_rows: Оставить стратифицированную выборку не более чем
+                из max_rows образцов (None — все образцы).
+            class_caps: Ограничения числа образцов выборки по классам.
+            sample_seed: Зерно генератора случайных чисел выборки.
+            text_hash_bits: Добавить блок хэшированных n-грамм текста
+                должности и опыта шириной 2 ** text_hash_bits колонок
+                (None — без текстового блока).
+
+        Исключения:
+            ValueError: Если длина префикса не положительна, prefix_on_read
+                задан без experience_prefix, размер выборки не положителен
+                или ограничения классов заданы неверно.
+        """
         from hw6_classifier.config import TECH_STACK
+
+        if experience_prefix is not None and experience_prefix <= 0:
+            raise ValueError(f"Длина префикса должна быть положительной: {experience_prefix}")
+        if prefix_on_read and experience_prefix is None:
+            raise ValueError("Чтение префикса требует задать длину префикса опыта")
+        if max_rows is not None and max_rows <= 0:
+            raise ValueError(f"Размер выборки должен быть положительным: {max_rows}")
+        if class_caps and max_rows is None:
+            raise ValueError("Ограничения классов требуют задать размер выборки")
+        for class_name, cap in (class_caps or {}).items():
+            if class_name not in TARGET_CLASSES:
+                raise ValueError(f"Неизвестный класс: {class_name}")
+            if cap < 0:
+                raise ValueError(f"Ограничение класса {class_name} отрицательно: {cap}")
+
         self._tech_skills: list[str] = [f"skill_{tech}" for tech in sorted(TECH_STACK)]
+        self._parse_memo = parse_memo
+        self._experience_prefix = experience_prefix
+        self._prefix_on_read = prefix_on_read
+        self._near_duplicates = near_duplicates
+        self._max_rows = max_rows
+        self._class_caps = dict(class_caps or {})
+        self._sample_seed = sample_seed
+        self._text_hasher = TextHasher(text_hash_bits) if text_hash_bits is not None else None
+        self.shard_reports: list[dict] = []
+        self.ingest_stats: Optional[IngestStatistics] = None
 
-    def process_csv(self, csv_path: str) -> ProcessedData:
-        """Обрабатывает CSV-файл с резюме и возвращает готовые данные."""
-        df = pd.read_csv(csv_path)
+    @property
+    def feature_names(self) -> list[str]:
+        """Возвращает названия всех признаков (плотные, затем навыки)."""
+        return list(FEATURE_NAMES) + self._tech_skills
 
-        df = self._filter_it_developers(df)
+    @property
+    def near_duplicates(self) -> Optional[NearDuplicateFilter]:
+        """Возвращает фильтр близких дубликатов (None, если не задан)."""
+        return self._near_duplicates
 
-        if len(df) == 0:
-            raise ValueError("После фильтрации не осталось IT-разработчиков")
+    @property
+    def options(self) -> dict:
+        """
+        Возвращает настройки, влияющие на результат обработки.
+
+        Используются в ключах кэша и хранилища признаков; для настроек
+        по умолчанию словарь пуст.
+        """
+        options = {}
+        if self._experience_prefix is not None:
+            options["experience_prefix"] = self._experience_prefix
+        if self._prefix_on_read:
+            options["prefix_on_read"] = True
+        if self._near_duplicates is not None:
+            options["near_duplicate_threshold"] = self._near_duplicates.threshold
+        if self._max_rows is not None:
+            options["max_rows"] = self._max_rows
+            options["sample_seed"] = self._sample_seed
+        if self._class_caps:
+            options["class_caps"] = self._class_caps
+        if self._text_hasher is not None:
+            options["text_hash_bits"] = self._text_hasher.n_bits
+        return options
+
+    def sample_data(self, data: ProcessedData) -> ProcessedData:
+        """
+        Оставляет стратифицированную выборку из данных по настройкам процессора.
+
+        Классы представлены пропорционально истинному размеру
+        (population_counts или, если он не задан, числу образцов данных)
+        с учётом ограничений class_caps. Без max_rows данные не меняются.
+        """
+        if self._max_rows is None:
+            return data
+        return proportional_sample(
+            data, self._max_rows, self._capacities(), seed=(self._sample_seed,),
+        )
+
+    def read_frames(
+        self,
+        csv_path: str,
+        chunksize: Optional[int] = None,
+        prefilter: bool = False,
+        stats: Optional[IngestStatistics] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Читает CSV с учётом настроек процессора.
+
+        Аргументы:
+            csv_path: Путь к CSV-файлу.
+            chunksize: Количество строк CSV в одном чанке.
+            prefilter: Загружать текстовые колонки только для IT-разработчиков.
+            stats: Статистика, в которой учитывается проход предварительного
+                отбора по всем строкам CSV.
+        """
+        position_filter = None
+        if prefilter:
+            def position_filter(positions: pd.Series) -> np.ndarray:
+                if stats is not None:
+                    stats.observe_scan(positions)
+                return self._developer_mask(positions)
+
+        text_prefixes = (
+            {CSV_COLUMNS["experience"]: self._experience_prefix} if self._prefix_on_read else None
+        )
+        return iter_resume_frames(
+            csv_path,
+            chunksize=chunksize,
+            position_filter=position_filter,
+            text_prefixes=text_prefixes,
+        )
+
+    def process_csv(
+        self,
+        csv_path: str,
+        chunksize: Optional[int] = None,
+        prefilter: bool = False,
+        feature_workers: int = 1,
+    ) -> ProcessedData:
+        """
+        Обрабатывает CSV-файл с резюме и возвращает готовые данные.
+
+        Из CSV читаются только колонки CSV_COLUMNS. В потоковом режиме
+        (chunksize задан) фильтрация, извлечение признаков и разметка
+        выполняются по чанкам, а в памяти накапливаются только числовые
+        строки признаков.
+
+        Аргументы:
+            csv_path: Путь к CSV-файлу.
+            chunksize: Количество строк CSV в одном чанке. Если None,
+                файл читается целиком.
+            prefilter: Выполнить предварительный проход по колонке должности,
+                чтобы загружать текстовые колонки только для IT-разработчиков.
+            feature_workers: Количество процессов для извлечения признаков.
+                Чанки (или части файла) обрабатываются параллельно, результаты
+                объединяются в исходном порядке строк.
+        """
+        return self.process_files([csv_path], chunksize, prefilter, feature_workers)
+
+    def process_files(
+        self,
+        csv_paths: Sequence[str],
+        chunksize: Optional[int] = None,
+        prefilter: bool = False,
+        feature_workers: int = 1,
+    ) -> ProcessedData:
+        """
+        Обрабатывает несколько CSV-файлов (шардов) и объединяет результат.
 
-        features_df = extract_features(df)
-        y_series = create_target(df)
+        Каждый шард обрабатывается независимо; при feature_workers > 1
+        шарды распределяются по процессам (единственный шард делится
+        на чанки, как в process_csv). Частичные данные объединяются
+        в порядке csv_paths, а статистика по шардам (прочитано строк,
+        IT-разработчиков, образцов, время обработки, а при фильтре
+        близких дубликатов — удалено дубликатов и время фильтра)
+        сохраняется в атрибуте shard_reports. При параллельной обработке
+        шардов близкие дубликаты ищутся внутри каждого шарда. Статистика
+        данных собирается по каждому шарду и объединяется в ingest_stats.
 
-        combined_df = pd.concat([features_df, y_series], axis=1)
-        combined_df = combined_df.dropna()
+        При max_rows образцы каждого шарда проходят через резервуары
+        классов (память ограничена их вместимостью), резервуары шардов
+        объединяются, и из них отбирается выборка пропорционально истинному
+        размеру классов (см. sample_data).
 
-        if len(combined_df) < 10:
-            raise ValueError(f"Недостаточно данных после обработки: {len(combined_df)} образцов")
+        Аргументы:
+            csv_paths: Пути к CSV-файлам.
+            chunksize: Количество строк CSV в одном чанке.
+            prefilter: Загружать текстовые колонки только для IT-разработчиков.
+            feature_workers: Количество процессов.
+        """
+        if not csv_paths:
+            raise ValueError("Не задано ни одного CSV-файла")
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError(f"Размер чанка должен быть положительным: {chunksize}")
+        if feature_workers < 1:
+            raise ValueError(f"Количество процессов должно быть положительным: {feature_workers}")
 
-        y = combined_df[TARGET_COLUMN_NAME].values
-        X = combined_df.drop(TARGET_COLUMN_NAME, axis=1).values
+        if len(csv_paths) == 1 or feature_workers == 1:
+            results = [
+                self._process_shard(path, chunksize, prefilter, feature_workers)
+                for path in csv_paths
+            ]
+        else:
+            process_shard = partial(_process_shard_in_worker, chunksize=chunksize, prefilter=prefilter)
+            results = list(
+                self._map_in_workers(
+                    process_shard, csv_paths, min(feature_workers, len(csv_paths)),
+                    self._worker_copy(near_duplicates=True),
+                )
+            )
 
-        all_feature_names = list(FEATURE_NAMES) + self._tech_skills
+        self.shard_reports = [report for _, _, report, _ in results]
+        self.ingest_stats = results[0][3]
+        for _, _, _, shard_stats in results[1:]:
+            self.ingest_stats.merge(shard_stats)
 
-        class_names = ["junior", "middle", "senior"]
-        class_to_idx = {name: idx for idx, name in enumerate(class_names)}
-        y_encoded = np.array([class_to_idx[label] for label in y])
+        n_developers = sum(n_shard_developers for n_shard_developers, _, _, _ in results)
+        parts = [data for _, data, _, _ in results if data is not None]
 
-        return ProcessedData(
-            X=X, y=y_encoded, feature_names=all_feature_names, class_names=class_names,
+        data = None
+        if parts and self._max_rows is not None:
+            data = self.sample_data(
+                merge_samples(parts, self._capacities(), seed=(self._sample_seed,))
+            )
+        elif parts:
+            data = parts[0] if len(parts) == 1 else ProcessedData.concat(parts)
+
+        return self._check_data(n_developers, data)
+
+    def featurize_frames(
+        self, frames: Iterable[pd.DataFrame], feature_workers: int = 1
+    ) -> Iterator[tuple]:
+        """
+        Фильтрует DataFrame'ы и извлекает из них признаки и метки.
+
+        Если задан фильтр близких дубликатов, он применяется в текущем
+        процессе, чтобы дубликаты находились и между чанками.
+
+        Аргументы:
+            frames: Источник DataFrame'ов с колонками CSV_COLUMNS.
+            feature_workers: Количество процессов для извлечения признаков.
+
+        Вернет:
+            Итератор кортежей (число IT-разработчиков, плотные признаки,
+            навыки, метки, индекс строк с признаками, текстовый блок или None)
+            в исходном порядке.
+        """
+        method_name = "_featurize_frame"
+        if self._near_duplicates is not None:
+            frames = self.deduplicate_frames(frames)
+            method_name = "_featurize_developers"
+
+        if feature_workers == 1:
+            return map(getattr(self, method_name), frames)
+
+        return self._map_in_workers(
+            partial(_featurize_in_worker, method_name), frames, feature_workers,
+            self._worker_copy(near_duplicates=False),
+        )
+
+    def deduplicate_frames(self, frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Отбирает резюме IT-разработчиков и удаляет близкие дубликаты.
+
+        Аргументы:
+            frames: Источник DataFrame'ов с колонками CSV_COLUMNS.
+
+        Вернет:
+            Итератор DataFrame'ов с оставленными резюме разработчиков.
+
+        Исключения:
+            ValueError: Если фильтр близких дубликатов не задан.
+        """
+        if self._near_duplicates is None:
+            raise ValueError("Фильтр близких дубликатов не задан")
+
+        for df in frames:
+            df = self._filter_it_developers(df)
+            if len(df):
+                keep = self._near_duplicates.keep_mask(df)
+                if not keep.all():
+                    df = df[keep]
+            yield df
+
+    def _map_in_workers(
+        self, func, items: Iterable, n_workers: int, worker: "ResumeDataProcessor",
+    ) -> Iterator:
+        """
+        Применяет функцию воркера к элементам в пуле процессов.
+
+        Копия процессора worker передаётся в каждый процесс один раз
+        (см. _init_worker), задачи содержат только элемент и имя метода.
+        Новые записи памяти парсинга, возвращённые вместе с результатами,
+        добавляются в память процессора в исходном порядке элементов.
+
+        Аргументы:
+            func: Функция модуля, возвращающая (результат, изменения памяти).
+            items: Элементы для обработки.
+            n_workers: Количество процессов.
+            worker: Копия процессора для процессов пула (см. _worker_copy).
+        """
+        results = ordered_parallel_map(
+            func, items, n_workers, initializer=_init_worker, initargs=(worker,),
         )
+        for result, memo_updates in results:
+            if memo_updates is not None:
+                self._parse_memo.merge_updates(memo_updates)
+            yield result
+
+    def _worker_copy(self, near_duplicates: bool) -> "ResumeDataProcessor":
+        """
+        Копия процессора для процессов пула без состояния основного процесса.
+
+        Аргументы:
+            near_duplicates: Оставить фильтр близких дубликатов (нужен при
+                обработке шардов в процессах; чанки приходят уже без дубликатов).
+        """
+        worker = copy.copy(self)
+        worker.shard_reports = []
+        worker.ingest_stats = None
+        if not near_duplicates:
+            worker._near_duplicates = None
+        return worker
+
+    def _process_shard(
+        self,
+        csv_path: str,
+        chunksize: Optional[int] = None,
+        prefilter: bool = False,
+        feature_workers: int = 1,
+    ) -> tuple[int, Optional[ProcessedData], dict, IngestStatistics]:
+        """
+        Обрабатывает один CSV-файл без проверки объёма данных.
+
+        Вернет:
+            Кортеж (число IT-разработчиков, данные или None, отчёт по шарду,
+            статистика данных шарда).
+        """
+        start_time = time.perf_counter()
+        stats = IngestStatistics(len(self._tech_skills))
+        dedup = self._near_duplicates
+        removed_before, dedup_before = (dedup.n_removed, dedup.seconds) if dedup else (0, 0.0)
+
+        def counted(frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+            for df in frames:
+                stats.observe_frame(df)
+                yield df
+
+        frames = counted(
+            self.read_frames(csv_path, chunksize=chunksize, prefilter=prefilter, stats=stats)
+        )
+        if feature_workers > 1 and chunksize is None:
+            frames = split_frames(frames, feature_workers)
+
+        reservoir = None
+        if self._max_rows is not None:
+            reservoir = StratifiedReservoir(
+                self._capacities(), seed=(self._sample_seed, zlib.crc32(str(csv_path).encode())),
+            )
+
+        n_developers, data = self._collect_frames(
+            self.featurize_frames(frames, feature_workers), stats, reservoir
+        )
+        report = {
+            "path": str(csv_path),
+            "rows": stats.rows,
+            "developers": n_developers,
+            "samples": 0 if data is None else data.n_samples,
+            "seconds": round(time.perf_counter() - start_time, 3),
+        }
+        if dedup is not None:
+            report["near_duplicates"] = dedup.n_removed - removed_before
+            report["dedup_seconds"] = round(dedup.seconds - dedup_before, 3)
+            stats.near_duplicates = report["near_duplicates"]
+        return n_developers, data, report, stats
+
+    def _collect_frames(
+        self,
+        results: Iterable[tuple],
+        stats: Optional[IngestStatistics] = None,
+        reservoir: Optional[StratifiedReservoir] = None,
+    ) -> tuple[int, Optional[ProcessedData]]:
+        """
+        Собирает данные из результатов featurize_frames по чанкам.
+
+        Если задан stats, результаты чанков учитываются в статистике данных.
+        Если задан reservoir, образцы чанков не накапливаются, а проходят
+        через резервуары, и возвращается их содержимое.
+
+        Вернет:
+            Кортеж (число IT-разработчиков, данные или None, если
+            разработчиков не нашлось).
+        """
+        x_parts: list[np.ndarray] = []
+        skill_parts: list[np.ndarray] = []
+        y_parts: list[np.ndarray] = []
+        text_parts: list[sp.csr_matrix] = []
+        n_developers = 0
+
+        for n_chunk_developers, x_chunk, skill_chunk, y_chunk, _, text_chunk in results:
+            n_developers += n_chunk_developers
+            if stats is not None:
+                stats.observe_samples(n_chunk_developers, x_chunk, skill_chunk, y_chunk)
+
+            if n_chunk_developers == 0:
+                continue
+
+            if reservoir is not None:
+                reservoir.add(x_chunk, skill_chunk, y_chunk, text_chunk)
+                continue
+
+            x_parts.append(x_chunk)
+            skill_parts.append(skill_chunk)
+            y_parts.append(y_chunk)
+            if text_chunk is not None:
+                text_parts.append(text_chunk)
+
+        if reservoir is not None:
+            return n_developers, reservoir.to_data(self.feature_names, list(TARGET_CLASSES))
+
+        if not y_parts:
+            return n_developers, None
+
+        X = np.concatenate(x_parts) if len(x_parts) > 1 else x_parts[0]
+        skill_mask = np.concatenate(skill_parts) if len(skill_parts) > 1 else skill_parts[0]
+        y = np.concatenate(y_parts) if len(y_parts) > 1 else y_parts[0]
+        text_features = None
+        if text_parts:
+            text_features = sp.vstack(text_parts, format="csr") if len(text_parts) > 1 else text_parts[0]
+
+        return n_developers, ProcessedData(
+            X=X,
+            y=y,
+            feature_names=self.feature_names,
+            class_names=list(TARGET_CLASSES),
+            skill_mask=skill_mask,
+            text_features=text_features,
+        )
+
+    def _capacities(self) -> np.ndarray:
+        """Вместимость резервуаров классов при стратифицированной выборке."""
+        caps = {TARGET_CLASSES.index(name): cap for name, cap in self._class_caps.items()}
+        return class_capacities(self._max_rows, len(TARGET_CLASSES), caps)
+
+    @staticmethod
+    def _check_data(n_developers: int, data: Optional[ProcessedData]) -> ProcessedData:
+        """Проверяет, что после обработки осталось достаточно данных."""
+        if n_developers == 0:
+            raise ValueError("После фильтрации не осталось IT-разработчиков")
+
+        if data is None:
+            raise ValueError("Недостаточно данных после обработки: 0 образцов")
+
+        if data.n_samples < 10:
+            raise ValueError(f"Недостаточно данных после обработки: {data.n_samples} образцов")
+
+        return data
+
+    def _featurize_frame(self, df: pd.DataFrame) -> tuple:
+        """
+        Фильтрует чанк и извлекает из него признаки и метки.
+
+        Вернет:
+            Кортеж (число IT-разработчиков, плотные признаки, навыки, метки,
+            индекс строк); для чанка без разработчиков массивы равны None.
+        """
+        return self._featurize_developers(self._filter_it_developers(df))
+
+    def _featurize_developers(self, df: pd.DataFrame) -> tuple:
+        """Извлекает признаки и метки из уже отфильтрованного чанка."""
+        if len(df) == 0:
+            return 0, None, None, None, None, None
+
+        return (len(df), *self._process_frame(df))
+
+    def _process_frame(self, df: pd.DataFrame) -> tuple[np.ndarray, ...]:
+        """
+        Извлекает признаки и метки из отфильтрованного DataFrame.
+
+        Признаки пишутся в одну заранее выделенную матрицу, после чего
+        строки с пропусками отбрасываются одним сжатием по маске. Текстовый
+        блок строится только для оставшихся строк.
+
+        Вернет:
+            Кортеж (плотные признаки, упакованные навыки, закодированные метки,
+            значения индекса df, текстовый блок или None) для строк без пропусков.
+        """
+        X = np.empty((len(df), len(FEATURE_NAMES)), dtype=np.float64)
+        fill_dense_features(df, X, self._parse_memo, experience_prefix=self._experience_prefix)
+        skill_mask = extract_skill_masks(df, self._parse_memo)
+        y_encoded = label_seniority_codes(df, X[:, FEATURE_NAMES.index("experience_months")])
+
+        valid = ~np.isnan(X).any(axis=1) & (y_encoded >= 0)
+        if not valid.all():
+            df = df[valid]
+            X, skill_mask, y_encoded = X[valid], skill_mask[valid], y_encoded[valid]
+
+        text_features = None if self._text_hasher is None else self._text_hasher.transform(df)
+        return X, skill_mask, y_encoded, df.index.to_numpy(), text_features
 
     def _filter_it_developers(self, df: pd.DataFrame) -> pd.DataFrame:
         """Фильтрует резюме IT-разработчиков."""
@@ -65,10 +566,41 @@ class ResumeDataProcessor:
         if position_col not in df.columns:
             raise ValueError(f"Колонка '{position_col}' не найдена в данных")
 
-        positions_lower = df[position_col].fillna("").str.lower()
-
-        mask = positions_lower.apply(
-            lambda pos: any(keyword in pos for keyword in IT_DEVELOPER_KEYWORDS)
-        )
+        mask = self._developer_mask(df[position_col])
 
         return df[mask].copy()
+
+    @staticmethod
+    def _developer_mask(positions: pd.Series) -> np.ndarray:
+        """Возвращает булеву маску должностей IT-разработчиков."""
+        return IT_DEVELOPER_MATCHER.contains_any_column(positions)
+
+
+def _init_worker(processor: ResumeDataProcessor) -> None:
+    """Сохраняет процессор в процессе пула и начинает журнал памяти парсинга."""
+    global _worker_processor
+    _worker_processor = processor
+    if processor._parse_memo is not None:
+        processor._parse_memo.start_journal()
+
+
+def _memo_updates() -> Optional[tuple]:
+    """Забирает изменения памяти парсинга процесса пула (None без памяти)."""
+    memo = _worker_processor._parse_memo
+    return memo.take_updates() if memo is not None else None
+
+
+def _featurize_in_worker(method_name: str, df: pd.DataFrame) -> tuple:
+    """Извлекает признаки чанка в процессе пула методом процессора method_name."""
+    result = getattr(_worker_processor, method_name)(df)
+    return result, _memo_updates()
+
+
+def _process_shard_in_worker(
+    csv_path: str, chunksize: Optional[int] = None, prefilter: bool = False,
+) -> tuple:
+    """Обрабатывает шард в процессе пула; близкие дубликаты ищутся внутри шарда."""
+    if _worker_processor._near_duplicates is not None:
+        _worker_processor._near_duplicates = _worker_processor._near_duplicates.empty_copy()
+    result = _worker_processor._process_shard(csv_path, chunksize, prefilter)
+    return result, _memo_updates()
@@ -0,0 +1,231 @@
+"""
+Словарное кодирование повторяющихся текстовых колонок.
+
+Колонки вроде города, образования, пола/возраста и зарплаты содержат
+небольшое число различных значений. Колонка факторизуется, парсер
+запускается только на уникальных значениях, а результат раздаётся строкам
+по кодам. Дополнительно ParseMemo сохраняет результаты парсинга между
+запусками, используя как ключ нормализованную строку.
+"""
+
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from pandas.api.types import is_string_dtype
+
+from hw6_classifier.config import PROCESSED_DATA_DIR
+from .feature_cache import parser_version
+
+ParsedColumn = Union[pd.Series, np.ndarray]
+ParsedOutput = Union[ParsedColumn, tuple]
+ColumnParser = Callable[[pd.Series], ParsedOutput]
+
+DEFAULT_MEMO_PATH: Path = PROCESSED_DATA_DIR / "parse_memo.pkl"
+MAX_MEMO_ENTRIES = 1_000_000
+
+
+def _lower(text: str) -> str:
+    """Нормализация по умолчанию: все парсеры начинают с lower()."""
+    return text.lower()
+
+
+def _normalize_salary(text: str) -> str:
+    """Нормализация зарплаты, повторяющая первый шаг parse_salary."""
+    return text.replace(" ", "").replace("\xa0", "").lower()
+
+
+class ParseMemo:
+    """
+    Персистентная память результатов парсинга уникальных строк.
+
+    Результаты хранятся отдельно для каждого парсера и привязаны к версии
+    парсеров: при её изменении память сбрасывается. При параллельной
+    обработке каждый процесс получает копию памяти один раз и отдаёт
+    вместе с результатом задачи новые записи и счётчики (take_updates),
+    которые основной процесс добавляет в свою память (merge_updates).
+
+    Атрибуты:
+        path: Путь к файлу памяти.
+        version: Версия парсеров, для которой действительны записи.
+    """
+
+    NORMALIZERS: dict[str, Callable[[str], str]] = {"salary": _normalize_salary}
+
+    def __init__(self, path: Path = DEFAULT_MEMO_PATH, version: str = "") -> None:
+        """Создаёт пустую память."""
+        self.path = Path(path)
+        self.version = version
+        self._entries: dict[str, dict[str, tuple]] = {}
+        self._journal: Optional[dict[str, dict[str, tuple]]] = None
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MEMO_PATH, version: Optional[str] = None) -> "ParseMemo":
+        """
+        Загружает память с диска; при несовпадении версии возвращает пустую.
+
+        Аргументы:
+            path: Путь к файлу памяти.
+            version: Версия парсеров (по умолчанию — текущая parser_version()).
+        """
+        memo = cls(path, version if version is not None else parser_version())
+        if memo.path.exists():
+            with open(memo.path, "rb") as f:
+                stored = pickle.load(f)
+            if stored.get("version") == memo.version:
+                memo._entries = stored["entries"]
+        return memo
+
+    @property
+    def n_entries(self) -> int:
+        """Возвращает общее количество запомненных значений."""
+        return sum(len(entries) for entries in self._entries.values())
+
+    def save(self) -> None:
+        """Сохраняет память на диск."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": self.version, "entries": self._entries}, f)
+        tmp_path.replace(self.path)
+
+    def normalize(self, parser_name: str, text: Any) -> Optional[str]:
+        """Возвращает ключ памяти для значения (None для нестроковых значений)."""
+        if not isinstance(text, str):
+            return None
+        return self.NORMALIZERS.get(parser_name, _lower)(text)
+
+    def lookup(self, parser_name: str, keys: Sequence[Optional[str]]) -> list[Optional[tuple]]:
+        """Возвращает сохранённые результаты для ключей (None при промахе)."""
+        entries = self._entries.get(parser_name, {})
+        found = [entries.get(key) if key is not None else None for key in keys]
+        n_hits = sum(result is not None for result in found)
+        self.hits += n_hits
+        self.misses += sum(key is not None for key in keys) - n_hits
+        return found
+
+    def store(self, parser_name: str, keys: Sequence[Optional[str]], results: Sequence[tuple]) -> None:
+        """Запоминает результаты парсинга для ключей."""
+        entries = self._entries.setdefault(parser_name, {})
+        journal = self._journal.setdefault(parser_name, {}) if self._journal is not None else None
+        for key, result in zip(keys, results):
+            if key is not None and len(entries) < MAX_MEMO_ENTRIES:
+                entries[key] = result
+                if journal is not None:
+                    journal[key] = result
+
+    def start_journal(self) -> None:
+        """Начинает запоминать новые записи и счётчики для take_updates."""
+        self._journal = {}
+        self.hits = 0
+        self.misses = 0
+
+    def take_updates(self) -> tuple[dict[str, dict[str, tuple]], int, int]:
+        """
+        Возвращает изменения с прошлого вызова и начинает новый журнал.
+
+        Вернет:
+            Кортеж (новые записи {парсер: {ключ: результат}}, попадания, промахи).
+
+        Исключения:
+            ValueError: Если журнал не начат (start_journal).
+        """
+        if self._journal is None:
+            raise ValueError("Журнал памяти парсинга не начат")
+        updates = (self._journal, self.hits, self.misses)
+        self.start_journal()
+        return updates
+
+    def merge_updates(self, updates: tuple[dict[str, dict[str, tuple]], int, int]) -> None:
+        """Добавляет изменения, полученные take_updates в другом процессе."""
+        entries, hits, misses = updates
+        for parser_name, parser_entries in entries.items():
+            self.store(parser_name, list(parser_entries), list(parser_entries.values()))
+        self.hits += hits
+        self.misses += misses
+
+
+def _outputs(parsed: ParsedOutput) -> list[np.ndarray]:
+    """Приводит результат парсера к списку массивов (по одному на выход)."""
+    columns = parsed if isinstance(parsed, tuple) else (parsed,)
+    return [np.asarray(column) for column in columns]
+
+
+def _restructure(like: ParsedOutput, arrays: list[np.ndarray], index: pd.Index) -> ParsedOutput:
+    """Собирает массивы обратно в структуру результата парсера."""
+    columns = like if isinstance(like, tuple) else (like,)
+    rebuilt = [
+        pd.Series(array, index=index) if isinstance(column, pd.Series) else array
+        for column, array in zip(columns, arrays)
+    ]
+    return tuple(rebuilt) if isinstance(like, tuple) else rebuilt[0]
+
+
+def _parse_uniques(
+    unique_texts: np.ndarray,
+    column_parser: ColumnParser,
+    memo: Optional[ParseMemo],
+    parser_name: Optional[str],
+) -> tuple[ParsedOutput, list[np.ndarray]]:
+    """Парсит уникальные значения, используя память, если она задана."""
+    if memo is None or parser_name is None:
+        parsed = column_parser(pd.Series(unique_texts, dtype=object))
+        return parsed, _outputs(parsed)
+
+    keys = [memo.normalize(parser_name, text) for text in unique_texts]
+    cached = memo.lookup(parser_name, keys)
+    miss_idx = np.array([idx for idx, result in enumerate(cached) if result is None], dtype=np.intp)
+
+    parsed = column_parser(pd.Series(unique_texts[miss_idx], dtype=object))
+    miss_outputs = _outputs(parsed)
+
+    arrays = [np.empty(len(unique_texts), dtype=output.dtype) for output in miss_outputs]
+    for out_idx, array in enumerate(arrays):
+        array[miss_idx] = miss_outputs[out_idx]
+    for idx, result in enumerate(cached):
+        if result is not None:
+            for out_idx, array in enumerate(arrays):
+                array[idx] = result[out_idx]
+
+    memo.store(
+        parser_name,
+        [keys[idx] for idx in miss_idx],
+        [tuple(output[pos].item() for output in miss_outputs) for pos in range(len(miss_idx))],
+    )
+    return parsed, arrays
+
+
+def parse_unique(
+    texts: pd.Series,
+    column_parser: ColumnParser,
+    memo: Optional[ParseMemo] = None,
+    parser_name: Optional[str] = None,
+) -> ParsedOutput:
+    """
+    Применяет векторизованный парсер только к уникальным значениям колонки.
+
+    Аргументы:
+        texts: Исходная текстовая колонка.
+        column_parser: Векторизованный парсер (parse_*_column и т.п.).
+        memo: Персистентная память результатов (необязательно).
+        parser_name: Имя парсера в памяти.
+
+    Вернет:
+        Результат той же структуры, что и column_parser(texts).
+    """
+    if not is_string_dtype(texts.dtype):
+        return column_parser(texts)
+
+    codes, uniques = pd.factorize(texts)
+
+    # Пропуски (код -1) получают результат парсинга NaN, добавленного в конец
+    unique_texts = np.append(np.asarray(uniques, dtype=object), np.nan)
+    codes = np.where(codes < 0, len(uniques), codes)
+
+    parsed, arrays = _parse_uniques(unique_texts, column_parser, memo, parser_name)
+    return _restructure(parsed, [array[codes] for array in arrays], texts.index)
@@ -0,0 +1,91 @@
+"""
+Проверка ограниченного разбора колонки опыта.
+
+Итоговый стаж указывается в начале текста ("Опыт работы 5 лет 3 месяца"),
+поэтому в ограниченном режиме разбирается только префикс колонки. Отчёт
+сравнивает результаты разбора префикса и полного текста на реальной
+выгрузке, чтобы подобрать безопасную длину префикса.
+"""
+
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from hw6_classifier.config import CSV_COLUMNS
+from .csv_reader import iter_resume_frames
+from .parsers import parse_experience_column
+from .parsers.keyword_matcher import IT_DEVELOPER_MATCHER
+from .parsers.text_column import as_text_column
+
+COUNT_FIELDS: tuple[str, ...] = (
+    "n_texts", "n_agree", "n_changed", "n_lost", "chars_full", "chars_prefix",
+)
+
+
+def experience_prefix_counts(texts: pd.Series, max_chars: int) -> dict[str, int]:
+    """
+    Сравнивает разбор префикса и полного текста для колонки опыта.
+
+    Аргументы:
+        texts: Колонка опыта с полными текстами.
+        max_chars: Длина префикса.
+
+    Вернет:
+        Счётчики: число текстов, совпадений, изменённых значений, значений,
+        потерянных при разборе префикса, и объём текста в символах.
+    """
+    full = parse_experience_column(texts).to_numpy()
+    prefix = parse_experience_column(texts, max_chars=max_chars).to_numpy()
+
+    lengths = as_text_column(texts).str.len().to_numpy(dtype=np.float64)
+    has_text = ~np.isnan(lengths)
+    full_nan, prefix_nan = np.isnan(full), np.isnan(prefix)
+
+    return {
+        "n_texts": int(has_text.sum()),
+        "n_agree": int((has_text & ((full == prefix) | (full_nan & prefix_nan))).sum()),
+        "n_changed": int((~full_nan & ~prefix_nan & (full != prefix)).sum()),
+        "n_lost": int((~full_nan & prefix_nan).sum()),
+        "chars_full": int(lengths[has_text].sum()),
+        "chars_prefix": int(np.minimum(lengths[has_text], max_chars).sum()),
+    }
+
+
+def validate_experience_prefix(
+    csv_paths: Union[str, Sequence[str]], max_chars: int, chunksize: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Строит отчёт о расхождениях разбора префикса и полного текста опыта.
+
+    Сравнение выполняется для резюме IT-разработчиков, которые попадают
+    в обучающие данные.
+
+    Аргументы:
+        csv_paths: Путь к CSV-файлу или список путей к шардам.
+        max_chars: Длина префикса.
+        chunksize: Количество строк CSV в одном чанке.
+
+    Вернет:
+        Словарь со счётчиками, долей совпадений и долей разбираемого текста.
+    """
+    if isinstance(csv_paths, str):
+        csv_paths = [csv_paths]
+
+    totals = dict.fromkeys(COUNT_FIELDS, 0)
+    for csv_path in csv_paths:
+        frames = iter_resume_frames(
+            csv_path, chunksize=chunksize, position_filter=IT_DEVELOPER_MATCHER.contains_any_column,
+        )
+        for df in frames:
+            counts = experience_prefix_counts(df[CSV_COLUMNS["experience"]], max_chars)
+            for field in COUNT_FIELDS:
+                totals[field] += counts[field]
+
+    n_texts, chars_full = totals["n_texts"], totals["chars_full"]
+    return {
+        "max_chars": max_chars,
+        **totals,
+        "agreement_rate": totals["n_agree"] / n_texts if n_texts else 1.0,
+        "scanned_share": totals["chars_prefix"] / chars_full if chars_full else 1.0,
+    }
@@ -0,0 +1,144 @@
+"""
+Кэш обработанных признаков в PROCESSED_DATA_DIR.
+
+Ключ кэша объединяет хэш содержимого входного файла и хэш исходного кода
+парсеров и констант, поэтому любое изменение данных или логики обработки
+автоматически приводит к промаху кэша.
+"""
+
+import hashlib
+import json
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+from hw6_classifier.config import PROCESSED_DATA_DIR
+from .processed_data import ProcessedData
+from .storage import META_FILE, load_processed_data, read_meta, save_processed_data
+
+HASH_BLOCK_SIZE = 1 << 20
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Файлы, от которых зависит результат обработки
+VERSIONED_SOURCES: tuple[str, ...] = ("processors/**/*.py", "config/constants.py")
+
+
+def file_digest(path: Path) -> str:
+    """Вычисляет SHA-256 содержимого файла, читая его блоками."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def parser_version() -> str:
+    """Вычисляет хэш исходного кода парсеров и констант."""
+    digest = hashlib.sha256()
+    paths = sorted({path for pattern in VERSIONED_SOURCES for path in PACKAGE_DIR.glob(pattern)})
+    for path in paths:
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class FeatureCache:
+    """
+    Кэш ProcessedData, адресуемый по содержимому входного файла.
+
+    Каждая запись — директория <key> в формате save_processed_data,
+    которая при загрузке отображается в память. Хэши входных файлов
+    запоминаются вместе с размером и временем изменения, чтобы
+    не перечитывать неизменившийся файл при каждом запуске.
+
+    Атрибуты:
+        cache_dir: Директория кэша.
+    """
+
+    def __init__(self, cache_dir: Path = PROCESSED_DATA_DIR) -> None:
+        """Инициализирует кэш в заданной директории."""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._digests_path = self.cache_dir / "digests.json"
+
+    def key(self, csv_paths: Union[str, Sequence[str]], options: Optional[dict] = None) -> str:
+        """
+        Вычисляет ключ кэша для входного файла или набора шардов.
+
+        Аргументы:
+            csv_paths: Путь к входному файлу или список путей к шардам.
+            options: Настройки обработки (ResumeDataProcessor.options);
+                пустые настройки не меняют ключ.
+        """
+        if isinstance(csv_paths, str):
+            csv_paths = [csv_paths]
+
+        source_digest = ":".join(self._source_digest(Path(path)) for path in csv_paths)
+        combined = f"{source_digest}:{parser_version()}"
+        if options:
+            combined += ":" + json.dumps(options, sort_keys=True)
+        return hashlib.sha256(combined.encode()).hexdigest()[:32]
+
+    def load(self, key: str) -> Optional[ProcessedData]:
+        """Загружает данные по ключу или возвращает None при промахе."""
+        entry_dir = self.cache_dir / key
+        if not (entry_dir / META_FILE).exists():
+            return None
+
+        return load_processed_data(entry_dir, mmap_mode="r")
+
+    def save(self, key: str, data: ProcessedData, csv_path: str) -> Path:
+        """
+        Сохраняет данные под ключом и удаляет устаревшие записи того же файла.
+
+        Для шардов csv_path — исходный путь к директории или glob-шаблон.
+
+        Вернет:
+            Путь к директории записи.
+        """
+        source = str(Path(csv_path).resolve())
+        entry_dir = save_processed_data(
+            data,
+            self.cache_dir / key,
+            extra_meta={"source": source, "parser_version": parser_version()},
+        )
+
+        self._prune(source, keep=key)
+        return entry_dir
+
+    def _prune(self, source: str, keep: str) -> None:
+        """Удаляет записи кэша для того же файла, кроме текущей."""
+        for meta_path in self.cache_dir.glob(f"*/{META_FILE}"):
+            entry_dir = meta_path.parent
+            if entry_dir.name == keep:
+                continue
+            try:
+                meta = read_meta(entry_dir)
+            except (OSError, ValueError):
+                continue
+            if meta.get("source") == source:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def _source_digest(self, path: Path) -> str:
+        """Возвращает хэш файла, используя запомненное значение, если файл не менялся."""
+        stat = path.stat()
+        resolved = str(path.resolve())
+        signature = [stat.st_size, stat.st_mtime_ns]
+
+        digests = {}
+        if self._digests_path.exists():
+            try:
+                digests = json.loads(self._digests_path.read_text(encoding="utf-8"))
+            except ValueError:
+                digests = {}
+
+        entry = digests.get(resolved)
+        if entry and entry["signature"] == signature:
+            return entry["digest"]
+
+        digest = file_digest(path)
+        digests[resolved] = {"signature": signature, "digest": digest}
+        self._digests_path.write_text(json.dumps(digests, indent=2), encoding="utf-8")
+        return digest
@@ -2,80 +2,150 @@
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from hw6_classifier.config import (
     CSV_COLUMNS,
-    TECH_STACK,
+    FEATURE_NAMES,
     JUNIOR_MAX_EXPERIENCE_MONTHS,
     MIDDLE_MAX_EXPERIENCE_MONTHS,
     SENIORITY_KEYWORDS,
+    TARGET_CLASSES,
     TARGET_COLUMN_NAME,
 )
 from .parsers import (
-    parse_experience,
-    parse_salary,
-    parse_demographics,
-    parse_education,
-    parse_city,
-    extract_tech_skills,
+    parse_experience_column,
+    parse_salary_column,
+    parse_demographics_column,
+    parse_education_column,
+    parse_city_column,
+    extract_tech_skills_column,
 )
+from .parsers.keyword_matcher import SENIORITY_MATCHER, TECH_STACK_MATCHER
+from .dictionary_encoding import ParseMemo, parse_unique
 
 
-def extract_features(df: pd.DataFrame) -> pd.DataFrame:
-    """Извлекает признаки из резюме."""
-    features = {}
+def extract_features(df: pd.DataFrame, memo: Optional[ParseMemo] = None) -> pd.DataFrame:
+    """Извлекает признаки из резюме (векторизованно, по колонкам)."""
+    features_df = extract_dense_features(df, memo)
+    tech_features = extract_tech_skills_column(df[CSV_COLUMNS["position"]])
 
-    features["experience_months"] = df[CSV_COLUMNS["experience"]].apply(parse_experience)
-    features["salary_rub"] = df[CSV_COLUMNS["salary"]].apply(parse_salary)
+    return pd.concat([features_df, tech_features], axis=1)
 
-    demographics = df[CSV_COLUMNS["demographics"]].apply(parse_demographics)
-    features["age"] = demographics.apply(lambda x: x[0])
-    features["gender"] = demographics.apply(lambda x: x[1])
 
-    features["education_level"] = df[CSV_COLUMNS["education"]].apply(parse_education)
+def extract_skill_masks(df: pd.DataFrame, memo: Optional[ParseMemo] = None) -> np.ndarray:
+    """
+    Извлекает упакованные индикаторы навыков из должности.
 
-    city_features = df[CSV_COLUMNS["city"]].apply(parse_city)
-    features["city_million"] = city_features.apply(lambda x: x[0])
-    features["city_moscow"] = city_features.apply(lambda x: x[1])
-    features["city_spb"] = city_features.apply(lambda x: x[2])
+    Вернет:
+        Массив uint64, бит i соответствует навыку sorted(TECH_STACK)[i].
+    """
+    return parse_unique(
+        df[CSV_COLUMNS["position"]], TECH_STACK_MATCHER.match_column, memo, "tech_stack",
+    )
 
-    tech_features = df[CSV_COLUMNS["position"]].apply(extract_tech_skills)
-    for tech in sorted(TECH_STACK):
-        features[f"skill_{tech}"] = tech_features.apply(lambda x: int(tech in x))
 
-    return pd.DataFrame(features)
+def extract_dense_features(df: pd.DataFrame, memo: Optional[ParseMemo] = None) -> pd.DataFrame:
+    """
+    Извлекает плотные признаки FEATURE_NAMES (без индикаторов навыков).
+
+    Аргументы:
+        df: DataFrame с резюме.
+        memo: Персистентная память результатов парсинга (необязательно).
+    """
+    out = np.empty((len(df), len(FEATURE_NAMES)), dtype=np.float64)
+    fill_dense_features(df, out, memo)
+    return pd.DataFrame(out, index=df.index, columns=FEATURE_NAMES)
+
+
+def fill_dense_features(
+    df: pd.DataFrame,
+    out: np.ndarray,
+    memo: Optional[ParseMemo] = None,
+    experience_prefix: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Записывает плотные признаки FEATURE_NAMES в заранее выделенную матрицу.
+
+    Каждый парсер пишет результат прямо в свою колонку out, поэтому
+    промежуточные DataFrame не создаются. Колонки с небольшим числом
+    различных значений (зарплата, пол и возраст, образование, город)
+    разбираются словарным кодированием: парсер запускается только
+    на уникальных значениях.
+
+    Аргументы:
+        df: DataFrame с резюме.
+        out: Матрица формы (len(df), len(FEATURE_NAMES)); пропуски — NaN.
+        memo: Персистентная память результатов парсинга (необязательно).
+        experience_prefix: Разбирать только префикс колонки опыта такой длины.
+
+    Вернет:
+        Матрицу out.
+    """
+    column = {name: out[:, idx] for idx, name in enumerate(FEATURE_NAMES)}
+
+    column["experience_months"][:] = parse_experience_column(
+        df[CSV_COLUMNS["experience"]], max_chars=experience_prefix,
+    )
+    column["salary_rub"][:] = parse_unique(
+        df[CSV_COLUMNS["salary"]], parse_salary_column, memo, "salary",
+    )
 
+    column["age"][:], column["gender"][:] = parse_unique(
+        df[CSV_COLUMNS["demographics"]], parse_demographics_column, memo, "demographics",
+    )
 
-def create_target(df: pd.DataFrame) -> pd.Series:
-    """Создает целевую переменную (junior/middle/senior)."""
-    position_col = CSV_COLUMNS["position"]
-    experience_col = CSV_COLUMNS["experience"]
+    column["education_level"][:] = parse_unique(
+        df[CSV_COLUMNS["education"]], parse_education_column, memo, "education",
+    )
 
-    positions_lower = df[position_col].fillna("").str.lower()
+    (
+        column["city_million"][:],
+        column["city_moscow"][:],
+        column["city_spb"][:],
+    ) = parse_unique(df[CSV_COLUMNS["city"]], parse_city_column, memo, "city")
 
-    def label_seniority(row_idx: int) -> Optional[str]:
-        position = positions_lower.iloc[row_idx]
+    return out
 
-        for level, keywords in SENIORITY_KEYWORDS.items():
-            if any(keyword in position for keyword in keywords):
-                return level
 
-        experience_text = df[experience_col].iloc[row_idx]
-        experience_months = parse_experience(experience_text)
+def label_seniority_codes(df: pd.DataFrame, experience_months: np.ndarray) -> np.ndarray:
+    """
+    Векторно размечает уровень специалиста.
 
-        if pd.isna(experience_months):
-            return None
+    Сначала применяются ключевые слова уровней в должности (в порядке
+    SENIORITY_KEYWORDS), оставшиеся строки размечаются по опыту работы.
 
-        if experience_months < JUNIOR_MAX_EXPERIENCE_MONTHS:
-            return "junior"
-        elif experience_months < MIDDLE_MAX_EXPERIENCE_MONTHS:
-            return "middle"
-        else:
-            return "senior"
+    Аргументы:
+        df: DataFrame с резюме.
+        experience_months: Уже разобранный опыт работы в месяцах (NaN — нет данных).
 
-    return pd.Series(
-        [label_seniority(i) for i in range(len(df))],
-        index=df.index,
-        name=TARGET_COLUMN_NAME,
-    )
+    Вернет:
+        Массив int64 с индексами классов TARGET_CLASSES (-1 — уровень не определён).
+    """
+    position_masks = SENIORITY_MATCHER.match_column(df[CSV_COLUMNS["position"]])
+    experience_months = np.asarray(experience_months, dtype=np.float64)
+
+    conditions = [
+        (position_masks & np.uint64(SENIORITY_MATCHER.mask_of(keywords))) != 0
+        for keywords in SENIORITY_KEYWORDS.values()
+    ]
+    choices = [TARGET_CLASSES.index(level) for level in SENIORITY_KEYWORDS]
+
+    conditions += [
+        experience_months < JUNIOR_MAX_EXPERIENCE_MONTHS,
+        experience_months < MIDDLE_MAX_EXPERIENCE_MONTHS,
+        experience_months >= MIDDLE_MAX_EXPERIENCE_MONTHS,
+    ]
+    choices += [TARGET_CLASSES.index(level) for level in ("junior", "middle", "senior")]
+
+    return np.select(conditions, choices, default=-1).astype(np.int64)
+
+
+def create_target(df: pd.DataFrame) -> pd.Series:
+    """Создает целевую переменную (junior/middle/senior)."""
+    experience_months = parse_experience_column(df[CSV_COLUMNS["experience"]]).to_numpy()
+    codes = label_seniority_codes(df, experience_months)
+
+    labels = np.array(TARGET_CLASSES + [None], dtype=object)[codes]
+    return pd.Series(labels, index=df.index, name=TARGET_COLUMN_NAME)
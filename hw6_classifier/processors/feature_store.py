@@ -0,0 +1,349 @@
+"""
+Инкрементальное хранилище признаков с дедупликацией строк.
+
+Хранилище накапливает признаки из последовательных выгрузок резюме.
+Для каждой прочитанной строки CSV вычисляется хэш её значений; строки,
+уже встречавшиеся в прошлых выгрузках (в том числе отброшенные фильтром
+или из-за пропусков), пропускаются до извлечения признаков. Признаки новых
+строк дописываются отдельным сегментом, поэтому стоимость обновления
+зависит от размера прироста, а не от размера истории: хэши новых строк
+каждого обновления тоже пишутся отдельным отсортированным файлом, а файлы
+хэшей объединяются лишь изредка, когда их становится больше MAX_SEEN_FILES.
+
+Структура директории:
+    store.json        — версия схемы признаков и настройки, списки сегментов и файлов хэшей
+    seen_NNNNN.npy    — отсортированные хэши строк, впервые просмотренных
+                        в одном обновлении (или в объединённых обновлениях)
+    seg_NNNNN/        — сегмент в формате save_processed_data
+                        и хэши его строк (row_hashes.npy)
+"""
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from hw6_classifier.config import TARGET_CLASSES
+from .data_processor import ResumeDataProcessor
+from .feature_cache import PACKAGE_DIR, file_digest
+from .parallel import split_frames
+from .processed_data import ProcessedData
+from .storage import load_processed_data, save_processed_data
+
+logger = logging.getLogger(__name__)
+
+STORE_FILE = "store.json"
+ROW_HASHES_FILE = "row_hashes.npy"
+
+# Версия схемы признаков хранилища. Увеличивается при изменениях извлечения
+# признаков, несовместимых с уже накопленными сегментами: в отличие от кэша,
+# историю хранилища нельзя восстановить из ежедневных выгрузок.
+FEATURE_SCHEMA_VERSION = 1
+
+# Количество файлов хэшей, при превышении которого они объединяются в один
+MAX_SEEN_FILES = 16
+CONSTANTS_PATH = PACKAGE_DIR / "config" / "constants.py"
+
+
+def schema_version() -> str:
+    """Возвращает версию схемы признаков: FEATURE_SCHEMA_VERSION и хэш констант."""
+    return f"{FEATURE_SCHEMA_VERSION}:{file_digest(CONSTANTS_PATH)[:16]}"
+
+
+def hash_rows(df: pd.DataFrame) -> np.ndarray:
+    """
+    Вычисляет хэш каждой строки по значениям колонок.
+
+    Колонки упорядочиваются по имени, поэтому хэш не зависит от порядка
+    колонок в выгрузке.
+
+    Вернет:
+        Массив uint64 длины len(df).
+    """
+    return pd.util.hash_pandas_object(df[sorted(df.columns)], index=False).to_numpy(np.uint64)
+
+
+class FeatureStore:
+    """
+    Хранилище признаков, пополняемое только новыми строками.
+
+    Атрибуты:
+        store_dir: Директория хранилища.
+        last_update: Статистика последнего обновления (строки прочитаны,
+            новые строки, дубликаты, добавленные образцы).
+    """
+
+    def __init__(
+        self, store_dir: Path, options: Optional[dict] = None, rebuild: bool = False,
+    ) -> None:
+        """
+        Открывает хранилище.
+
+        Накопленная история не удаляется неявно: при смене версии схемы
+        признаков (schema_version) или настроек обработки хранилище
+        пересоздаётся только при rebuild.
+
+        Аргументы:
+            store_dir: Директория хранилища (создаётся при отсутствии).
+            options: Настройки обработки (ResumeDataProcessor.options).
+            rebuild: Удалить содержимое хранилища и начать его заново.
+
+        Исключения:
+            ValueError: Если директория не пуста и не содержит store.json
+                или схема признаков либо настройки изменились без rebuild.
+        """
+        self.store_dir = Path(store_dir)
+        if (
+            self.store_dir.is_dir()
+            and not (self.store_dir / STORE_FILE).exists()
+            and any(self.store_dir.iterdir())
+        ):
+            raise ValueError(
+                f"Директория {self.store_dir} не пуста и не является хранилищем признаков"
+            )
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.last_update: dict[str, int] = {}
+        self._options = options or {}
+
+        self._state = self._read_state()
+        if not self._state:
+            self._reset()
+        elif rebuild:
+            logger.info(f"  ! Хранилище признаков {self.store_dir} пересоздаётся")
+            self._reset()
+        elif (
+            self._state.get("schema_version") != schema_version()
+            or self._state.get("options", {}) != self._options
+        ):
+            raise ValueError(
+                f"Схема признаков или настройки обработки хранилища {self.store_dir} изменились; "
+                "чтобы удалить накопленные сегменты и начать заново, запустите с --rebuild-feature-store"
+            )
+
+    @property
+    def n_segments(self) -> int:
+        """Возвращает количество сегментов."""
+        return len(self._state["segments"])
+
+    def seen_hashes(self) -> list[np.ndarray]:
+        """Возвращает хэши просмотренных строк: отсортированный массив на файл."""
+        return [
+            np.load(self.store_dir / name, mmap_mode="r") for name in self._state["seen_files"]
+        ]
+
+    def update(
+        self,
+        csv_path: str,
+        processor: ResumeDataProcessor,
+        chunksize: Optional[int] = None,
+        prefilter: bool = False,
+        feature_workers: int = 1,
+    ) -> int:
+        """
+        Дописывает в хранилище признаки строк, которых ещё не было.
+
+        Аргументы:
+            csv_path: Путь к CSV-файлу с новой выгрузкой.
+            processor: Процессор, извлекающий признаки.
+            chunksize: Количество строк CSV в одном чанке.
+            prefilter: Предварительно отбирать IT-разработчиков по должности.
+            feature_workers: Количество процессов для извлечения признаков.
+
+        Вернет:
+            Количество добавленных образцов.
+        """
+        seen = self.seen_hashes()
+        new_hashes: list[np.ndarray] = []
+        stats = {"rows": 0, "new_rows": 0, "duplicates": 0, "added": 0}
+
+        frames = self._new_rows(
+            processor.read_frames(csv_path, chunksize=chunksize, prefilter=prefilter),
+            seen,
+            new_hashes,
+            stats,
+        )
+        if feature_workers > 1 and chunksize is None:
+            frames = split_frames(frames, feature_workers)
+
+        parts = []
+        results = processor.featurize_frames(frames, feature_workers)
+        for n_developers, x_part, skill_part, y_part, row_hashes, text_part in results:
+            if n_developers and len(y_part):
+                parts.append((x_part, skill_part, y_part, row_hashes, text_part))
+
+        stats["added"] = sum(len(part[2]) for part in parts)
+        self.last_update = stats
+
+        if not new_hashes:
+            return 0
+
+        if parts:
+            self._append_segment(parts, processor, csv_path)
+
+        self._write_seen(np.sort(np.concatenate(new_hashes)))
+        return stats["added"]
+
+    def load(self) -> Optional[ProcessedData]:
+        """
+        Загружает все сегменты хранилища одним набором данных.
+
+        Вернет:
+            Объединённые данные или None, если хранилище пусто.
+        """
+        segments = [
+            load_processed_data(self.store_dir / name, mmap_mode="r")
+            for name in self._state["segments"]
+        ]
+        if not segments:
+            return None
+        return segments[0] if len(segments) == 1 else ProcessedData.concat(segments)
+
+    def _new_rows(
+        self,
+        frames: Iterator[pd.DataFrame],
+        seen: list[np.ndarray],
+        new_hashes: list[np.ndarray],
+        stats: dict[str, int],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Оставляет в DataFrame'ах только строки, не встречавшиеся ранее.
+
+        Индекс возвращаемых DataFrame'ов заменяется хэшами строк, чтобы
+        после извлечения признаков сохранить их рядом с признаками.
+        Хэши новых строк добавляются в new_hashes.
+        """
+        run_seen: set[int] = set()
+
+        for df in frames:
+            hashes = hash_rows(df)
+            stats["rows"] += len(df)
+
+            is_new = np.ones(len(hashes), dtype=bool)
+            for seen_part in seen:
+                is_new &= ~_contains_sorted(seen_part, hashes)
+            is_new &= ~pd.Series(hashes).duplicated().to_numpy()
+            if run_seen:
+                candidates = np.flatnonzero(is_new)
+                is_new[candidates] = [int(h) not in run_seen for h in hashes[candidates]]
+
+            fresh = hashes[is_new]
+            stats["new_rows"] += len(fresh)
+            stats["duplicates"] += len(df) - len(fresh)
+
+            if not len(fresh):
+                continue
+
+            run_seen.update(fresh.tolist())
+            new_hashes.append(fresh)
+
+            delta = df[is_new]
+            delta.index = pd.Index(fresh)
+            yield delta
+
+    def _append_segment(
+        self, parts: list[tuple], processor: ResumeDataProcessor, csv_path: str,
+    ) -> None:
+        """Записывает новый сегмент и регистрирует его в store.json."""
+        x_parts, skill_parts, y_parts, hash_parts, text_parts = zip(*parts)
+        data = ProcessedData(
+            X=np.concatenate(x_parts),
+            y=np.concatenate(y_parts),
+            feature_names=processor.feature_names,
+            class_names=list(TARGET_CLASSES),
+            skill_mask=np.concatenate(skill_parts),
+            text_features=None if text_parts[0] is None else sp.vstack(text_parts, format="csr"),
+        )
+
+        name = f"seg_{self._state['next_id']:05d}"
+        segment_dir = save_processed_data(
+            data, self.store_dir / name, extra_meta={"source": str(Path(csv_path).resolve())},
+        )
+        np.save(segment_dir / ROW_HASHES_FILE, np.concatenate(hash_parts).astype(np.uint64))
+
+        self._state["segments"].append(name)
+        self._state["next_id"] += 1
+
+    def _write_seen(self, hashes: np.ndarray) -> None:
+        """
+        Сохраняет отсортированные хэши новых строк отдельным файлом
+        и фиксирует состояние хранилища.
+
+        Если файлов хэшей становится больше MAX_SEEN_FILES, они
+        объединяются в один, поэтому проверка строки остаётся
+        ограниченным числом двоичных поисков, а полная перезапись
+        хэшей выполняется раз в MAX_SEEN_FILES обновлений.
+        """
+        seen_files = self._state["seen_files"] + [self._next_seen_file(hashes)]
+        old_files: list[str] = []
+        if len(seen_files) > MAX_SEEN_FILES:
+            merged = np.unique(np.concatenate([
+                np.load(self.store_dir / name, mmap_mode="r") for name in seen_files
+            ]))
+            old_files, seen_files = seen_files, [self._next_seen_file(merged)]
+
+        self._state["seen_files"] = seen_files
+        self._write_state()
+
+        for name in old_files:
+            (self.store_dir / name).unlink(missing_ok=True)
+
+    def _next_seen_file(self, hashes: np.ndarray) -> str:
+        """Записывает отсортированные хэши в новый файл и возвращает его имя."""
+        seen_file = f"seen_{self._state['next_id']:05d}.npy"
+        np.save(self.store_dir / seen_file, hashes.astype(np.uint64))
+        self._state["next_id"] += 1
+        return seen_file
+
+    def _read_state(self) -> dict:
+        """Читает store.json."""
+        state_path = self.store_dir / STORE_FILE
+        if not state_path.exists():
+            return {}
+        try:
+            return json.loads(state_path.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+
+    def _write_state(self) -> None:
+        """Атомарно записывает store.json."""
+        tmp_path = self.store_dir / (STORE_FILE + ".tmp")
+        tmp_path.write_text(json.dumps(self._state, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.store_dir / STORE_FILE)
+
+    def _reset(self) -> None:
+        """
+        Удаляет сегменты и хэши, перечисленные в store.json, и начинает
+        хранилище заново. Другие файлы директории не затрагиваются.
+        """
+        for name in self._state.get("segments", []):
+            shutil.rmtree(self.store_dir / name, ignore_errors=True)
+        seen_files = self._state.get("seen_files", [])
+        if self._state.get("seen_file"):
+            seen_files = seen_files + [self._state["seen_file"]]
+        for name in seen_files:
+            (self.store_dir / name).unlink(missing_ok=True)
+
+        self._state = {
+            "schema_version": schema_version(),
+            "options": self._options,
+            "segments": [],
+            "seen_files": [],
+            "next_id": 0,
+        }
+        self._write_state()
+
+
+def _contains_sorted(sorted_values: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Проверяет вхождение значений в отсортированный массив двоичным поиском."""
+    if not len(sorted_values):
+        return np.zeros(len(values), dtype=bool)
+
+    positions = np.searchsorted(sorted_values, values)
+    positions[positions == len(sorted_values)] = 0
+    return np.asarray(sorted_values[positions] == values)
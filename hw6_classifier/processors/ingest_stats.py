@@ -0,0 +1,277 @@
+"""
+Потоковая статистика данных, собираемая во время загрузки.
+
+Статистика накапливается по чанкам без хранения строк: доли пропусков
+считаются счётчиками, квантили признаков — KLL-подобным скетчем
+с ограниченной памятью. Скетчи и счётчики объединяются (merge), поэтому
+статистика шардов, обработанных в разных процессах, сводится в одну
+без повторного прохода по данным.
+"""
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from hw6_classifier.config import CSV_COLUMNS, FEATURE_NAMES, TARGET_CLASSES
+from .parsers.keyword_matcher import mask_bits
+
+SKETCH_CAPACITY = 200
+QUANTILE_FEATURES: tuple[str, ...] = ("experience_months", "salary_rub", "age")
+REPORT_QUANTILES: tuple[float, ...] = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """
+    KLL-подобный скетч квантилей.
+
+    Значения хранятся в уровнях; элемент уровня h представляет 2**h
+    исходных значений. Переполненный уровень сортируется и сжимается:
+    в следующий уровень переходит каждый второй элемент со случайным
+    сдвигом. Вместимость уровней убывает геометрически к нижним уровням,
+    поэтому память ограничена O(capacity) при ранговой ошибке порядка
+    1 / capacity. Количество, сумма, минимум и максимум точные.
+    """
+
+    def __init__(self, capacity: int = SKETCH_CAPACITY, seed: int = 0) -> None:
+        """
+        Инициализирует пустой скетч.
+
+        Аргументы:
+            capacity: Вместимость верхнего уровня.
+            seed: Зерно генератора сдвигов при сжатии.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> None:
+        """Добавляет значения (пропуски NaN игнорируются)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Добавляет в скетч значения другого скетча."""
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for level, items in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._compress()
+
+    def quantiles(self, qs: Sequence[float]) -> list[float]:
+        """
+        Оценивает квантили.
+
+        Вернет:
+            Список оценок (NaN для пустого скетча).
+        """
+        if not self.count:
+            return [float("nan")] * len(qs)
+
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level_items), 2.0 ** level)
+            for level, level_items in enumerate(self._levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        ranks = np.cumsum(weights[order])
+        positions = np.searchsorted(ranks, np.asarray(qs) * ranks[-1], side="left")
+        return items[order][np.minimum(positions, len(items) - 1)].tolist()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Возвращает сводку скетча: количество, среднее, границы и квантили."""
+        if not self.count:
+            return {"count": 0}
+
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "max": self.max,
+            "quantiles": dict(zip(map(str, REPORT_QUANTILES), self.quantiles(REPORT_QUANTILES))),
+        }
+
+    def _level_capacity(self, level: int) -> int:
+        """Вместимость уровня: верхний уровень вмещает capacity элементов."""
+        depth = len(self._levels) - 1 - level
+        return max(2, int(np.ceil(self.capacity * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        """Сжимает переполненные уровни снизу вверх."""
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._level_capacity(level):
+                items = np.sort(items)
+                n_pairs = len(items) // 2
+                offset = int(self._rng.integers(2))
+                promoted = items[offset: 2 * n_pairs: 2]
+
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype=np.float64))
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+                self._levels[level] = items[2 * n_pairs:]
+            level += 1
+
+
+class IngestStatistics:
+    """
+    Статистика загрузки данных, собираемая за один проход.
+
+    При предварительном отборе по должности все строки CSV видит только
+    проход по колонке должности (observe_scan): по нему считаются rows
+    и пропуски должности, а пропуски остальных колонок — по read_rows
+    строкам, прошедшим отбор.
+
+    Атрибуты:
+        rows: Количество строк CSV.
+        read_rows: Количество строк, прочитанных со всеми колонками
+            (меньше rows при предварительном отборе).
+        prefiltered: Выполнялся ли предварительный отбор по должности.
+        developers: Количество резюме IT-разработчиков.
+        near_duplicates: Количество удалённых близких дубликатов.
+        samples: Количество образцов с признаками и меткой.
+        null_counts: Количество пропусков в каждой колонке CSV.
+        class_counts: Количество образцов каждого класса (по TARGET_CLASSES).
+        skill_counts: Количество образцов с каждым навыком.
+        sketches: Скетчи квантилей признаков QUANTILE_FEATURES.
+    """
+
+    def __init__(self, n_skills: int = 0) -> None:
+        """
+        Инициализирует пустую статистику.
+
+        Аргументы:
+            n_skills: Количество навыков в упакованных масках.
+        """
+        self.rows = 0
+        self.read_rows = 0
+        self.prefiltered = False
+        self.developers = 0
+        self.near_duplicates = 0
+        self.samples = 0
+        self.null_counts: dict[str, int] = {}
+        self.class_counts = np.zeros(len(TARGET_CLASSES), dtype=np.int64)
+        self.skill_counts = np.zeros(n_skills, dtype=np.int64)
+        self.sketches = {name: QuantileSketch() for name in QUANTILE_FEATURES}
+
+    def observe_scan(self, positions: pd.Series) -> None:
+        """Учитывает чанк прохода предварительного отбора по колонке должности."""
+        self.prefiltered = True
+        self.rows += len(positions)
+        column = CSV_COLUMNS["position"]
+        self.null_counts[column] = self.null_counts.get(column, 0) + int(positions.isna().sum())
+
+    def observe_frame(self, df: pd.DataFrame) -> None:
+        """Учитывает прочитанный чанк CSV: строки и пропуски по колонкам."""
+        self.read_rows += len(df)
+        if not self.prefiltered:
+            self.rows += len(df)
+        for column, n_null in df.isna().sum().items():
+            if self.prefiltered and column == CSV_COLUMNS["position"]:
+                continue
+            self.null_counts[column] = self.null_counts.get(column, 0) + int(n_null)
+
+    def observe_samples(
+        self,
+        n_developers: int,
+        X: Optional[np.ndarray],
+        skill_mask: Optional[np.ndarray],
+        y: Optional[np.ndarray],
+    ) -> None:
+        """
+        Учитывает результат извлечения признаков из чанка.
+
+        Аргументы:
+            n_developers: Количество IT-разработчиков в чанке.
+            X: Плотные признаки образцов (None, если разработчиков нет).
+            skill_mask: Упакованные маски навыков образцов.
+            y: Закодированные метки образцов.
+        """
+        self.developers += n_developers
+        if y is None or not len(y):
+            return
+
+        self.samples += len(y)
+        self.class_counts += np.bincount(y, minlength=len(self.class_counts))
+        for name, sketch in self.sketches.items():
+            sketch.update(X[:, FEATURE_NAMES.index(name)])
+        if skill_mask is not None and len(self.skill_counts):
+            self.skill_counts += mask_bits(skill_mask, len(self.skill_counts)).sum(axis=0, dtype=np.int64)
+
+    def merge(self, other: "IngestStatistics") -> None:
+        """Добавляет статистику другого прохода (например, другого шарда)."""
+        self.rows += other.rows
+        self.read_rows += other.read_rows
+        self.prefiltered = self.prefiltered or other.prefiltered
+        self.developers += other.developers
+        self.near_duplicates += other.near_duplicates
+        self.samples += other.samples
+        for column, n_null in other.null_counts.items():
+            self.null_counts[column] = self.null_counts.get(column, 0) + n_null
+        self.class_counts += other.class_counts
+        if not len(self.skill_counts):
+            self.skill_counts = np.zeros_like(other.skill_counts)
+        self.skill_counts += other.skill_counts
+        for name, sketch in self.sketches.items():
+            sketch.merge(other.sketches[name])
+
+    def to_dict(self, skill_names: Sequence[str] = ()) -> dict[str, Any]:
+        """
+        Формирует отчёт для сохранения в JSON.
+
+        Доля пропусков должности считается по всем строкам, остальных
+        колонок — по прочитанным (read_rows): при предварительном отборе
+        это доли среди IT-разработчиков.
+
+        Аргументы:
+            skill_names: Названия навыков в порядке битов масок.
+        """
+        def rate(count: int, total: int) -> float:
+            return count / total if total else 0.0
+
+        checked = self.developers + self.near_duplicates
+        columns = {name: column for name, column in CSV_COLUMNS.items() if column in self.null_counts}
+        return {
+            "filters": {
+                "rows": self.rows,
+                "prefiltered": self.prefiltered,
+                "read_rows": self.read_rows,
+                "developers": checked,
+                "developer_rate": rate(checked, self.rows),
+                "near_duplicates": self.near_duplicates,
+                "samples": self.samples,
+                "sample_rate": rate(self.samples, self.developers),
+            },
+            "null_rates": {
+                name: rate(
+                    self.null_counts[column], self.rows if name == "position" else self.read_rows,
+                )
+                for name, column in columns.items()
+            },
+            "class_counts": dict(zip(TARGET_CLASSES, self.class_counts.tolist())),
+            "features": {name: sketch.to_dict() for name, sketch in self.sketches.items()},
+            "skill_frequencies": {
+                name: rate(int(count), self.samples)
+                for name, count in sorted(
+                    zip(skill_names, self.skill_counts), key=lambda item: -item[1]
+                )
+            },
+        }
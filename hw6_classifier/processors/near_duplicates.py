@@ -0,0 +1,211 @@
+"""
+Удаление близких дубликатов резюме (MinHash + LSH).
+
+Для каждого резюме по тексту должности и опыта строится множество
+шинглов (последовательностей из SHINGLE_SIZE слов) и его MinHash-сигнатура.
+Сигнатура делится на полосы; резюме с совпадающей полосой становятся
+кандидатами в дубликаты, и кандидат удаляется, если доля совпадающих
+компонент сигнатуры (оценка коэффициента Жаккара) с уже оставленным
+резюме не ниже порога. Поиск кандидатов выполняется словарями по полосам,
+поэтому время работы почти линейно по числу резюме.
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from hw6_classifier.config import CSV_COLUMNS, NEAR_DUPLICATE_THRESHOLD
+from .parsers.text_column import join_text_columns
+
+NUM_PERMUTATIONS = 64
+NUM_BANDS = 16
+SHINGLE_SIZE = 3
+
+# Резюме с меньшим числом шинглов слишком коротки для сравнения и не удаляются
+MIN_SHINGLES = 10
+
+# Множители для объединения хэшей слов в хэш шингла (нечётные 64-битные константы)
+SHINGLE_MULTIPLIERS = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9], dtype=np.uint64
+)
+
+
+def _row_texts(df: pd.DataFrame) -> pd.Series:
+    """Объединяет должность и опыт в один текст для сравнения."""
+    columns = [CSV_COLUMNS[name] for name in ("position", "experience")]
+    return join_text_columns(df, columns).str.lower()
+
+
+def shingle_hashes(texts: pd.Series, shingle_size: int = SHINGLE_SIZE) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Вычисляет хэши словесных шинглов для каждого текста.
+
+    Текст короче shingle_size слов даёт один шингл из всех своих слов,
+    пустой текст шинглов не имеет.
+
+    Вернет:
+        Кортеж (хэши шинглов всех текстов подряд, число шинглов каждого текста).
+    """
+    tokens = texts.str.split()
+    n_tokens = tokens.str.len().fillna(0).to_numpy(dtype=np.int64)
+    flat = tokens.explode().dropna().to_numpy(dtype=object)
+    token_hashes = pd.util.hash_array(flat) if len(flat) else np.empty(0, dtype=np.uint64)
+
+    row_ids = np.repeat(np.arange(len(n_tokens)), n_tokens)
+    row_starts = np.cumsum(n_tokens) - n_tokens
+    positions = np.arange(len(token_hashes)) - row_starts[row_ids]
+
+    combined = np.zeros(len(token_hashes), dtype=np.uint64)
+    for offset in range(shingle_size):
+        shifted = np.zeros(len(token_hashes), dtype=np.uint64)
+        shifted[: len(token_hashes) - offset] = token_hashes[offset:]
+        same_row = positions + offset < n_tokens[row_ids]
+        combined += np.where(same_row, shifted, 0) * SHINGLE_MULTIPLIERS[offset % len(SHINGLE_MULTIPLIERS)]
+
+    n_shingles = np.where(n_tokens > 0, np.maximum(n_tokens - shingle_size + 1, 1), 0)
+    is_start = positions < n_shingles[row_ids]
+    return combined[is_start], n_shingles
+
+
+class NearDuplicateFilter:
+    """
+    Потоковый фильтр близких дубликатов.
+
+    Состояние (полосы сигнатур оставленных резюме) сохраняется между
+    вызовами, поэтому дубликаты находятся и между чанками. Из каждой
+    группы близких резюме остаётся первое встреченное. Резюме короче
+    MIN_SHINGLES шинглов всегда остаются.
+
+    Состояние не передаётся в другие процессы: копия фильтра, полученная
+    через pickle, начинает с пустого состояния, поэтому при параллельной
+    обработке шардов дубликаты ищутся внутри каждого шарда.
+
+    Атрибуты:
+        threshold: Минимальная оценка сходства для удаления кандидата.
+        n_seen: Количество проверенных резюме.
+        n_removed: Количество удалённых дубликатов.
+        seconds: Суммарное время работы фильтра.
+    """
+
+    def __init__(
+        self,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        num_permutations: int = NUM_PERMUTATIONS,
+        num_bands: int = NUM_BANDS,
+        seed: int = 0,
+    ) -> None:
+        """
+        Инициализирует фильтр.
+
+        Исключения:
+            ValueError: Если порог вне (0, 1] или число перестановок
+                не делится на число полос.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Порог сходства должен быть в (0, 1]: {threshold}")
+        if num_permutations % num_bands:
+            raise ValueError("Число перестановок должно делиться на число полос")
+
+        self.threshold = threshold
+        self._min_matches = int(np.ceil(threshold * num_permutations))
+        self.n_seen = 0
+        self.n_removed = 0
+        self.seconds = 0.0
+
+        rng = np.random.default_rng(seed)
+        self._mult = rng.integers(1, 2**63, num_permutations, dtype=np.uint64) | np.uint64(1)
+        self._add = rng.integers(0, 2**63, num_permutations, dtype=np.uint64)
+        self._band_size = num_permutations // num_bands
+        self._band_weights = rng.integers(1, 2**63, self._band_size, dtype=np.uint64) | np.uint64(1)
+
+        self._buckets: list[dict[int, int]] = [{} for _ in range(num_bands)]
+        self._signatures: list[np.ndarray] = []
+
+    def __getstate__(self) -> dict:
+        """Сериализует фильтр без накопленного состояния."""
+        state = self.__dict__.copy()
+        state["_buckets"] = [{} for _ in self._buckets]
+        state["_signatures"] = []
+        return state
+
+    def empty_copy(self) -> "NearDuplicateFilter":
+        """Возвращает фильтр с теми же параметрами и пустым состоянием."""
+        empty = NearDuplicateFilter.__new__(NearDuplicateFilter)
+        empty.__dict__.update(self.__getstate__())
+        empty.n_seen = empty.n_removed = 0
+        empty.seconds = 0.0
+        return empty
+
+    def signatures(self, texts: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Вычисляет MinHash-сигнатуры текстов.
+
+        Вернет:
+            Кортеж (матрица uint32 формы (len(texts), num_permutations),
+            число шинглов каждого текста); строки текстов без шинглов
+            заполнены максимальным значением.
+        """
+        hashes, n_shingles = shingle_hashes(texts)
+        signatures = np.full((len(texts), len(self._mult)), np.iinfo(np.uint32).max, dtype=np.uint32)
+
+        has_shingles = n_shingles > 0
+        if not has_shingles.any():
+            return signatures, n_shingles
+
+        starts = (np.cumsum(n_shingles) - n_shingles)[has_shingles]
+        for idx, (mult, add) in enumerate(zip(self._mult, self._add)):
+            permuted = ((hashes * mult + add) >> np.uint64(32)).astype(np.uint32)
+            signatures[has_shingles, idx] = np.minimum.reduceat(permuted, starts)
+        return signatures, n_shingles
+
+    def keep_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Определяет, какие резюме оставить.
+
+        Аргументы:
+            df: DataFrame с колонками должности и опыта.
+
+        Вернет:
+            Булев массив: False для близких дубликатов ранее оставленных резюме.
+        """
+        start_time = time.perf_counter()
+
+        signatures, n_shingles = self.signatures(_row_texts(df))
+        band_keys = self._band_keys(signatures)
+        keep = np.ones(len(df), dtype=bool)
+
+        for row, keys in enumerate(band_keys.tolist()):
+            if n_shingles[row] < MIN_SHINGLES:
+                continue
+            if self._is_duplicate(signatures[row], keys):
+                keep[row] = False
+                continue
+
+            rep_id = len(self._signatures)
+            self._signatures.append(signatures[row])
+            for buckets, key in zip(self._buckets, keys):
+                buckets.setdefault(key, rep_id)
+
+        self.n_seen += len(df)
+        self.n_removed += int((~keep).sum())
+        self.seconds += time.perf_counter() - start_time
+        return keep
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Вычисляет хэш каждой полосы сигнатуры: матрица (n_rows, num_bands)."""
+        bands = signatures.astype(np.uint64).reshape(len(signatures), -1, self._band_size)
+        return (bands * self._band_weights).sum(axis=2, dtype=np.uint64)
+
+    def _is_duplicate(self, signature: np.ndarray, keys: list[int]) -> bool:
+        """Проверяет кандидатов из совпавших полос по оценке сходства."""
+        checked: set[int] = set()
+        for buckets, key in zip(self._buckets, keys):
+            rep_id: Optional[int] = buckets.get(key)
+            if rep_id is None or rep_id in checked:
+                continue
+            checked.add(rep_id)
+            if np.count_nonzero(self._signatures[rep_id] == signature) >= self._min_matches:
+                return True
+        return False
@@ -0,0 +1,60 @@
+"""Параллельная обработка данных в пуле процессов с сохранением порядка."""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+import numpy as np
+import pandas as pd
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    n_workers: int,
+    max_pending: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple = (),
+) -> Iterator[R]:
+    """
+    Применяет функцию к элементам в пуле процессов.
+
+    В отличие от Executor.map, элементы отправляются в пул по мере
+    освобождения мест, поэтому в памяти одновременно находится не более
+    max_pending входных элементов. Результаты возвращаются в исходном порядке.
+
+    Аргументы:
+        func: Функция модуля или partial от неё с небольшими аргументами:
+            она сериализуется pickle вместе с каждой задачей, поэтому
+            связанные методы и крупное состояние сюда не передаются.
+        items: Итерируемый источник элементов, в том числе ленивый.
+        n_workers: Количество процессов.
+        max_pending: Максимум задач в обработке (по умолчанию 2 * n_workers).
+        initializer: Функция, вызываемая один раз при запуске каждого процесса;
+            через неё процессы получают общее состояние задач.
+        initargs: Аргументы initializer (сериализуются один раз на процесс).
+    """
+    max_pending = max_pending or 2 * n_workers
+    pending: deque[Future] = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=initializer, initargs=initargs,
+    ) as executor:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def split_frames(frames: Iterable[pd.DataFrame], n_parts: int) -> Iterator[pd.DataFrame]:
+    """Делит каждый DataFrame на n_parts последовательных частей по строкам."""
+    for df in frames:
+        for bounds in np.array_split(np.arange(len(df)), n_parts):
+            if len(bounds):
+                yield df.iloc[bounds[0]:bounds[-1] + 1]
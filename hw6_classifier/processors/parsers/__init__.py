@@ -1,17 +1,25 @@
 """Пакет парсеров для обработки данных резюме."""
 
-from .experience_parser import parse_experience
-from .salary_parser import parse_salary
-from .demographics_parser import parse_demographics
-from .education_parser import parse_education
-from .city_parser import parse_city
-from .tech_skills_parser import extract_tech_skills
+from .keyword_matcher import KeywordMatcher
+from .experience_parser import parse_experience, parse_experience_column
+from .salary_parser import parse_salary, parse_salary_column
+from .demographics_parser import parse_demographics, parse_demographics_column
+from .education_parser import parse_education, parse_education_column
+from .city_parser import parse_city, parse_city_column
+from .tech_skills_parser import extract_tech_skills, extract_tech_skills_column
 
 __all__ = [
+    "KeywordMatcher",
     "parse_experience",
     "parse_salary",
     "parse_demographics",
     "parse_education",
     "parse_city",
     "extract_tech_skills",
+    "parse_experience_column",
+    "parse_salary_column",
+    "parse_demographics_column",
+    "parse_education_column",
+    "parse_city_column",
+    "extract_tech_skills_column",
 ]
@@ -2,9 +2,15 @@
 
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
-from hw6_classifier.config import MAJOR_CITIES
+from hw6_classifier.config import MAJOR_CITIES, MOSCOW_CITY_NAMES, SPB_CITY_NAMES
+from .keyword_matcher import CITY_MATCHER
+
+MAJOR_CITY_MASK = CITY_MATCHER.mask_of(MAJOR_CITIES)
+MOSCOW_MASK = CITY_MATCHER.mask_of(MOSCOW_CITY_NAMES)
+SPB_MASK = CITY_MATCHER.mask_of(SPB_CITY_NAMES)
 
 
 def parse_city(text: str) -> Tuple[int, int, int]:
@@ -17,15 +23,26 @@ def parse_city(text: str) -> Tuple[int, int, int]:
     if pd.isna(text) or not isinstance(text, str):
         return (0, 0, 0)
 
-    text_lower = text.lower()
+    found = CITY_MATCHER.match(text)
 
-    is_moscow = int("москва" in text_lower or "moscow" in text_lower)
-    is_spb = int(
-        "санкт-петербург" in text_lower
-        or "петербург" in text_lower
-        or "saint petersburg" in text_lower
-    )
+    is_moscow = int(bool(found & MOSCOW_MASK))
+    is_spb = int(bool(found & SPB_MASK))
 
-    is_major_city = int(any(city in text_lower for city in MAJOR_CITIES))
+    is_major_city = int(bool(found & MAJOR_CITY_MASK))
 
     return (is_major_city, is_moscow, is_spb)
+
+
+def parse_city_column(texts: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    Векторизованная версия parse_city для целой колонки.
+
+    Вернет:
+        Кортеж целочисленных колонок (город-миллионник, Москва, СПб).
+    """
+    found = CITY_MATCHER.match_column(texts)
+
+    return tuple(
+        pd.Series((found & np.uint64(mask) != 0).astype(int), index=texts.index)
+        for mask in (MAJOR_CITY_MASK, MOSCOW_MASK, SPB_MASK)
+    )
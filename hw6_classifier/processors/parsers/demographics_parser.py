@@ -3,8 +3,15 @@
 import re
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .text_column import as_text_column, contains_any
+
+AGE_PATTERN = r"(\d+)\s*(?:год|лет|года|year)"
+MALE_MARKERS = ("мужчина", "муж", "male")
+FEMALE_MARKERS = ("женщина", "жен", "female")
+
 
 def parse_demographics(text: str) -> Tuple[Optional[int], Optional[int]]:
     """
@@ -18,13 +25,32 @@ def parse_demographics(text: str) -> Tuple[Optional[int], Optional[int]]:
 
     text_lower = text.lower()
 
-    age_match = re.search(r"(\d+)\s*(?:год|лет|года|year)", text_lower)
+    age_match = re.search(AGE_PATTERN, text_lower)
     age = int(age_match.group(1)) if age_match else None
 
     gender = None
-    if "мужчина" in text_lower or "муж" in text_lower or "male" in text_lower:
+    if any(marker in text_lower for marker in MALE_MARKERS):
         gender = 1
-    elif "женщина" in text_lower or "жен" in text_lower or "female" in text_lower:
+    elif any(marker in text_lower for marker in FEMALE_MARKERS):
         gender = 0
 
     return (age, gender)
+
+
+def parse_demographics_column(texts: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Векторизованная версия parse_demographics для целой колонки.
+
+    Вернет:
+        Кортеж колонок float (возраст, пол) с NaN для ненайденных значений.
+    """
+    texts_lower = as_text_column(texts).str.lower()
+
+    age = texts_lower.str.extract(AGE_PATTERN, expand=False).astype(float)
+
+    gender = np.select(
+        [contains_any(texts_lower, MALE_MARKERS), contains_any(texts_lower, FEMALE_MARKERS)],
+        [1.0, 0.0],
+        default=np.nan,
+    )
+    return age, pd.Series(gender, index=texts.index)
@@ -2,9 +2,20 @@
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from hw6_classifier.config import EDUCATION_LEVELS
+from .keyword_matcher import EDUCATION_MATCHER
+from .text_column import is_text
+
+DEFAULT_EDUCATION_LEVEL = 3
+
+# Пары (маска уровня, код уровня) в порядке проверки EDUCATION_LEVELS
+EDUCATION_LEVEL_MASKS: list[tuple[int, int]] = [
+    (EDUCATION_MATCHER.mask_of([level_name]), level_code)
+    for level_name, level_code in EDUCATION_LEVELS.items()
+]
 
 
 def parse_education(text: str) -> Optional[int]:
@@ -12,10 +23,30 @@ def parse_education(text: str) -> Optional[int]:
     if pd.isna(text) or not isinstance(text, str):
         return None
 
-    text_lower = text.lower()
+    found = EDUCATION_MATCHER.match(text)
 
-    for level_name, level_code in EDUCATION_LEVELS.items():
-        if level_name in text_lower:
+    for level_mask, level_code in EDUCATION_LEVEL_MASKS:
+        if found & level_mask:
             return level_code
 
-    return 3
+    return DEFAULT_EDUCATION_LEVEL
+
+
+def parse_education_column(texts: pd.Series) -> pd.Series:
+    """
+    Векторизованная версия parse_education для целой колонки.
+
+    Уровни проверяются в порядке EDUCATION_LEVELS, как и в скалярной версии.
+
+    Вернет:
+        Колонку float с уровнем образования (NaN для пропусков).
+    """
+    found = EDUCATION_MATCHER.match_column(texts)
+
+    levels = np.select(
+        [found & np.uint64(level_mask) != 0 for level_mask, _ in EDUCATION_LEVEL_MASKS],
+        [level_code for _, level_code in EDUCATION_LEVEL_MASKS],
+        default=DEFAULT_EDUCATION_LEVEL,
+    )
+
+    return pd.Series(np.where(is_text(texts), levels, np.nan), index=texts.index)
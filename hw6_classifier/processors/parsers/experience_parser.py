@@ -5,21 +5,56 @@ from typing import Optional
 
 import pandas as pd
 
+from .text_column import as_text_column
 
-def parse_experience(text: str) -> Optional[float]:
-    """Извлекает опыт работы в месяцах из текста."""
+YEARS_PATTERN = r"(\d+)\s*(?:год|лет|года|year|г\.)"
+MONTHS_PATTERN = r"(\d+)\s*(?:месяц|месяцев|month|мес\.)"
+
+
+def parse_experience(text: str, max_chars: Optional[int] = None) -> Optional[float]:
+    """
+    Извлекает опыт работы в месяцах из текста.
+
+    Аргументы:
+        text: Текст колонки опыта.
+        max_chars: Разбирать только первые max_chars символов (None — весь текст).
+    """
     if pd.isna(text) or not isinstance(text, str):
         return None
 
-    text_lower = text.lower()
+    text_lower = text[:max_chars].lower()
     total_months = 0
 
-    years_match = re.search(r"(\d+)\s*(?:год|лет|года|year|г\.)", text_lower)
+    years_match = re.search(YEARS_PATTERN, text_lower)
     if years_match:
         total_months += int(years_match.group(1)) * 12
 
-    months_match = re.search(r"(\d+)\s*(?:месяц|месяцев|month|мес\.)", text_lower)
+    months_match = re.search(MONTHS_PATTERN, text_lower)
     if months_match:
         total_months += int(months_match.group(1))
 
     return float(total_months) if total_months > 0 else None
+
+
+def parse_experience_column(texts: pd.Series, max_chars: Optional[int] = None) -> pd.Series:
+    """
+    Векторизованная версия parse_experience для целой колонки.
+
+    Аргументы:
+        texts: Колонка опыта.
+        max_chars: Разбирать только первые max_chars символов (None — весь текст).
+
+    Вернет:
+        Колонку float с опытом в месяцах (NaN, если опыт не найден).
+    """
+    # Поиск без учёта регистра вместо str.lower(): тексты опыта длинные,
+    # и копия колонки в нижнем регистре занимала больше памяти, чем все признаки
+    texts = as_text_column(texts)
+    if max_chars is not None:
+        texts = texts.str.slice(stop=max_chars)
+
+    years = texts.str.extract(YEARS_PATTERN, flags=re.IGNORECASE, expand=False).astype(float)
+    months = texts.str.extract(MONTHS_PATTERN, flags=re.IGNORECASE, expand=False).astype(float)
+
+    total_months = years.fillna(0.0) * 12 + months.fillna(0.0)
+    return total_months.where(total_months > 0)
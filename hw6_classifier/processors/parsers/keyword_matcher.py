@@ -0,0 +1,185 @@
+"""
+Поиск нескольких ключевых слов за один проход по строке.
+
+Словарь ключевых слов компилируется в одно регулярное выражение в виде
+префиксного дерева. Выражение обёрнуто в lookahead, поэтому в каждой позиции
+строки находится самое длинное ключевое слово, начинающееся в ней. Слова,
+являющиеся подстроками найденного (например, "go" внутри "golang"),
+добавляются через заранее вычисленное замыкание, так что результат совпадает
+с проверкой `keyword in text` для каждого слова словаря.
+"""
+
+import re
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from hw6_classifier.config import (
+    IT_DEVELOPER_KEYWORDS,
+    SENIORITY_KEYWORDS,
+    TECH_STACK,
+    MAJOR_CITIES,
+    MOSCOW_CITY_NAMES,
+    SPB_CITY_NAMES,
+    EDUCATION_LEVELS,
+)
+from .text_column import as_text_column
+
+MAX_KEYWORDS = 64
+
+
+def _trie_pattern(node: dict) -> str:
+    """Рекурсивно строит регулярное выражение по узлу префиксного дерева."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char != ""
+    ]
+    if not branches:
+        return ""
+
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        pattern = "(?:" + pattern + ")?"
+    return pattern
+
+
+def compile_keywords(keywords: Iterable[str]) -> re.Pattern:
+    """
+    Компилирует ключевые слова в одно регулярное выражение.
+
+    Вернет:
+        Выражение, которое в каждой позиции захватывает (группа 1) самое
+        длинное ключевое слово, начинающееся в этой позиции.
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    return re.compile("(?=(" + _trie_pattern(trie) + "))")
+
+
+class KeywordMatcher:
+    """
+    Компилированный словарь ключевых слов.
+
+    Каждому слову соответствует бит маски в порядке передачи слов, что позволяет
+    вызывающему коду сохранять собственный порядок приоритетов. Ключевые слова
+    и тексты сравниваются в нижнем регистре.
+
+    Атрибуты:
+        keywords: Кортеж ключевых слов в порядке битов.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """
+        Строит автомат поиска по словарю.
+
+        Исключения:
+            ValueError: Если словарь пуст или содержит больше 64 слов.
+        """
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(kw.lower() for kw in keywords))
+
+        if not self.keywords or len(self.keywords) > MAX_KEYWORDS:
+            raise ValueError(
+                f"Словарь должен содержать от 1 до {MAX_KEYWORDS} слов, "
+                f"получено {len(self.keywords)}"
+            )
+
+        self._bits: dict[str, int] = {
+            keyword: 1 << idx for idx, keyword in enumerate(self.keywords)
+        }
+        # Для каждого слова — маска всех слов словаря, являющихся его подстроками
+        self._closure: dict[str, int] = {
+            keyword: self.mask_of(other for other in self.keywords if other in keyword)
+            for keyword in self.keywords
+        }
+        self._pattern = compile_keywords(self.keywords)
+
+    def mask_of(self, keywords: Iterable[str]) -> int:
+        """Возвращает битовую маску для набора ключевых слов словаря."""
+        mask = 0
+        for keyword in keywords:
+            mask |= self._bits[keyword.lower()]
+        return mask
+
+    def match(self, text: Optional[str]) -> int:
+        """
+        Находит все ключевые слова в тексте за один проход.
+
+        Вернет:
+            Битовую маску найденных слов (0 для пропусков и нестроковых значений).
+        """
+        if not isinstance(text, str):
+            return 0
+        return self._match_lower(text.lower())
+
+    def _match_lower(self, text_lower: str) -> int:
+        """Находит ключевые слова в тексте, уже приведённом к нижнему регистру."""
+        mask = 0
+        for found in self._pattern.finditer(text_lower):
+            mask |= self._closure[found.group(1)]
+        return mask
+
+    def contains_any(self, text: Optional[str]) -> bool:
+        """Проверяет, содержит ли текст хотя бы одно ключевое слово."""
+        if not isinstance(text, str):
+            return False
+        return self._pattern.search(text.lower()) is not None
+
+    def find_all(self, text: Optional[str]) -> set[str]:
+        """Возвращает множество найденных ключевых слов."""
+        return set(self.decode(self.match(text)))
+
+    def decode(self, mask: int) -> list[str]:
+        """Преобразует битовую маску в список слов в порядке словаря."""
+        return [keyword for keyword in self.keywords if mask & self._bits[keyword]]
+
+    def match_column(self, texts: pd.Series) -> np.ndarray:
+        """
+        Находит ключевые слова для каждой строки колонки.
+
+        Вернет:
+            Массив uint64 с битовыми масками найденных слов.
+        """
+        texts_lower = as_text_column(texts).str.lower()
+        return np.fromiter(
+            (self._match_lower(text) if isinstance(text, str) else 0 for text in texts_lower),
+            dtype=np.uint64,
+            count=len(texts_lower),
+        )
+
+    def contains_any_column(self, texts: pd.Series) -> np.ndarray:
+        """Возвращает булеву маску строк, содержащих хотя бы одно ключевое слово."""
+        texts_lower = as_text_column(texts).str.lower()
+        search = self._pattern.search
+        return np.fromiter(
+            (isinstance(text, str) and search(text) is not None for text in texts_lower),
+            dtype=bool,
+            count=len(texts_lower),
+        )
+
+
+def mask_bits(masks: np.ndarray, n_bits: int) -> np.ndarray:
+    """
+    Распаковывает битовые маски в матрицу индикаторов.
+
+    Вернет:
+        Матрицу uint8 формы (len(masks), n_bits).
+    """
+    shifts = np.arange(n_bits, dtype=np.uint64)
+    return ((masks.astype(np.uint64)[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+
+
+# Словари, скомпилированные один раз из констант
+IT_DEVELOPER_MATCHER = KeywordMatcher(sorted(IT_DEVELOPER_KEYWORDS))
+SENIORITY_MATCHER = KeywordMatcher(
+    keyword for level in SENIORITY_KEYWORDS for keyword in sorted(SENIORITY_KEYWORDS[level])
+)
+TECH_STACK_MATCHER = KeywordMatcher(sorted(TECH_STACK))
+CITY_MATCHER = KeywordMatcher([*sorted(MAJOR_CITIES), *MOSCOW_CITY_NAMES, *SPB_CITY_NAMES])
+EDUCATION_MATCHER = KeywordMatcher(EDUCATION_LEVELS)
@@ -3,9 +3,15 @@
 import re
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from hw6_classifier.config import USD_TO_RUB_RATE, EUR_TO_RUB_RATE
+from .text_column import as_text_column, contains_any
+
+SALARY_PATTERN = r"(\d+)"
+USD_MARKERS = ("usd", "$")
+EUR_MARKERS = ("eur", "€")
 
 
 def parse_salary(text: str) -> Optional[float]:
@@ -15,15 +21,39 @@ def parse_salary(text: str) -> Optional[float]:
 
     text_clean = text.replace(" ", "").replace("\xa0", "").lower()
 
-    salary_match = re.search(r"(\d+)", text_clean)
+    salary_match = re.search(SALARY_PATTERN, text_clean)
     if not salary_match:
         return None
 
     salary = float(salary_match.group(1))
 
-    if "usd" in text_clean or "$" in text_clean:
+    if any(marker in text_clean for marker in USD_MARKERS):
         salary *= USD_TO_RUB_RATE
-    elif "eur" in text_clean or "€" in text_clean:
+    elif any(marker in text_clean for marker in EUR_MARKERS):
         salary *= EUR_TO_RUB_RATE
 
     return salary
+
+
+def parse_salary_column(texts: pd.Series) -> pd.Series:
+    """
+    Векторизованная версия parse_salary для целой колонки.
+
+    Вернет:
+        Колонку float с зарплатой в рублях (NaN, если сумма не найдена).
+    """
+    texts_clean = (
+        as_text_column(texts)
+        .str.replace(" ", "", regex=False)
+        .str.replace("\xa0", "", regex=False)
+        .str.lower()
+    )
+
+    salary = texts_clean.str.extract(SALARY_PATTERN, expand=False).astype(float)
+
+    rate = np.select(
+        [contains_any(texts_clean, USD_MARKERS), contains_any(texts_clean, EUR_MARKERS)],
+        [USD_TO_RUB_RATE, EUR_TO_RUB_RATE],
+        default=1.0,
+    )
+    return salary * rate
@@ -2,7 +2,7 @@
 
 import pandas as pd
 
-from hw6_classifier.config import TECH_STACK
+from .keyword_matcher import TECH_STACK_MATCHER, mask_bits
 
 
 def extract_tech_skills(text: str) -> set[str]:
@@ -10,11 +10,20 @@ def extract_tech_skills(text: str) -> set[str]:
     if pd.isna(text) or not isinstance(text, str):
         return set()
 
-    text_lower = text.lower()
-    found_skills = set()
+    return TECH_STACK_MATCHER.find_all(text)
 
-    for tech in TECH_STACK:
-        if tech.lower() in text_lower:
-            found_skills.add(tech)
 
-    return found_skills
+def extract_tech_skills_column(texts: pd.Series) -> pd.DataFrame:
+    """
+    Векторизованная версия extract_tech_skills для целой колонки.
+
+    Вернет:
+        DataFrame с целочисленными колонками skill_<tech> в порядке sorted(TECH_STACK).
+    """
+    skills = mask_bits(TECH_STACK_MATCHER.match_column(texts), len(TECH_STACK_MATCHER.keywords))
+
+    return pd.DataFrame(
+        skills.astype(int),
+        columns=[f"skill_{tech}" for tech in TECH_STACK_MATCHER.keywords],
+        index=texts.index,
+    )
@@ -0,0 +1,44 @@
+"""Общие утилиты для векторизованных парсеров текстовых колонок."""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_string_dtype
+
+
+def as_text_column(texts: pd.Series) -> pd.Series:
+    """
+    Подготавливает колонку к операциям через аксессор .str.
+
+    Колонки нестрокового типа (например, полностью пустые, прочитанные
+    как float) заменяются колонкой из NaN, что соответствует поведению
+    скалярных парсеров для значений, не являющихся строками.
+    """
+    if is_string_dtype(texts.dtype):
+        return texts
+    return pd.Series(np.nan, index=texts.index, dtype=object)
+
+
+def is_text(texts: pd.Series) -> np.ndarray:
+    """Возвращает булеву маску значений, являющихся строками."""
+    return as_text_column(texts).str.len().notna().to_numpy()
+
+
+def join_text_columns(df: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """
+    Объединяет текстовые колонки через пробел; пропуски заменяются пустой строкой.
+
+    Отсутствующие в df колонки пропускаются.
+    """
+    texts = pd.Series("", index=df.index, dtype=object)
+    for idx, column in enumerate(column for column in columns if column in df.columns):
+        part = df[column].astype(object).where(df[column].notna(), "").astype(str)
+        texts = part if idx == 0 else texts + " " + part
+    return texts
+
+
+def contains_any(texts: pd.Series, keywords) -> np.ndarray:
+    """Возвращает булеву маску строк, содержащих хотя бы одну подстроку."""
+    mask = np.zeros(len(texts), dtype=bool)
+    for keyword in keywords:
+        mask |= texts.str.contains(keyword, regex=False, na=False).to_numpy(dtype=bool)
+    return mask
@@ -1,8 +1,14 @@
 """Контейнер для обработанных данных резюме."""
 
 from dataclasses import dataclass
+from typing import Optional, Sequence, Union
 
 import numpy as np
+import scipy.sparse as sp
+
+from .parsers.keyword_matcher import mask_bits
+
+FeatureMatrix = Union[np.ndarray, sp.csr_matrix]
 
 
 @dataclass
@@ -10,17 +16,34 @@ class ProcessedData:
     """
     Контейнер для обработанных данных резюме.
 
+    Индикаторы навыков могут храниться упакованными: по одному uint64 на строку
+    в skill_mask, где бит i соответствует признаку feature_names[X.shape[1] + i].
+    Полная матрица признаков собирается только по запросу методом matrix().
+    Необязательный блок хэшированных текстовых признаков (text_features)
+    не имеет названий и входит только в разреженную матрицу.
+
     Атрибуты:
-        X: Матрица признаков формы (n_samples, n_features).
+        X: Матрица плотных признаков формы (n_samples, n_dense_features).
+            Если skill_mask не задан, содержит все признаки. Загруженная
+            с диска матрица может иметь компактный тип (float32) и быть
+            отображена в память; matrix() всегда возвращает float64.
         y: Вектор целевых меток формы (n_samples,).
-        feature_names: Список названий признаков.
+        feature_names: Список названий всех признаков (плотные, затем навыки).
         class_names: Список названий классов.
+        skill_mask: Упакованные индикаторы навыков формы (n_samples,) или None.
+        population_counts: Истинное количество образцов каждого класса,
+            если данные — выборка из большей совокупности, иначе None.
+        text_features: Разреженный блок хэшированных n-грамм текста
+            формы (n_samples, 2 ** n_bits) или None.
     """
 
     X: np.ndarray
     y: np.ndarray
     feature_names: list[str]
     class_names: list[str]
+    skill_mask: Optional[np.ndarray] = None
+    population_counts: Optional[np.ndarray] = None
+    text_features: Optional[sp.csr_matrix] = None
 
     @property
     def n_samples(self) -> int:
@@ -30,4 +53,122 @@ class ProcessedData:
     @property
     def n_features(self) -> int:
         """Возвращает количество признаков."""
-        return self.X.shape[1]
+        return len(self.feature_names)
+
+    @property
+    def n_text_features(self) -> int:
+        """Возвращает ширину блока текстовых признаков (0, если его нет)."""
+        return 0 if self.text_features is None else self.text_features.shape[1]
+
+    @property
+    def n_skills(self) -> int:
+        """Возвращает количество упакованных индикаторов навыков."""
+        return 0 if self.skill_mask is None else self.n_features - self.X.shape[1]
+
+    def skill_matrix(self, sparse: bool = False) -> FeatureMatrix:
+        """
+        Распаковывает индикаторы навыков.
+
+        Аргументы:
+            sparse: Вернуть разреженную CSR-матрицу вместо плотной uint8.
+
+        Вернет:
+            Матрица формы (n_samples, n_skills).
+        """
+        shape = (self.n_samples, self.n_skills)
+        if self.skill_mask is None:
+            return sp.csr_matrix(shape, dtype=np.float64) if sparse else np.zeros(shape, np.uint8)
+
+        if not sparse:
+            return mask_bits(self.skill_mask, self.n_skills)
+
+        masks = self.skill_mask.astype(np.uint64)
+        rows, cols = [], []
+        for bit in range(self.n_skills):
+            bit_rows = np.flatnonzero((masks >> np.uint64(bit)) & np.uint64(1))
+            rows.append(bit_rows)
+            cols.append(np.full(len(bit_rows), bit, dtype=np.int64))
+
+        rows_all = np.concatenate(rows)
+        data = np.ones(len(rows_all), dtype=np.float64)
+        return sp.csr_matrix((data, (rows_all, np.concatenate(cols))), shape=shape)
+
+    def matrix(self, sparse: bool = False) -> FeatureMatrix:
+        """
+        Собирает матрицу признаков для эстиматора.
+
+        Аргументы:
+            sparse: Вернуть разреженную CSR-матрицу (для моделей,
+                поддерживающих разреженный вход). Только она включает
+                блок текстовых признаков.
+
+        Вернет:
+            Матрица формы (n_samples, n_features), для разреженной матрицы
+            с блоком текста — (n_samples, n_features + n_text_features).
+        """
+        if sparse:
+            blocks = [sp.csr_matrix(self.X, dtype=np.float64)]
+            if self.skill_mask is not None:
+                blocks.append(self.skill_matrix(sparse=True))
+            if self.text_features is not None:
+                blocks.append(self.text_features)
+            return blocks[0] if len(blocks) == 1 else sp.hstack(blocks, format="csr")
+
+        if self.skill_mask is None:
+            return np.asarray(self.X, dtype=np.float64)
+
+        return np.hstack([self.X, self.skill_matrix()], dtype=np.float64)
+
+    def subset(self, indices: np.ndarray) -> "ProcessedData":
+        """Возвращает данные для подмножества строк."""
+        return ProcessedData(
+            X=self.X[indices],
+            y=self.y[indices],
+            feature_names=self.feature_names,
+            class_names=self.class_names,
+            skill_mask=None if self.skill_mask is None else self.skill_mask[indices],
+            population_counts=self.population_counts,
+            text_features=None if self.text_features is None else self.text_features[indices],
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["ProcessedData"]) -> "ProcessedData":
+        """
+        Объединяет данные с одинаковым набором признаков по строкам.
+
+        Истинные размеры классов складываются, если заданы у всех частей.
+
+        Исключения:
+            ValueError: Если список пуст или наборы признаков различаются.
+        """
+        if not parts:
+            raise ValueError("Нет данных для объединения")
+
+        first = parts[0]
+        has_skills = first.skill_mask is not None
+        for part in parts[1:]:
+            if (
+                part.feature_names != first.feature_names
+                or part.class_names != first.class_names
+                or (part.skill_mask is not None) != has_skills
+                or part.n_text_features != first.n_text_features
+            ):
+                raise ValueError("Нельзя объединить данные с разными признаками или классами")
+
+        return cls(
+            X=np.concatenate([part.X for part in parts]),
+            y=np.concatenate([part.y for part in parts]),
+            feature_names=first.feature_names,
+            class_names=first.class_names,
+            skill_mask=np.concatenate([part.skill_mask for part in parts]) if has_skills else None,
+            population_counts=(
+                np.sum([part.population_counts for part in parts], axis=0)
+                if all(part.population_counts is not None for part in parts)
+                else None
+            ),
+            text_features=(
+                sp.vstack([part.text_features for part in parts], format="csr")
+                if first.text_features is not None
+                else None
+            ),
+        )
@@ -0,0 +1,233 @@
+"""
+Извлечение признаков одного резюме без pandas.
+
+Для оценки отдельного резюме построение DataFrame и векторизованных
+парсеров стоит миллисекунды. Здесь те же правила разбора применяются
+к строкам напрямую: регулярные выражения скомпилированы при импорте,
+ключевые слова ищутся теми же KeywordMatcher, а результат записывается
+в вектор с раскладкой FEATURE_NAMES + навыки sorted(TECH_STACK), как
+в ProcessedData.matrix().
+"""
+
+import re
+from typing import Any, Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+from hw6_classifier.config import (
+    CSV_COLUMNS,
+    FEATURE_NAMES,
+    TECH_STACK,
+    USD_TO_RUB_RATE,
+    EUR_TO_RUB_RATE,
+)
+from .parsers.keyword_matcher import CITY_MATCHER, EDUCATION_MATCHER, TECH_STACK_MATCHER
+from .parsers.experience_parser import YEARS_PATTERN, MONTHS_PATTERN
+from .parsers.salary_parser import SALARY_PATTERN, USD_MARKERS, EUR_MARKERS
+from .parsers.demographics_parser import AGE_PATTERN, MALE_MARKERS, FEMALE_MARKERS
+from .parsers.education_parser import DEFAULT_EDUCATION_LEVEL, EDUCATION_LEVEL_MASKS
+from .parsers.city_parser import MAJOR_CITY_MASK, MOSCOW_MASK, SPB_MASK
+
+RECORD_FEATURE_NAMES: list[str] = list(FEATURE_NAMES) + [f"skill_{tech}" for tech in sorted(TECH_STACK)]
+N_DENSE_FEATURES = len(FEATURE_NAMES)
+N_RECORD_FEATURES = len(RECORD_FEATURE_NAMES)
+
+_YEARS_RE = re.compile(YEARS_PATTERN)
+_MONTHS_RE = re.compile(MONTHS_PATTERN)
+_SALARY_RE = re.compile(SALARY_PATTERN)
+_AGE_RE = re.compile(AGE_PATTERN)
+
+_NAN = float("nan")
+
+
+class ResumeRecord:
+    """
+    Текстовые поля одного резюме.
+
+    Поля, не являющиеся строками (None, NaN), считаются пропусками.
+
+    Атрибуты:
+        position, salary, demographics, city, experience, education:
+            Тексты колонок CSV_COLUMNS с теми же ключами.
+    """
+
+    __slots__ = tuple(CSV_COLUMNS)
+
+    def __init__(
+        self,
+        position: Optional[str] = None,
+        salary: Optional[str] = None,
+        demographics: Optional[str] = None,
+        city: Optional[str] = None,
+        experience: Optional[str] = None,
+        education: Optional[str] = None,
+    ) -> None:
+        """Инициализирует запись."""
+        self.position = position if isinstance(position, str) else None
+        self.salary = salary if isinstance(salary, str) else None
+        self.demographics = demographics if isinstance(demographics, str) else None
+        self.city = city if isinstance(city, str) else None
+        self.experience = experience if isinstance(experience, str) else None
+        self.education = education if isinstance(education, str) else None
+
+    @classmethod
+    def from_dict(cls, record: Mapping[str, Any]) -> "ResumeRecord":
+        """
+        Создает запись из словаря.
+
+        Аргументы:
+            record: Строка выгрузки: ключи — заголовки CSV (значения
+                CSV_COLUMNS) или короткие имена (ключи CSV_COLUMNS).
+        """
+        get = record.get
+        return cls(*[get(column, get(name)) for name, column in CSV_COLUMNS.items()])
+
+
+def featurize_record(
+    record: Union[Mapping[str, Any], ResumeRecord], experience_prefix: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Извлекает признаки одного резюме.
+
+    Аргументы:
+        record: Словарь с полями резюме (см. ResumeRecord.from_dict) или запись.
+        experience_prefix: Разбирать только префикс текста опыта такой длины.
+
+    Вернет:
+        Вектор float64 длины N_RECORD_FEATURES в порядке RECORD_FEATURE_NAMES;
+        пропуски плотных признаков — NaN.
+    """
+    out = np.empty(N_RECORD_FEATURES, dtype=np.float64)
+    _fill_row(_as_record(record), out, experience_prefix)
+    return out
+
+
+def featurize_records(
+    records: Iterable[Union[Mapping[str, Any], ResumeRecord]],
+    out: np.ndarray,
+    experience_prefix: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Записывает признаки пачки резюме в заранее выделенную матрицу.
+
+    Аргументы:
+        records: Словари с полями резюме или записи.
+        out: Матрица формы (n, N_RECORD_FEATURES); n — не меньше числа записей.
+        experience_prefix: Разбирать только префикс текста опыта такой длины.
+
+    Вернет:
+        Заполненные строки out (первые n записей).
+
+    Исключения:
+        ValueError: Если ширина out не равна N_RECORD_FEATURES или записей
+            больше, чем строк out.
+    """
+    if out.ndim != 2 or out.shape[1] != N_RECORD_FEATURES:
+        raise ValueError(
+            f"Матрица признаков должна иметь {N_RECORD_FEATURES} колонок, форма: {out.shape}"
+        )
+
+    n_rows = 0
+    for n_rows, record in enumerate(records, start=1):
+        if n_rows > len(out):
+            raise ValueError(f"Записей больше, чем строк в матрице признаков ({len(out)})")
+        _fill_row(_as_record(record), out[n_rows - 1], experience_prefix)
+    return out[:n_rows]
+
+
+def _as_record(record: Union[Mapping[str, Any], ResumeRecord]) -> ResumeRecord:
+    """Приводит словарь к ResumeRecord."""
+    return record if isinstance(record, ResumeRecord) else ResumeRecord.from_dict(record)
+
+
+def _fill_row(record: ResumeRecord, row: np.ndarray, experience_prefix: Optional[int]) -> None:
+    """Записывает признаки записи в строку матрицы."""
+    row[:N_DENSE_FEATURES] = (
+        _experience_months(record.experience, experience_prefix),
+        _salary_rub(record.salary),
+        *_demographics(record.demographics),
+        _education_level(record.education),
+        *_city_flags(record.city),
+    )
+
+    row[N_DENSE_FEATURES:] = 0.0
+    mask = TECH_STACK_MATCHER.match(record.position)
+    while mask:
+        low_bit = mask & -mask
+        row[N_DENSE_FEATURES + low_bit.bit_length() - 1] = 1.0
+        mask ^= low_bit
+
+
+def _experience_months(text: Optional[str], max_chars: Optional[int]) -> float:
+    """Опыт работы в месяцах (как parse_experience)."""
+    if text is None:
+        return _NAN
+
+    text_lower = text[:max_chars].lower()
+    total_months = 0
+
+    years_match = _YEARS_RE.search(text_lower)
+    if years_match:
+        total_months += int(years_match.group(1)) * 12
+
+    months_match = _MONTHS_RE.search(text_lower)
+    if months_match:
+        total_months += int(months_match.group(1))
+
+    return float(total_months) if total_months > 0 else _NAN
+
+
+def _salary_rub(text: Optional[str]) -> float:
+    """Зарплата в рублях (как parse_salary)."""
+    if text is None:
+        return _NAN
+
+    text_clean = text.replace(" ", "").replace("\xa0", "").lower()
+    salary_match = _SALARY_RE.search(text_clean)
+    if not salary_match:
+        return _NAN
+
+    salary = float(salary_match.group(1))
+    if any(marker in text_clean for marker in USD_MARKERS):
+        salary *= USD_TO_RUB_RATE
+    elif any(marker in text_clean for marker in EUR_MARKERS):
+        salary *= EUR_TO_RUB_RATE
+    return salary
+
+
+def _demographics(text: Optional[str]) -> tuple[float, float]:
+    """Возраст и пол (как parse_demographics)."""
+    if text is None:
+        return _NAN, _NAN
+
+    text_lower = text.lower()
+    age_match = _AGE_RE.search(text_lower)
+    age = float(age_match.group(1)) if age_match else _NAN
+
+    if any(marker in text_lower for marker in MALE_MARKERS):
+        return age, 1.0
+    if any(marker in text_lower for marker in FEMALE_MARKERS):
+        return age, 0.0
+    return age, _NAN
+
+
+def _education_level(text: Optional[str]) -> float:
+    """Уровень образования (как parse_education)."""
+    if text is None:
+        return _NAN
+
+    found = EDUCATION_MATCHER.match(text)
+    for level_mask, level_code in EDUCATION_LEVEL_MASKS:
+        if found & level_mask:
+            return float(level_code)
+    return float(DEFAULT_EDUCATION_LEVEL)
+
+
+def _city_flags(text: Optional[str]) -> tuple[float, float, float]:
+    """Флаги города-миллионника, Москвы и СПб (как parse_city)."""
+    found = CITY_MATCHER.match(text)
+    return (
+        float(bool(found & MAJOR_CITY_MASK)),
+        float(bool(found & MOSCOW_MASK)),
+        float(bool(found & SPB_MASK)),
+    )
@@ -0,0 +1,296 @@
+"""
+Стратифицированная выборка образцов за один проход.
+
+Для каждого класса ведётся отдельный резервуар (алгоритм R), поэтому
+память ограничена суммой вместимостей резервуаров независимо от объёма
+выгрузки. Истинное количество образцов каждого класса запоминается;
+итоговая выборка распределяется по классам пропорционально этим
+количествам с учётом ограничений на класс. Резервуары шардов,
+обработанных в разных процессах, объединяются без повторного чтения.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+
+from .processed_data import ProcessedData
+
+
+def class_capacities(
+    max_rows: int, n_classes: int, class_caps: Optional[dict[int, int]] = None,
+) -> np.ndarray:
+    """Вместимость резервуара каждого класса: max_rows или ограничение класса."""
+    capacities = np.full(n_classes, max_rows, dtype=np.int64)
+    for label, cap in (class_caps or {}).items():
+        capacities[label] = min(cap, max_rows)
+    return capacities
+
+
+class StratifiedReservoir:
+    """
+    Резервуары образцов по классам.
+
+    Каждый резервуар содержит равномерную выборку без возвращения
+    из всех образцов своего класса, добавленных через add().
+
+    Атрибуты:
+        capacities: Вместимость резервуара каждого класса.
+        seen: Количество добавленных образцов каждого класса.
+    """
+
+    def __init__(self, capacities: np.ndarray, seed: Sequence[int] = (0,)) -> None:
+        """
+        Инициализирует пустые резервуары.
+
+        Аргументы:
+            capacities: Вместимость резервуара каждого класса.
+            seed: Зерно генератора случайных чисел.
+        """
+        self.capacities = np.asarray(capacities, dtype=np.int64)
+        self.seen = np.zeros(len(self.capacities), dtype=np.int64)
+        self._rng = np.random.default_rng(list(seed))
+        self._n_added = 0
+        self._X: list[Optional[np.ndarray]] = [None] * len(self.capacities)
+        self._skills: list[Optional[np.ndarray]] = [None] * len(self.capacities)
+        self._order: list[Optional[np.ndarray]] = [None] * len(self.capacities)
+        self._text: list[Optional[np.ndarray]] = [None] * len(self.capacities)
+        self._text_width: Optional[int] = None
+
+    def add(
+        self,
+        X: np.ndarray,
+        skill_mask: Optional[np.ndarray],
+        y: np.ndarray,
+        text_features: Optional[sp.csr_matrix] = None,
+    ) -> None:
+        """
+        Добавляет образцы чанка в резервуары их классов.
+
+        Аргументы:
+            X: Плотные признаки образцов.
+            skill_mask: Упакованные навыки образцов или None.
+            y: Закодированные метки образцов.
+            text_features: Текстовый блок образцов или None.
+        """
+        order = self._n_added + np.arange(len(y))
+        self._n_added += len(y)
+        if text_features is not None:
+            self._text_width = text_features.shape[1]
+
+        for label in np.unique(y):
+            rows = np.flatnonzero(y == label)
+            self._add_class(
+                int(label),
+                X[rows],
+                None if skill_mask is None else skill_mask[rows],
+                order[rows],
+                None if text_features is None else text_features[rows],
+            )
+
+    def to_data(self, feature_names: list[str], class_names: list[str]) -> Optional[ProcessedData]:
+        """
+        Возвращает содержимое резервуаров в порядке поступления образцов.
+
+        Вернет:
+            Данные с population_counts = seen или None, если образцов не было.
+        """
+        filled = np.minimum(self.seen, self.capacities)
+        labels = [label for label in range(len(filled)) if filled[label]]
+        if not labels:
+            return None
+
+        order = np.concatenate([self._order[label][: filled[label]] for label in labels])
+        sort = np.argsort(order, kind="stable")
+        skills = None
+        if self._skills[labels[0]] is not None:
+            skills = np.concatenate([self._skills[label][: filled[label]] for label in labels])[sort]
+
+        text_features = None
+        if self._text_width is not None:
+            text_rows = [row for label in labels for row in self._text[label][: filled[label]]]
+            text_features = _stack_rows([text_rows[idx] for idx in sort], self._text_width)
+
+        return ProcessedData(
+            X=np.concatenate([self._X[label][: filled[label]] for label in labels])[sort],
+            y=np.repeat(np.asarray(labels, dtype=np.int64), filled[labels])[sort],
+            feature_names=feature_names,
+            class_names=class_names,
+            skill_mask=skills,
+            population_counts=self.seen.copy(),
+            text_features=text_features,
+        )
+
+    def _add_class(
+        self,
+        label: int,
+        X: np.ndarray,
+        skill_mask: Optional[np.ndarray],
+        order: np.ndarray,
+        text_features: Optional[sp.csr_matrix],
+    ) -> None:
+        """Добавляет образцы одного класса (векторизованный алгоритм R)."""
+        capacity = self.capacities[label]
+        seen = self.seen[label]
+        self.seen[label] += len(X)
+        if capacity == 0:
+            return
+
+        if self._X[label] is None:
+            self._X[label] = np.empty((capacity, X.shape[1]), dtype=X.dtype)
+            self._order[label] = np.empty(capacity, dtype=np.int64)
+            if skill_mask is not None:
+                self._skills[label] = np.empty(capacity, dtype=skill_mask.dtype)
+            if text_features is not None:
+                self._text[label] = np.empty(capacity, dtype=object)
+
+        n_fill = int(min(len(X), max(0, capacity - seen)))
+        slots = np.arange(seen, seen + n_fill)
+        rows = np.arange(n_fill)
+
+        if n_fill < len(X):
+            # Образец с номером i в классе замещает случайный слот j <= i, если j < capacity;
+            # при повторе слота в чанке остаётся последний образец, как при последовательной обработке
+            positions = seen + np.arange(n_fill, len(X))
+            targets = self._rng.integers(0, positions + 1)
+            accepted = np.flatnonzero(targets < capacity)[::-1]
+            _, last = np.unique(targets[accepted], return_index=True)
+            replaced = accepted[last]
+            slots = np.concatenate([slots, targets[replaced]])
+            rows = np.concatenate([rows, n_fill + replaced])
+
+        self._X[label][slots] = X[rows]
+        self._order[label][slots] = order[rows]
+        if skill_mask is not None:
+            self._skills[label][slots] = skill_mask[rows]
+        if text_features is not None:
+            # Строки разреженного блока хранятся копиями (индексы, значения)
+            indptr = text_features.indptr
+            for slot, row in zip(slots.tolist(), rows.tolist()):
+                start, end = indptr[row], indptr[row + 1]
+                self._text[label][slot] = (
+                    text_features.indices[start:end].copy(), text_features.data[start:end].copy(),
+                )
+
+
+def _stack_rows(rows: list[tuple[np.ndarray, np.ndarray]], width: int) -> sp.csr_matrix:
+    """Собирает CSR-матрицу из строк, заданных парами (индексы, значения)."""
+    lengths = np.fromiter((len(indices) for indices, _ in rows), dtype=np.int64, count=len(rows))
+    indptr = np.concatenate([[0], np.cumsum(lengths)])
+    if not rows:
+        return sp.csr_matrix((0, width), dtype=np.float32)
+
+    indices = np.concatenate([indices for indices, _ in rows])
+    values = np.concatenate([values for _, values in rows])
+    return sp.csr_matrix((values, indices, indptr), shape=(len(rows), width))
+
+
+def merge_samples(
+    parts: Sequence[ProcessedData], capacities: np.ndarray, seed: Sequence[int] = (0,),
+) -> ProcessedData:
+    """
+    Объединяет содержимое резервуаров нескольких шардов.
+
+    Для каждого класса число образцов, взятых из шарда, выбирается
+    гипергеометрическим распределением по истинным количествам, поэтому
+    результат — равномерная выборка из объединённой совокупности.
+
+    Аргументы:
+        parts: Результаты StratifiedReservoir.to_data по шардам.
+        capacities: Вместимость резервуара каждого класса.
+        seed: Зерно генератора случайных чисел.
+    """
+    if len(parts) == 1:
+        return parts[0]
+
+    rng = np.random.default_rng(list(seed))
+    data = ProcessedData.concat(parts)
+    offsets = np.cumsum([0] + [part.n_samples for part in parts])
+    selected = []
+
+    for label in range(len(capacities)):
+        kept = np.empty(0, dtype=np.int64)
+        total = 0
+        for part, offset in zip(parts, offsets):
+            rows = offset + np.flatnonzero(part.y == label)
+            population = int(part.population_counts[label])
+            if population == 0:
+                continue
+
+            size = int(min(capacities[label], total + population))
+            n_kept = rng.hypergeometric(total, population, size) if total else 0
+            kept = np.concatenate([
+                rng.choice(kept, n_kept, replace=False),
+                rng.choice(rows, size - n_kept, replace=False),
+            ])
+            total += population
+        selected.append(kept)
+
+    return data.subset(np.sort(np.concatenate(selected)))
+
+
+def proportional_sample(
+    data: ProcessedData,
+    max_rows: int,
+    capacities: Optional[np.ndarray] = None,
+    seed: Sequence[int] = (0,),
+) -> ProcessedData:
+    """
+    Отбирает до max_rows образцов пропорционально истинному размеру классов.
+
+    Если класс ограничен вместимостью, освободившиеся места распределяются
+    между остальными классами. Внутри класса образцы выбираются равномерно.
+
+    Аргументы:
+        data: Данные; population_counts (или, если он не задан, метки)
+            задают истинный размер классов.
+        max_rows: Максимальный размер выборки.
+        capacities: Ограничения на число образцов каждого класса.
+        seed: Зерно генератора случайных чисел.
+
+    Вернет:
+        Выборка с population_counts исходной совокупности.
+    """
+    n_classes = len(data.class_names)
+    available = np.bincount(data.y, minlength=n_classes)
+    population = (
+        available if data.population_counts is None else np.asarray(data.population_counts)
+    )
+    if capacities is not None:
+        available = np.minimum(available, capacities)
+
+    quotas = _allocate(population, available, min(max_rows, int(available.sum())))
+
+    rng = np.random.default_rng(list(seed))
+    selected = [
+        rng.choice(np.flatnonzero(data.y == label), quotas[label], replace=False)
+        for label in range(n_classes)
+    ]
+    sample = data.subset(np.sort(np.concatenate(selected)))
+    sample.population_counts = population.copy()
+    return sample
+
+
+def _allocate(population: np.ndarray, available: np.ndarray, total: int) -> np.ndarray:
+    """Распределяет total мест пропорционально population, не превышая available."""
+    quotas = np.zeros(len(population), dtype=np.int64)
+    active = (available > 0) & (population > 0)
+
+    while quotas.sum() < total and active.any():
+        remaining = total - quotas.sum()
+        shares = np.where(active, population, 0) / population[active].sum() * remaining
+        added = np.minimum(np.floor(shares).astype(np.int64), available - quotas)
+
+        # Остаток мест — по наибольшим дробным долям (метод наибольшего остатка)
+        leftover = remaining - added.sum()
+        for label in np.argsort(-(shares - np.floor(shares)), kind="stable"):
+            if not leftover:
+                break
+            if active[label] and quotas[label] + added[label] < available[label]:
+                added[label] += 1
+                leftover -= 1
+
+        quotas += added
+        active &= quotas < available
+
+    return quotas
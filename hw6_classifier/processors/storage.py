@@ -0,0 +1,162 @@
+"""
+Дисковый формат ProcessedData с компактными типами и memory-mapping.
+
+Для каждого плотного признака подбирается самый компактный тип, который
+представляет значения без потерь (float32 для опыта и зарплаты, uint8
+для возраста, пола, образования и флагов городов), и матрица X хранится
+одним .npy-файлом в наименьшем общем из этих типов (обычно float32).
+Упакованные навыки и метки также хранятся в .npy, поэтому все массивы,
+включая X, открываются через mmap_mode='r' без копирования и разделяют
+одну копию в page cache между процессами обучения и подбора
+гиперпараметров. До float64 матрица расширяется в ProcessedData.matrix().
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+from .processed_data import ProcessedData
+
+META_FILE = "meta.json"
+FEATURES_FILE = "X.npy"
+LABELS_FILE = "y.npy"
+SKILLS_FILE = "skill_mask.npy"
+TEXT_FILE = "text_features.npz"
+
+# Предпочтительные типы плотных признаков
+COMPACT_DTYPES: dict[str, str] = {
+    "experience_months": "float32",
+    "salary_rub": "float32",
+    "age": "uint8",
+    "gender": "uint8",
+    "education_level": "uint8",
+    "city_million": "uint8",
+    "city_moscow": "uint8",
+    "city_spb": "uint8",
+}
+
+# Более широкие типы, если предпочтительный теряет значения
+FALLBACK_DTYPES: tuple[str, ...] = ("uint8", "uint16", "int32", "float32", "float64")
+
+
+def compact_dtype(values: np.ndarray, preferred: Optional[str] = None) -> np.dtype:
+    """
+    Подбирает самый компактный тип, хранящий значения без потерь.
+
+    Аргументы:
+        values: Значения колонки.
+        preferred: Предпочтительный тип, проверяемый первым.
+    """
+    candidates = ([preferred] if preferred else []) + list(FALLBACK_DTYPES)
+    for dtype in candidates:
+        with np.errstate(invalid="ignore", over="ignore"):
+            converted = values.astype(dtype)
+        if np.array_equal(converted.astype(values.dtype), values, equal_nan=True):
+            return np.dtype(dtype)
+    return values.dtype
+
+
+def save_processed_data(
+    data: ProcessedData, directory: Path, extra_meta: Optional[dict[str, Any]] = None,
+) -> Path:
+    """
+    Сохраняет данные в директорию в компактном формате.
+
+    Запись выполняется во временную директорию, которая затем атомарно
+    переименовывается, поэтому читатели не видят частично записанных данных.
+
+    Аргументы:
+        data: Данные для сохранения.
+        directory: Целевая директория (перезаписывается).
+        extra_meta: Дополнительные поля для meta.json.
+
+    Вернет:
+        Путь к директории с данными.
+    """
+    directory = Path(directory)
+    tmp_dir = directory.with_name(directory.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    dense_names = data.feature_names[: data.X.shape[1]]
+    column_dtypes = [
+        compact_dtype(data.X[:, idx], COMPACT_DTYPES.get(name))
+        for idx, name in enumerate(dense_names)
+    ]
+    x_dtype = np.result_type(*column_dtypes) if column_dtypes else data.X.dtype
+    np.save(tmp_dir / FEATURES_FILE, np.ascontiguousarray(data.X, dtype=x_dtype))
+
+    np.save(tmp_dir / LABELS_FILE, data.y.astype(compact_dtype(data.y)))
+    if data.skill_mask is not None:
+        np.save(tmp_dir / SKILLS_FILE, data.skill_mask)
+    if data.text_features is not None:
+        sp.save_npz(tmp_dir / TEXT_FILE, data.text_features)
+
+    meta = {
+        "n_samples": data.n_samples,
+        "feature_names": data.feature_names,
+        "class_names": data.class_names,
+        "dense_dtypes": [dtype.str for dtype in column_dtypes],
+        "x_dtype": np.dtype(x_dtype).str,
+        **(
+            {"population_counts": data.population_counts.tolist()}
+            if data.population_counts is not None
+            else {}
+        ),
+        **(extra_meta or {}),
+    }
+    (tmp_dir / META_FILE).write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+    return directory
+
+
+def read_meta(directory: Path) -> dict[str, Any]:
+    """Читает метаданные сохранённых данных."""
+    return json.loads((Path(directory) / META_FILE).read_text(encoding="utf-8"))
+
+
+def load_processed_data(directory: Path, mmap_mode: Optional[str] = "r") -> ProcessedData:
+    """
+    Загружает данные, сохранённые save_processed_data.
+
+    Матрица X, метки и упакованные навыки отображаются в память без
+    копирования; X остаётся в компактном типе хранения и расширяется
+    до float64 только при сборке матрицы признаков (ProcessedData.matrix).
+    Блок текстовых признаков (сжатый .npz) читается в память.
+
+    Аргументы:
+        directory: Директория с данными.
+        mmap_mode: Режим np.load (None — прочитать массивы в память).
+    """
+    directory = Path(directory)
+    meta = read_meta(directory)
+
+    X = np.load(directory / FEATURES_FILE, mmap_mode=mmap_mode)
+    y = np.load(directory / LABELS_FILE, mmap_mode=mmap_mode)
+
+    skills_path = directory / SKILLS_FILE
+    skill_mask = np.load(skills_path, mmap_mode=mmap_mode) if skills_path.exists() else None
+
+    text_path = directory / TEXT_FILE
+    text_features = sp.load_npz(text_path).tocsr() if text_path.exists() else None
+
+    return ProcessedData(
+        X=X,
+        y=y,
+        feature_names=meta["feature_names"],
+        class_names=meta["class_names"],
+        skill_mask=skill_mask,
+        population_counts=(
+            np.asarray(meta["population_counts"], dtype=np.int64)
+            if "population_counts" in meta
+            else None
+        ),
+        text_features=text_features,
+    )
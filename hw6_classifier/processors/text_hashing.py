@@ -0,0 +1,64 @@
+"""
+Разреженные текстовые признаки по хэшам n-грамм (hashing trick).
+
+Слова и пары слов из текста должности и опыта хэшируются в фиксированное
+число колонок, поэтому словарь не обучается и не хранится: преобразование
+не имеет состояния, работает по чанкам (в том числе в процессах пула),
+а ширина блока не зависит от объёма корпуса.
+"""
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from hw6_classifier.config import CSV_COLUMNS, TEXT_HASH_BITS
+from .parsers.text_column import join_text_columns
+
+TEXT_COLUMNS: tuple[str, ...] = ("position", "experience")
+
+
+class TextHasher:
+    """
+    Преобразует тексты резюме в разреженный блок хэшированных n-грамм.
+
+    Атрибуты:
+        n_bits: Ширина блока — 2 ** n_bits колонок.
+    """
+
+    def __init__(self, n_bits: int = TEXT_HASH_BITS) -> None:
+        """
+        Инициализирует преобразование.
+
+        Исключения:
+            ValueError: Если n_bits вне диапазона [1, 24].
+        """
+        if not 1 <= n_bits <= 24:
+            raise ValueError(f"Ширина текстового блока должна быть 2**1..2**24: 2**{n_bits}")
+
+        self.n_bits = n_bits
+        self._vectorizer = HashingVectorizer(
+            n_features=2 ** n_bits,
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm="l2",
+            dtype=np.float32,
+        )
+
+    @property
+    def n_features(self) -> int:
+        """Возвращает ширину блока."""
+        return 2 ** self.n_bits
+
+    def transform(self, df: pd.DataFrame) -> sp.csr_matrix:
+        """
+        Хэширует тексты должности и опыта.
+
+        Аргументы:
+            df: DataFrame с колонками CSV_COLUMNS.
+
+        Вернет:
+            CSR-матрица формы (len(df), n_features) с нормированными строками.
+        """
+        columns = [CSV_COLUMNS[name] for name in TEXT_COLUMNS]
+        return self._vectorizer.transform(join_text_columns(df, columns).to_numpy())
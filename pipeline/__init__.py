@@ -1,11 +1,12 @@
 """Пакет пайплайна классификации."""
 
-from .param_grids import PARAM_GRIDS, get_param_grid
+from .param_grids import PARAM_GRIDS, PARAM_SPACES, get_param_grid, get_param_space
 from .steps import (
     load_and_process_data,
     perform_eda,
     split_dataset,
     tune_hyperparameters,
+    tune_models,
     train_single_model,
     train_models,
     evaluate_single_model,
@@ -16,10 +17,13 @@ from .steps import (
 __all__ = [
     "PARAM_GRIDS",
     "get_param_grid",
+    "PARAM_SPACES",
+    "get_param_space",
     "load_and_process_data",
     "perform_eda",
     "split_dataset",
     "tune_hyperparameters",
+    "tune_models",
     "train_single_model",
     "train_models",
     "evaluate_single_model",
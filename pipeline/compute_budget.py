@@ -0,0 +1,79 @@
+"""
+Общий бюджет вычислительных ресурсов пайплайна.
+
+Бюджет n_jobs делится между внешним параллелизмом (процессы для фолдов,
+кандидатов или моделей) и внутренним (потоки деревьев, BLAS и OpenMP
+внутри процесса) так, чтобы их произведение не превышало бюджета:
+иначе, например, случайный лес с n_jobs=-1 внутри GridSearchCV(n_jobs=-1)
+запускает порядка cores² потоков.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from joblib import cpu_count, parallel_config
+from threadpoolctl import threadpool_limits
+
+
+class ComputeBudget:
+    """
+    Бюджет процессов и потоков.
+
+    Атрибуты:
+        n_jobs: Общее число ядер бюджета.
+        blas_threads: Потолок потоков нативных пулов (BLAS, OpenMP)
+            в одном процессе; None — по доле бюджета процесса.
+    """
+
+    def __init__(self, n_jobs: int = -1, blas_threads: Optional[int] = None) -> None:
+        """
+        Инициализирует бюджет.
+
+        Аргументы:
+            n_jobs: Число ядер; отрицательные значения — как в joblib
+                (-1 — все ядра, -2 — все, кроме одного).
+            blas_threads: Потолок потоков нативных пулов в процессе.
+
+        Исключения:
+            ValueError: Если n_jobs равен 0 или blas_threads меньше 1.
+        """
+        if n_jobs == 0:
+            raise ValueError("n_jobs не может быть равен 0")
+        if blas_threads is not None and blas_threads < 1:
+            raise ValueError(f"Число потоков BLAS должно быть положительным: {blas_threads}")
+
+        self.n_jobs = n_jobs if n_jobs > 0 else max(1, cpu_count() + 1 + n_jobs)
+        self.blas_threads = blas_threads
+
+    @classmethod
+    def from_args(cls, args) -> "ComputeBudget":
+        """Создает бюджет из аргументов командной строки."""
+        return cls(n_jobs=args.n_jobs, blas_threads=args.blas_threads)
+
+    def split(self, n_tasks: int, max_outer: Optional[int] = None) -> tuple[int, int]:
+        """
+        Делит бюджет между внешним и внутренним параллелизмом.
+
+        Аргументы:
+            n_tasks: Количество независимых задач внешнего уровня.
+            max_outer: Дополнительное ограничение числа процессов.
+
+        Вернет:
+            Кортеж (процессов, потоков на процесс).
+        """
+        outer = max(1, min(self.n_jobs, n_tasks, max_outer or self.n_jobs))
+        return outer, max(1, self.n_jobs // outer)
+
+    def native_threads(self, inner: int) -> int:
+        """Потолок потоков нативных пулов для процесса с долей бюджета inner."""
+        return min(self.blas_threads, inner) if self.blas_threads else inner
+
+    @contextmanager
+    def limit(self, inner: int) -> Iterator[None]:
+        """Ограничивает нативные пулы потоков текущего процесса."""
+        with threadpool_limits(limits=self.native_threads(inner)):
+            yield
+
+    def worker_config(self, inner: int):
+        """Настройки joblib, ограничивающие нативные пулы в процессах-воркерах."""
+        return parallel_config(backend="loky", inner_max_num_threads=self.native_threads(inner))
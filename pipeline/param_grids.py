@@ -15,7 +15,30 @@ PARAM_GRIDS = {
     "svm": {"C": [0.01, 0.1, 1.0, 10.0], "max_iter": [2000, 5000]},
 }
 
+# Пространства параметров для модельного подбора (--search bayes):
+# (шкала, нижняя граница, верхняя граница); шкалы "float" и "int" —
+# равномерные, "log" и "log_int" — логарифмические
+PARAM_SPACES = {
+    "logistic": {"C": ("log", 1e-3, 1e2), "max_iter": ("log_int", 500, 5000)},
+    "random_forest": {
+        "n_estimators": ("log_int", 50, 400),
+        "max_depth": ("int", 3, 30),
+        "min_samples_split": ("log_int", 2, 20),
+    },
+    "gradient_boosting": {
+        "n_estimators": ("log_int", 50, 400),
+        "learning_rate": ("log", 5e-3, 0.5),
+        "max_depth": ("int", 2, 6),
+    },
+    "svm": {"C": ("log", 1e-3, 1e2), "max_iter": ("log_int", 1000, 10000)},
+}
+
 
 def get_param_grid(model_name: str) -> dict:
     """Возвращает сетку параметров для модели."""
     return PARAM_GRIDS.get(model_name, {})
+
+
+def get_param_space(model_name: str) -> dict:
+    """Возвращает пространство параметров модели для модельного подбора."""
+    return PARAM_SPACES.get(model_name, {})
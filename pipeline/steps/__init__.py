@@ -3,7 +3,7 @@
 from .data_loader import load_and_process_data
 from .eda import perform_eda
 from .splitter import split_dataset
-from .tuner import tune_hyperparameters
+from .tuner import tune_hyperparameters, tune_models
 from .trainer import train_single_model, train_models
 from .evaluator import evaluate_single_model, evaluate_models
 from .summary import print_summary
@@ -13,6 +13,7 @@ __all__ = [
     "perform_eda",
     "split_dataset",
     "tune_hyperparameters",
+    "tune_models",
     "train_single_model",
     "train_models",
     "evaluate_single_model",
@@ -1,27 +1,263 @@
 """Загрузка данных из CSV."""
 
+import json
 import logging
+from typing import Optional
 
-from hw6_classifier.processors import ResumeDataProcessor
+from hw6_classifier.config import METRICS_DIR
+from hw6_classifier.processors import (
+    FeatureCache,
+    FeatureStore,
+    IngestStatistics,
+    NearDuplicateFilter,
+    ParseMemo,
+    ResumeDataProcessor,
+    resolve_csv_paths,
+    validate_experience_prefix,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
-def load_and_process_data(csv_path: str):
-    """Загружает и обрабатывает данные из CSV."""
+def load_and_process_data(
+    csv_path: str,
+    chunk_size: Optional[int] = None,
+    prefilter: bool = False,
+    feature_workers: int = 1,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    use_parse_memo: bool = False,
+    feature_store: Optional[str] = None,
+    rebuild_feature_store: bool = False,
+    experience_prefix: Optional[int] = None,
+    prefix_on_read: bool = False,
+    validate_prefix: bool = False,
+    dedup_threshold: Optional[float] = None,
+    ingest_stats: Optional[IngestStatistics] = None,
+    max_rows: Optional[int] = None,
+    class_caps: Optional[dict[str, int]] = None,
+    sample_seed: int = 0,
+    text_hash_bits: Optional[int] = None,
+):
+    """
+    Загружает и обрабатывает данные из CSV.
+
+    csv_path может указывать на файл, директорию с шардами (*.csv) или
+    glob-шаблон; шарды обрабатываются параллельно и объединяются в порядке
+    сортировки путей.
+
+    Результат обработки кэшируется в PROCESSED_DATA_DIR; при повторном
+    запуске на том же файле и той же версии парсеров этап обработки
+    пропускается. При use_parse_memo результаты парсинга уникальных
+    текстовых значений сохраняются между запусками.
+
+    Если задан feature_store, кэш не используется: в хранилище дописываются
+    только строки, не встречавшиеся в прошлых выгрузках, а обучение
+    выполняется на всём содержимом хранилища. При смене схемы признаков
+    или настроек хранилище пересоздаётся только при rebuild_feature_store.
+
+    При experience_prefix колонка опыта разбирается только по префиксу
+    (prefix_on_read — префикс оставляется уже при чтении CSV), а при
+    validate_prefix предварительно строится отчёт о расхождениях с разбором
+    полного текста.
+
+    При dedup_threshold резюме IT-разработчиков, близкие (по MinHash-оценке
+    сходства должности и опыта) к уже встреченным, удаляются до извлечения
+    признаков. Состояние фильтра живёт в пределах одного запуска.
+
+    Если передан ingest_stats, в него добавляется статистика данных,
+    собранная за тот же проход (кроме загрузки из кэша и хранилища признаков).
+
+    При max_rows для обучения и оценки остаётся стратифицированная выборка
+    не более чем из max_rows образцов (с ограничениями class_caps по
+    классам), собранная за один проход с ограниченной памятью; истинные
+    размеры классов сохраняются в data.population_counts.
+
+    При text_hash_bits к признакам добавляется разреженный блок хэшированных
+    n-грамм текста должности и опыта (2 ** text_hash_bits колонок), который
+    используют модели с поддержкой разреженного входа.
+    """
     logger.info("Этап 1: Обработка данных из CSV")
     logger.info("-" * 80)
 
-    processor = ResumeDataProcessor()
-
     try:
-        data = processor.process_csv(csv_path)
+        if feature_store:
+            use_cache = False
+
+        parse_memo = ParseMemo.load() if use_parse_memo else None
+        processor = ResumeDataProcessor(
+            parse_memo=parse_memo,
+            experience_prefix=experience_prefix,
+            prefix_on_read=prefix_on_read,
+            near_duplicates=NearDuplicateFilter(dedup_threshold) if dedup_threshold else None,
+            max_rows=max_rows,
+            class_caps=class_caps,
+            sample_seed=sample_seed,
+            text_hash_bits=text_hash_bits,
+        )
+
+        csv_paths = resolve_csv_paths(csv_path)
+        if len(csv_paths) > 1:
+            logger.info(f"  Найдено шардов: {len(csv_paths)}")
+
+        if experience_prefix and validate_prefix:
+            _report_experience_prefix(csv_paths, experience_prefix, chunk_size)
+
+        cache = FeatureCache() if use_cache else None
+        cache_key = cache.key(csv_paths, processor.options) if cache else None
+
+        if cache and not rebuild_cache:
+            data = cache.load(cache_key)
+            if data is not None:
+                logger.info(f"✓ Данные загружены из кэша ({cache_key})")
+                _log_data_shape(data)
+                return data
+
+        if chunk_size:
+            logger.info(f"  Потоковая обработка чанками по {chunk_size} строк")
+        if experience_prefix:
+            mode = "при чтении и разборе" if prefix_on_read else "при разборе"
+            logger.info(f"  Префикс колонки опыта: {experience_prefix} символов ({mode})")
+        if dedup_threshold:
+            logger.info(f"  Удаление близких дубликатов: порог сходства {dedup_threshold}")
+        if max_rows:
+            caps = ", ".join(f"{name} ≤ {cap}" for name, cap in (class_caps or {}).items())
+            logger.info(f"  Стратифицированная выборка: до {max_rows} образцов" + (f" ({caps})" if caps else ""))
+        if text_hash_bits:
+            logger.info(f"  Текстовые признаки: хэши n-грамм, 2^{text_hash_bits} колонок")
+        if prefilter:
+            logger.info("  Предварительный отбор строк по колонке должности")
+        if feature_workers > 1:
+            logger.info(f"  Параллельное извлечение признаков: {feature_workers} процессов")
+
+        if feature_store:
+            data = _update_feature_store(
+                feature_store, csv_paths, processor, chunk_size, prefilter, feature_workers,
+                rebuild=rebuild_feature_store,
+            )
+        else:
+            data = processor.process_files(
+                csv_paths, chunksize=chunk_size, prefilter=prefilter, feature_workers=feature_workers,
+            )
         logger.info("✓ Данные обработаны успешно")
-        logger.info(f"  - Количество образцов: {data.n_samples}")
-        logger.info(f"  - Количество признаков: {data.n_features}")
-        logger.info("")
+
+        if len(csv_paths) > 1 and not feature_store:
+            _log_shard_reports(processor.shard_reports)
+        if ingest_stats is not None and processor.ingest_stats is not None:
+            ingest_stats.merge(processor.ingest_stats)
+        if data.population_counts is not None:
+            logger.info(
+                f"  - Выборка: {data.n_samples} из {int(data.population_counts.sum())} образцов"
+            )
+        if dedup_threshold:
+            _log_near_duplicates(processor, feature_store)
+
+        if parse_memo:
+            parse_memo.save()
+            logger.info(
+                f"  - Память парсинга: {parse_memo.hits} попаданий, "
+                f"{parse_memo.misses} промахов, {parse_memo.n_entries} значений"
+            )
+
+        if cache:
+            cache_path = cache.save(cache_key, data, csv_path)
+            logger.info(f"  - Кэш признаков сохранён: {cache_path}")
+
+        _log_data_shape(data)
         return data
     except Exception as e:
         logger.error(f"✗ Ошибка при обработке данных: {e}")
         return None
+
+
+def _update_feature_store(
+    store_dir: str,
+    csv_paths: list[str],
+    processor: ResumeDataProcessor,
+    chunk_size: Optional[int],
+    prefilter: bool,
+    feature_workers: int,
+    rebuild: bool = False,
+):
+    """Дописывает новые строки выгрузки в хранилище и загружает его целиком."""
+    store = FeatureStore(store_dir, processor.options, rebuild=rebuild)
+    stats: dict[str, int] = {}
+    for path in csv_paths:
+        store.update(
+            path, processor, chunksize=chunk_size, prefilter=prefilter, feature_workers=feature_workers,
+        )
+        for field, value in store.last_update.items():
+            stats[field] = stats.get(field, 0) + value
+
+    logger.info(f"  Хранилище признаков: {store_dir}")
+    logger.info(
+        f"  - Прочитано строк: {stats['rows']}, новых: {stats['new_rows']}, "
+        f"уже известных: {stats['duplicates']}"
+    )
+    logger.info(f"  - Добавлено образцов: {stats['added']}, сегментов: {store.n_segments}")
+
+    data = store.load()
+    if data is None:
+        raise ValueError("Хранилище признаков пусто: в выгрузках нет IT-разработчиков")
+    data = processor.sample_data(data)
+    if data.n_samples < 10:
+        raise ValueError(f"Недостаточно данных в хранилище: {data.n_samples} образцов")
+    return data
+
+
+def _report_experience_prefix(
+    csv_paths: list[str], max_chars: int, chunk_size: Optional[int],
+) -> None:
+    """Сравнивает разбор префикса опыта с полным текстом и сохраняет отчёт."""
+    report = validate_experience_prefix(csv_paths, max_chars, chunksize=chunk_size)
+
+    report_path = METRICS_DIR / "experience_prefix_report.json"
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    logger.info(f"  Проверка префикса опыта ({max_chars} символов):")
+    logger.info(
+        f"  - Совпадений: {report['n_agree']} из {report['n_texts']} "
+        f"({report['agreement_rate']:.2%}), изменено: {report['n_changed']}, "
+        f"потеряно: {report['n_lost']}"
+    )
+    logger.info(f"  - Доля разбираемого текста: {report['scanned_share']:.2%}")
+    logger.info(f"  - Отчёт сохранён: {report_path}")
+
+
+def _log_shard_reports(shard_reports: list[dict]) -> None:
+    """Выводит статистику обработки по шардам."""
+    logger.info("  Статистика по шардам:")
+    for report in shard_reports:
+        logger.info(
+            f"  - {report['path']}: строк {report['rows']}, "
+            f"разработчиков {report['developers']}, образцов {report['samples']}, "
+            f"{report['seconds']:.2f} с"
+        )
+
+
+def _log_near_duplicates(processor: ResumeDataProcessor, feature_store: Optional[str]) -> None:
+    """Выводит количество удалённых близких дубликатов и время фильтра."""
+    if feature_store:
+        dedup = processor.near_duplicates
+        removed, checked, seconds = dedup.n_removed, dedup.n_seen, dedup.seconds
+    else:
+        reports = processor.shard_reports
+        removed = sum(report["near_duplicates"] for report in reports)
+        checked = removed + sum(report["developers"] for report in reports)
+        seconds = sum(report["dedup_seconds"] for report in reports)
+
+    logger.info(f"  - Удалено близких дубликатов: {removed} из {checked} ({seconds:.2f} с)")
+
+
+def _log_data_shape(data) -> None:
+    """Выводит размеры загруженных данных."""
+    logger.info(f"  - Количество образцов: {data.n_samples}")
+    logger.info(f"  - Количество признаков: {data.n_features}")
+    if data.text_features is not None:
+        logger.info(
+            f"  - Текстовый блок: {data.n_text_features} колонок, "
+            f"{data.text_features.nnz} ненулевых значений"
+        )
+    logger.info("")
@@ -1,20 +1,39 @@
 """Разведочный анализ данных."""
 
+import json
 import logging
+from typing import Optional
 
-from hw6_classifier.config import PLOTS_DIR
-from hw6_classifier.analytics import plot_class_distribution, analyze_class_balance
+from hw6_classifier.config import METRICS_DIR, PLOTS_DIR
+from hw6_classifier.analytics import plot_class_counts, analyze_class_counts
+from hw6_classifier.processors import IngestStatistics
 
 
 logger = logging.getLogger(__name__)
 
 
-def perform_eda(data):
-    """Выполняет разведочный анализ данных и визуализацию."""
+def perform_eda(data, ingest_stats: Optional[IngestStatistics] = None):
+    """
+    Выполняет разведочный анализ данных и визуализацию.
+
+    Если передана статистика, собранная при загрузке, распределение классов
+    берётся из неё, а полный отчёт (пропуски, доли прошедших фильтры строк,
+    квантили признаков, частоты навыков) сохраняется в metrics/. Иначе
+    (например, данные загружены из кэша) используются истинные размеры
+    классов выборки (data.population_counts) или метки data.y.
+    """
     logger.info("Этап 2: Разведочный анализ данных (EDA)")
     logger.info("-" * 80)
 
-    balance_info = analyze_class_balance(data.y, data.class_names)
+    if ingest_stats is not None and ingest_stats.samples:
+        counts = ingest_stats.class_counts
+        _report_ingest_stats(ingest_stats, data.feature_names[data.X.shape[1]:])
+    elif data.population_counts is not None:
+        counts = data.population_counts
+    else:
+        counts = [int((data.y == label).sum()) for label in range(len(data.class_names))]
+
+    balance_info = analyze_class_counts(counts, data.class_names)
 
     logger.info("Распределение классов:")
     for class_name, count in balance_info["counts"].items():
@@ -27,5 +46,33 @@ def perform_eda(data):
     logger.info("")
 
     plot_path = PLOTS_DIR / "class_distribution.png"
-    plot_class_distribution(data.y, data.class_names, save_path=plot_path)
+    plot_class_counts(counts, data.class_names, save_path=plot_path)
     logger.info("")
+
+
+def _report_ingest_stats(ingest_stats: IngestStatistics, skill_names: list[str]) -> None:
+    """Выводит основные показатели статистики загрузки и сохраняет отчёт."""
+    report = ingest_stats.to_dict(skill_names)
+
+    report_path = METRICS_DIR / "ingest_stats.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    filters = report["filters"]
+    logger.info("Статистика загрузки:")
+    logger.info(
+        f"  - Строк: {filters['rows']}, IT-разработчиков: {filters['developers']} "
+        f"({filters['developer_rate']:.1%}), образцов: {filters['samples']} "
+        f"({filters['sample_rate']:.1%} разработчиков)"
+    )
+    if filters["prefiltered"]:
+        logger.info(
+            f"  - Предварительный отбор по должности: прочитано {filters['read_rows']} строк, "
+            f"доли пропусков колонок, кроме должности, — среди них"
+        )
+    for name, feature in report["features"].items():
+        if feature["count"]:
+            median = feature["quantiles"]["0.5"]
+            logger.info(f"  - {name}: медиана {median:.1f}, заполнено {feature['count']}")
+    logger.info(f"  - Отчёт сохранён: {report_path}")
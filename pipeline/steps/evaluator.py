@@ -10,13 +10,13 @@ from hw6_classifier.analytics import evaluate_classifier, generate_conclusion
 logger = logging.getLogger(__name__)
 
 
-def evaluate_single_model(model_name: str, model, x_test, y_test, class_names):
+def evaluate_single_model(model_name: str, model, test_data):
     """Оценивает одну модель и сохраняет метрики."""
     logger.info(f"Оценка модели: {model_name}")
     logger.info("-" * 80)
 
-    y_pred = model.predict(x_test)
-    metrics = evaluate_classifier(y_test, y_pred, class_names)
+    y_pred = model.predict(test_data.matrix(sparse=model.supports_sparse))
+    metrics = evaluate_classifier(test_data.y, y_pred, test_data.class_names)
 
     logger.info("Метрики качества:")
     logger.info(f"  Accuracy:        {metrics.accuracy:.4f}")
@@ -45,7 +45,7 @@ def evaluate_single_model(model_name: str, model, x_test, y_test, class_names):
     return metrics_dict
 
 
-def evaluate_models(trained_models: dict, x_test, y_test, class_names):
+def evaluate_models(trained_models: dict, test_data):
     """Оценивает все обученные модели."""
     logger.info("Этап 5: Оценка качества моделей")
     logger.info("=" * 80)
@@ -54,7 +54,7 @@ def evaluate_models(trained_models: dict, x_test, y_test, class_names):
     all_metrics = {}
 
     for model_name, model in trained_models.items():
-        metrics_dict = evaluate_single_model(model_name, model, x_test, y_test, class_names)
+        metrics_dict = evaluate_single_model(model_name, model, test_data)
         all_metrics[model_name] = metrics_dict
 
     return all_metrics
@@ -2,6 +2,7 @@
 
 import logging
 
+import numpy as np
 from sklearn.model_selection import train_test_split
 
 
@@ -9,17 +10,27 @@ logger = logging.getLogger(__name__)
 
 
 def split_dataset(data, test_size: float, random_seed: int):
-    """Разделяет данные на тренировочную и тестовую выборки."""
+    """
+    Разделяет данные на тренировочную и тестовую выборки.
+
+    Разделяются индексы строк, поэтому упакованные признаки остаются
+    упакованными, а матрицы для моделей собираются при обучении и оценке.
+
+    Вернет:
+        Кортеж (train_data, test_data) из объектов ProcessedData.
+    """
     logger.info("Этап 3: Разделение на тренировочную и тестовую выборки")
     logger.info("-" * 80)
 
-    x_train, x_test, y_train, y_test = train_test_split(
-        data.X, data.y, test_size=test_size, random_state=random_seed, stratify=data.y,
+    train_idx, test_idx = train_test_split(
+        np.arange(data.n_samples), test_size=test_size, random_state=random_seed, stratify=data.y,
     )
+    train_data = data.subset(train_idx)
+    test_data = data.subset(test_idx)
 
     logger.info("✓ Данные разделены")
-    logger.info(f"  - Тренировочная выборка: {x_train.shape[0]} образцов")
-    logger.info(f"  - Тестовая выборка: {x_test.shape[0]} образцов")
+    logger.info(f"  - Тренировочная выборка: {train_data.n_samples} образцов")
+    logger.info(f"  - Тестовая выборка: {test_data.n_samples} образцов")
     logger.info("")
 
-    return x_train, x_test, y_train, y_test
+    return train_data, test_data
@@ -1,32 +1,54 @@
 """Обучение моделей классификации."""
 
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional
 
 import joblib
 
 from hw6_classifier.config import MODELS_DIR
 from hw6_classifier.core import registry
-from pipeline.steps.tuner import tune_hyperparameters
+from pipeline.compute_budget import ComputeBudget
+from pipeline.steps.tuner import build_classifier, tune_models
 
 
 logger = logging.getLogger(__name__)
 
 
-def train_single_model(model_name: str, x_train, y_train, args):
-    """Обучает одну модель классификации."""
+def train_single_model(
+    model_name: str,
+    train_data,
+    args,
+    params: Optional[dict] = None,
+    n_jobs: Optional[int] = None,
+):
+    """
+    Обучает одну модель классификации.
+
+    Аргументы:
+        params: Подобранные параметры эстиматора (см. tune_models);
+            если не заданы, используются параметры по умолчанию.
+        n_jobs: Доля бюджета ядер для модели (по умолчанию весь args.n_jobs);
+            ограничивает потоки эстиматора и нативных пулов.
+    """
     logger.info(f"Обучение модели: {model_name}")
     logger.info("-" * 40)
 
     try:
         classifier_class = registry.get(model_name)
+        if train_data.text_features is not None and not classifier_class.supports_sparse:
+            logger.info("  Модель не принимает разреженный вход: текстовый блок не используется")
+        x_train = train_data.matrix(sparse=classifier_class.supports_sparse)
+        y_train = train_data.y
 
-        if args.tune:
-            model = tune_hyperparameters(classifier_class, model_name, x_train, y_train, args)
-        else:
-            model = classifier_class(random_seed=args.random_seed)
+        budget = ComputeBudget.from_args(args)
+        n_jobs = n_jobs or budget.n_jobs
 
-        model.fit(x_train, y_train)
+        model = build_classifier(classifier_class, params or {}, args, n_jobs)
+
+        with budget.limit(n_jobs):
+            model.fit(x_train, y_train)
 
         logger.info("  ✓ Модель обучена успешно")
         logger.info("")
@@ -44,20 +66,113 @@ def train_single_model(model_name: str, x_train, y_train, args):
         return None
 
 
-def train_models(model_names: list, x_train, y_train, args):
-    """Обучает все указанные модели."""
+def train_models(model_names: list, train_data, args):
+    """
+    Обучает все указанные модели.
+
+    При args.tune гиперпараметры всех моделей подбираются заранее
+    в общей очереди задач (tune_models).
+
+    При args.train_workers > 1 независимые модели обучаются параллельно
+    в пуле процессов; каждая сохраняется в своём процессе сразу после
+    обучения. Журнал модели буферизуется и выводится целиком по её
+    завершении, поэтому сообщения разных моделей не перемешиваются.
+    Ошибка одной модели не прерывает обучение остальных.
+
+    Бюджет ядер args.n_jobs делится между процессами обучения и потоками
+    эстиматора внутри каждого процесса.
+    """
     logger.info("Этап 4: Обучение моделей классификации")
     logger.info("-" * 80)
     logger.info(f"Модели для обучения: {', '.join(model_names)}")
     tuning_status = "Включен" if args.tune else "Выключен"
     logger.info(f"Подбор гиперпараметров: {tuning_status}")
-    logger.info("")
-
-    trained_models = {}
 
-    for model_name in model_names:
-        model = train_single_model(model_name, x_train, y_train, args)
-        if model is not None:
-            trained_models[model_name] = model
+    budget = ComputeBudget.from_args(args)
+    n_workers, n_jobs = budget.split(len(model_names), args.train_workers)
+    if n_workers > 1:
+        logger.info(f"Параллельное обучение: {n_workers} процессов × {n_jobs} потоков")
+    logger.info("")
 
-    return trained_models
+    best_params = tune_models(model_names, train_data, args) if args.tune else {}
+
+    if n_workers > 1:
+        models = _train_parallel(model_names, train_data, args, n_workers, n_jobs, best_params)
+    else:
+        models = {
+            model_name: train_single_model(model_name, train_data, args, best_params.get(model_name))
+            for model_name in model_names
+        }
+
+    return {
+        model_name: models[model_name]
+        for model_name in model_names
+        if models.get(model_name) is not None
+    }
+
+
+def _train_parallel(
+    model_names: list, train_data, args, n_workers: int, n_jobs: int, best_params: dict,
+) -> dict:
+    """Обучает модели в пуле процессов и выводит их журналы по мере завершения."""
+    models = {}
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {
+            executor.submit(
+                _train_with_buffered_log,
+                model_name, train_data, args, best_params.get(model_name), n_jobs,
+            ): model_name
+            for model_name in model_names
+        }
+        for future in as_completed(futures):
+            model_name = futures[future]
+            try:
+                models[model_name], records = future.result()
+            except Exception as e:
+                logger.error(f"  ✗ Процесс обучения модели {model_name} завершился с ошибкой: {e}")
+                logger.info("")
+                continue
+
+            for record in records:
+                logging.getLogger(record.name).handle(record)
+
+    return models
+
+
+class _BufferHandler(logging.Handler):
+    """Накапливает записи журнала для передачи в родительский процесс."""
+
+    def __init__(self) -> None:
+        """Инициализирует пустой буфер."""
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Сохраняет запись в буфер."""
+        # Сообщение форматируется заранее: аргументы записи могут не сериализоваться
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+def _train_with_buffered_log(
+    model_name: str, train_data, args, params: Optional[dict], n_jobs: int,
+):
+    """
+    Обучает модель в процессе пула, перехватывая её журнал.
+
+    Вернет:
+        Кортеж (модель или None, записи журнала).
+    """
+    root = logging.getLogger()
+    buffer = _BufferHandler()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    root.handlers = [buffer]
+    root.setLevel(logging.INFO)
+    try:
+        model = train_single_model(model_name, train_data, args, params, n_jobs)
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+    return model, buffer.records
@@ -1,36 +1,340 @@
 """Подбор гиперпараметров моделей."""
 
 import logging
+import math
+import time
 
-from sklearn.model_selection import GridSearchCV
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import HalvingGridSearchCV, ParameterGrid, check_cv
 
-from pipeline.param_grids import get_param_grid
+from hw6_classifier.core import registry
+from pipeline.compute_budget import ComputeBudget
+from pipeline.param_grids import get_param_grid, get_param_space
+from pipeline.tpe import TPESampler
 
 
 logger = logging.getLogger(__name__)
 
+SCORING = "f1_macro"
 
-def tune_hyperparameters(classifier_class, model_name: str, x_train, y_train, args):
-    """Выполняет подбор гиперпараметров модели."""
-    logger.info("  Выполняется подбор гиперпараметров...")
+# Имена параметров эстиматора, отличающиеся от аргументов классификатора
+CLASSIFIER_PARAM_NAMES = {"C": "c_param"}
 
-    param_grid = get_param_grid(model_name)
+# Относительное время обучения модели с параметрами по умолчанию
+# (замер на ~10 тыс. образцов); используется только для порядка задач
+TASK_COST_WEIGHTS = {
+    "logistic": 2.5,
+    "svm": 0.1,
+    "random_forest": 0.003,
+    "gradient_boosting": 0.02,
+}
+UNBOUNDED_DEPTH = 16
+
+
+def build_classifier(classifier_class, params: dict, args, n_jobs: int = -1):
+    """Создает классификатор с параметрами эстиматора, найденными при подборе."""
+    kwargs = {CLASSIFIER_PARAM_NAMES.get(name, name): value for name, value in params.items()}
+    return classifier_class(random_seed=args.random_seed, n_jobs=n_jobs, **kwargs)
+
+
+def tune_hyperparameters(model_name: str, train_data, args):
+    """
+    Подбирает гиперпараметры одной модели и создает классификатор с ними.
+
+    Обертка над tune_models для одной модели: пайплайн подбирает
+    параметры всех моделей сразу, а эта функция нужна при использовании
+    пакета как библиотеки.
+
+    Вернет:
+        Необученный классификатор с лучшими параметрами (параметры
+        по умолчанию, если сетки или пространства нет).
+
+    Исключения:
+        KeyError: Если модель не зарегистрирована.
+    """
+    classifier_class = registry.get(model_name)
+    best_params = tune_models([model_name], train_data, args)
+    budget = ComputeBudget.from_args(args)
+    return build_classifier(classifier_class, best_params.get(model_name, {}), args, budget.n_jobs)
+
+
+def tune_models(model_names: list, train_data, args) -> dict:
+    """
+    Подбирает гиперпараметры всех моделей в одной очереди задач.
+
+    Сетка каждой модели из PARAM_GRIDS раскрывается в задачи
+    (модель × параметры × фолд), которые выполняются в общем пуле
+    процессов: ядра не простаивают на границах моделей и в ожидании
+    самого медленного кандидата сетки. Задачи запускаются в порядке
+    убывания ожидаемой длительности (LPT). Фолды и выбор лучших параметров
+    совпадают с GridSearchCV(cv=args.cv_folds, scoring="f1_macro").
+    Бюджет args.n_jobs делится между процессами пула и потоками
+    эстиматора внутри процесса.
+
+    Другие стратегии (args.search) выполняются для моделей по очереди.
+
+    Вернет:
+        Словарь {модель: лучшие параметры эстиматора}; модели без сетки
+        получают пустой словарь, неизвестные модели пропускаются.
+    """
+    if args.search != "grid":
+        return _tune_each(model_names, train_data, args)
 
-    if param_grid:
-        base_model = classifier_class(random_seed=args.random_seed)
-        base_estimator = base_model._create_estimator()
+    logger.info("Подбор гиперпараметров (общая очередь задач)")
+    logger.info("-" * 40)
 
-        grid_search = GridSearchCV(
-            base_estimator, param_grid, cv=args.cv_folds,
-            scoring="f1_macro", n_jobs=-1, verbose=0,
+    budget = ComputeBudget.from_args(args)
+    candidates_by_model = {}
+    for model_name in model_names:
+        if not registry.is_registered(model_name):
+            continue
+
+        param_grid = get_param_grid(model_name)
+        candidates_by_model[model_name] = list(ParameterGrid(param_grid)) if param_grid else []
+        if not param_grid:
+            logger.info(f"  ! {model_name}: нет предопределенной сетки параметров, используются defaults")
+
+    y = np.asarray(train_data.y)
+    cv = check_cv(args.cv_folds, y, classifier=True)
+    folds = list(cv.split(np.zeros((len(y), 1)), y))
+    outer, inner = budget.split(
+        sum(len(candidates) for candidates in candidates_by_model.values()) * len(folds)
+    )
+
+    matrices = {}
+    grids = {}
+    for model_name, candidates in candidates_by_model.items():
+        classifier_class = registry.get(model_name)
+        sparse = classifier_class.supports_sparse
+        if sparse not in matrices:
+            matrices[sparse] = train_data.matrix(sparse=sparse)
+        estimator = classifier_class(random_seed=args.random_seed, n_jobs=inner)._create_estimator()
+        grids[model_name] = (estimator, candidates, sparse)
+
+    tasks = [
+        (model_name, candidate_idx, fold_idx, params)
+        for model_name, (_, candidates, _) in grids.items()
+        for candidate_idx, params in enumerate(candidates)
+        for fold_idx in range(len(folds))
+    ]
+    tasks.sort(key=lambda task: -_expected_cost(task[0], task[3]))
+
+    started = time.perf_counter()
+    with budget.limit(inner), budget.worker_config(inner):
+        results = Parallel(n_jobs=outer, batch_size=1, pre_dispatch="all")(
+            delayed(_fit_and_score)(
+                grids[model_name][0], params, matrices[grids[model_name][2]], y, *folds[fold_idx],
+            )
+            for model_name, _, fold_idx, params in tasks
         )
+    elapsed = time.perf_counter() - started
+
+    scores = {
+        model_name: np.full((len(candidates), len(folds)), np.nan)
+        for model_name, (_, candidates, _) in grids.items()
+    }
+    work = 0.0
+    for (model_name, candidate_idx, fold_idx, _), (score, seconds) in zip(tasks, results):
+        scores[model_name][candidate_idx, fold_idx] = score
+        work += seconds
+
+    best_params = {}
+    for model_name, (_, candidates, _) in grids.items():
+        if not candidates:
+            best_params[model_name] = {}
+            continue
+
+        means = scores[model_name].mean(axis=1)
+        n_failed = int(np.isnan(scores[model_name]).sum())
+        if np.isnan(means).all():
+            logger.error(f"  ✗ {model_name}: все задачи подбора завершились с ошибкой, используются defaults")
+            best_params[model_name] = {}
+            continue
+
+        best = int(np.argmax(np.where(np.isnan(means), -np.inf, means)))
+        best_params[model_name] = candidates[best]
+        logger.info(f"  ✓ {model_name}: лучшие параметры {candidates[best]}, F1 (CV) {means[best]:.4f}")
+        if n_failed:
+            logger.info(f"    ! Задач с ошибкой: {n_failed}")
+
+    if tasks:
+        logger.info(
+            f"  - Задач: {len(tasks)}, процессов: {outer} × потоков: {inner}, время: {elapsed:.1f} с, "
+            f"суммарная работа: {work:.1f} с (загрузка {work / (elapsed * outer):.0%})"
+        )
+    logger.info("")
+
+    return best_params
+
 
-        grid_search.fit(x_train, y_train)
+def _tune_each(model_names: list, train_data, args) -> dict:
+    """Подбирает гиперпараметры моделей по очереди стратегией args.search."""
+    logger.info(f"Подбор гиперпараметров ({SEARCH_TITLES[args.search]})")
+    logger.info("-" * 40)
 
-        logger.info(f"  ✓ Лучшие параметры: {grid_search.best_params_}")
-        logger.info(f"  ✓ Лучший F1 (CV): {grid_search.best_score_:.4f}")
+    matrices = {}
+    best_params = {}
+    for model_name in model_names:
+        if not registry.is_registered(model_name):
+            continue
+        classifier_class = registry.get(model_name)
+        sparse = classifier_class.supports_sparse
+        if sparse not in matrices:
+            matrices[sparse] = train_data.matrix(sparse=sparse)
 
-        return classifier_class(random_seed=args.random_seed, **grid_search.best_params_)
-    else:
+        logger.info(f"  {model_name}:")
+        best_params[model_name] = SEARCH_STRATEGIES[args.search](
+            classifier_class, model_name, matrices[sparse], train_data.y, args,
+        )
+    logger.info("")
+
+    return best_params
+
+
+def _halving_search(classifier_class, model_name: str, x_train, y_train, args) -> dict:
+    """
+    Перебирает сетку PARAM_GRIDS последовательным делением пополам.
+
+    Все кандидаты оцениваются на небольшой случайной части обучающих
+    строк; в каждый следующий раунд проходит лучшая 1/args.halving_factor
+    доля кандидатов с args.halving_factor раз большим числом строк,
+    и только финалисты обучаются на всех строках. Ресурс — число строк,
+    а не n_estimators: n_estimators входит в сетки ансамблей.
+
+    Вернет:
+        Лучшие параметры эстиматора (пустой словарь, если сетки нет).
+    """
+    param_grid = get_param_grid(model_name)
+    if not param_grid:
         logger.info("  ! Нет предопределенной сетки параметров, используются defaults")
-        return classifier_class(random_seed=args.random_seed)
+        return {}
+
+    budget = ComputeBudget.from_args(args)
+    n_candidates = len(ParameterGrid(param_grid))
+    outer, inner = budget.split(n_candidates * args.cv_folds)
+    search = HalvingGridSearchCV(
+        classifier_class(random_seed=args.random_seed, n_jobs=inner)._create_estimator(),
+        param_grid,
+        factor=args.halving_factor,
+        resource="n_samples",
+        cv=args.cv_folds,
+        scoring=SCORING,
+        refit=False,
+        random_state=args.random_seed,
+        n_jobs=outer,
+        verbose=0,
+    )
+    with budget.limit(inner), budget.worker_config(inner):
+        search.fit(x_train, y_train)
+
+    # Объём вычислений — сумма строк по всем обучениям; полный перебор
+    # обучает каждого кандидата на всех строках
+    used = int(np.sum(search.cv_results_["n_resources"]))
+    full = n_candidates * search.max_resources_
+    n_fits = len(search.cv_results_["params"]) * args.cv_folds
+
+    logger.info(f"  ✓ Лучшие параметры: {search.best_params_}")
+    logger.info(f"  ✓ Лучший F1 (CV): {search.best_score_:.4f}")
+    logger.info(
+        f"  - Раундов: {search.n_iterations_}, кандидатов: "
+        f"{' → '.join(map(str, search.n_candidates_))}, строк: "
+        f"{' → '.join(map(str, search.n_resources_))}"
+    )
+    # Обучений может быть больше, чем при полном переборе (все раунды),
+    # поэтому экономия оценивается только по объёму данных
+    savings = f"экономия {1 - used / full:.0%}" if used < full else "без экономии"
+    logger.info(
+        f"  - Обучений: {n_fits} (полный перебор: {n_candidates * args.cv_folds}), "
+        f"объём данных {used / full:.0%} от полного перебора ({savings})"
+    )
+    return search.best_params_
+
+
+def _bayes_search(classifier_class, model_name: str, x_train, y_train, args) -> dict:
+    """
+    Подбирает параметры в пространстве PARAM_SPACES методом TPE.
+
+    Выполняется args.n_trials попыток; каждая — кросс-валидация
+    одного набора параметров, фолды обучаются параллельно. Повторно
+    предложенные наборы (после округления целых параметров) не обучаются.
+
+    Вернет:
+        Лучшие параметры эстиматора (пустой словарь, если пространства нет
+        или все попытки завершились с ошибкой).
+    """
+    space = get_param_space(model_name)
+    if not space:
+        logger.info("  ! Нет пространства параметров, используются defaults")
+        return {}
+
+    budget = ComputeBudget.from_args(args)
+    outer, inner = budget.split(args.cv_folds)
+    estimator = classifier_class(random_seed=args.random_seed, n_jobs=inner)._create_estimator()
+    y = np.asarray(y_train)
+    folds = list(check_cv(args.cv_folds, y, classifier=True).split(np.zeros((len(y), 1)), y))
+
+    sampler = TPESampler(space, seed=args.random_seed)
+    scores: dict[tuple, float] = {}
+    with budget.limit(inner), budget.worker_config(inner), Parallel(n_jobs=outer) as parallel:
+        for _ in range(args.n_trials):
+            params = sampler.suggest()
+            key = tuple(sorted(params.items()))
+            if key not in scores:
+                results = parallel(
+                    delayed(_fit_and_score)(estimator, params, x_train, y, *fold) for fold in folds
+                )
+                scores[key] = float(np.mean([score for score, _ in results]))
+            sampler.observe(params, scores[key])
+
+    finite = {key: score for key, score in scores.items() if not np.isnan(score)}
+    if not finite:
+        logger.error("  ✗ Все попытки подбора завершились с ошибкой, используются defaults")
+        return {}
+
+    best_key = max(finite, key=finite.get)
+    n_grid = len(ParameterGrid(get_param_grid(model_name))) if get_param_grid(model_name) else 0
+    logger.info(f"  ✓ Лучшие параметры: {dict(best_key)}")
+    logger.info(f"  ✓ Лучший F1 (CV): {finite[best_key]:.4f}")
+    logger.info(
+        f"  - Попыток: {args.n_trials}, обучений: {len(scores) * len(folds)}"
+        + (f" (сетка PARAM_GRIDS: {n_grid * len(folds)})" if n_grid else "")
+    )
+    return dict(best_key)
+
+
+SEARCH_STRATEGIES = {"halving": _halving_search, "bayes": _bayes_search}
+SEARCH_TITLES = {
+    "halving": "последовательное деление пополам",
+    "bayes": "модельный подбор TPE",
+}
+
+
+def _expected_cost(model_name: str, params: dict) -> float:
+    """Грубая оценка относительной длительности обучения кандидата."""
+    cost = TASK_COST_WEIGHTS.get(model_name, 1.0)
+    cost *= params.get("n_estimators", 1)
+    cost *= params.get("max_iter", 1000) / 1000
+    if "max_depth" in params:
+        cost *= math.sqrt(params["max_depth"] or UNBOUNDED_DEPTH)
+    return cost
+
+
+def _fit_and_score(estimator, params: dict, x, y, train_idx, test_idx) -> tuple[float, float]:
+    """
+    Обучает кандидата на обучающей части фолда и оценивает на проверочной.
+
+    Вернет:
+        Кортеж (F1 macro или NaN при ошибке обучения, время в секундах).
+    """
+    started = time.perf_counter()
+    try:
+        model = clone(estimator).set_params(**params)
+        model.fit(x[train_idx], y[train_idx])
+        score = get_scorer(SCORING)(model, x[test_idx], y[test_idx])
+    except Exception:
+        score = np.nan
+    return float(score), time.perf_counter() - started
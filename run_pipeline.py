@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from hw6_classifier.config import MODELS_DIR, METRICS_DIR, PLOTS_DIR
 from hw6_classifier.models import gradient_boosting, logistic, random_forest, svm
+from hw6_classifier.processors import IngestStatistics
 from cli import parse_arguments
 from pipeline import (
     load_and_process_data,
@@ -44,17 +45,37 @@ def main() -> None:
     logger.info("=" * 80)
     logger.info("")
 
-    data = load_and_process_data(args.csv)
+    ingest_stats = IngestStatistics()
+    data = load_and_process_data(
+        args.csv,
+        chunk_size=args.chunk_size,
+        prefilter=args.prefilter,
+        feature_workers=args.feature_workers,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache,
+        use_parse_memo=args.parse_memo,
+        feature_store=args.feature_store,
+        rebuild_feature_store=args.rebuild_feature_store,
+        experience_prefix=args.experience_prefix,
+        prefix_on_read=args.experience_prefix_on_read,
+        validate_prefix=args.validate_experience_prefix,
+        dedup_threshold=args.dedup_threshold if args.dedup else None,
+        ingest_stats=ingest_stats,
+        max_rows=args.max_train_rows,
+        class_caps=dict(args.class_caps) if args.class_caps else None,
+        sample_seed=args.random_seed,
+        text_hash_bits=args.text_features,
+    )
     if data is None:
         return
 
-    perform_eda(data)
+    perform_eda(data, ingest_stats)
 
-    x_train, x_test, y_train, y_test = split_dataset(data, args.test_size, args.random_seed)
+    train_data, test_data = split_dataset(data, args.test_size, args.random_seed)
 
-    trained_models = train_models(args.models, x_train, y_train, args)
+    trained_models = train_models(args.models, train_data, args)
 
-    all_metrics = evaluate_models(trained_models, x_test, y_test, data.class_names)
+    all_metrics = evaluate_models(trained_models, test_data)
 
     print_summary(trained_models, all_metrics)
 
@@ -0,0 +1,67 @@
+"""Память парсинга при последовательной и параллельной обработке."""
+
+import numpy as np
+import pandas as pd
+
+from hw6_classifier.config import CSV_COLUMNS
+from hw6_classifier.processors import ParseMemo, ResumeDataProcessor
+
+POSITIONS = ["Python разработчик", "Java developer", "Frontend разработчик React", "Менеджер по продажам"]
+CITIES = ["Москва", "Санкт-Петербург", "Казань", "Тверь"]
+EDUCATIONS = ["Высшее образование", "Среднее специальное образование", "Неоконченное высшее"]
+
+
+def _write_csv(path, n_rows: int = 400) -> None:
+    """Записывает синтетическую выгрузку с повторяющимися значениями колонок."""
+    rng = np.random.default_rng(0)
+    rows = []
+    for _ in range(n_rows):
+        years, months = rng.integers(0, 12), rng.integers(1, 12)
+        rows.append({
+            CSV_COLUMNS["salary"]: f"{rng.integers(5, 40) * 10} 000 руб.",
+            CSV_COLUMNS["demographics"]: f"{rng.choice(['Мужчина', 'Женщина'])} ,  {rng.integers(20, 50)} лет",
+            CSV_COLUMNS["position"]: rng.choice(POSITIONS),
+            CSV_COLUMNS["city"]: rng.choice(CITIES),
+            CSV_COLUMNS["experience"]: f"Опыт работы {years} лет {months} месяцев",
+            CSV_COLUMNS["education"]: rng.choice(EDUCATIONS),
+        })
+    pd.DataFrame(rows).to_csv(path)
+
+
+def _process(csv_path, memo_path, **kwargs) -> tuple[ParseMemo, np.ndarray]:
+    memo = ParseMemo(memo_path)
+    data = ResumeDataProcessor(parse_memo=memo).process_csv(str(csv_path), **kwargs)
+    return memo, data.matrix()
+
+
+def _entries(memo: ParseMemo) -> dict:
+    return {name: sorted(map(repr, entries.items())) for name, entries in memo._entries.items()}
+
+
+def test_parallel_workers_fill_parse_memo(tmp_path):
+    csv_path = tmp_path / "resumes.csv"
+    _write_csv(csv_path)
+
+    serial, serial_x = _process(csv_path, tmp_path / "serial.pkl", chunksize=50)
+    parallel, parallel_x = _process(csv_path, tmp_path / "parallel.pkl", chunksize=50, feature_workers=2)
+
+    assert serial.n_entries > 0
+    assert _entries(parallel) == _entries(serial)
+    assert parallel.hits + parallel.misses == serial.hits + serial.misses
+    assert parallel.hits > 0
+    np.testing.assert_array_equal(parallel_x, serial_x)
+
+
+def test_parallel_run_reuses_saved_memo(tmp_path):
+    csv_path = tmp_path / "resumes.csv"
+    _write_csv(csv_path)
+
+    first, _ = _process(csv_path, tmp_path / "memo.pkl", feature_workers=2)
+    assert first.n_entries > 0
+    first.save()
+    second = ParseMemo.load(tmp_path / "memo.pkl", version=first.version)
+    ResumeDataProcessor(parse_memo=second).process_csv(str(csv_path), feature_workers=2)
+
+    assert second.misses == 0
+    assert second.hits == first.hits + first.misses
+    assert second.n_entries == first.n_entries